@@ -5,9 +5,14 @@ import decision_games_with_ai.user_interfaces.tui.tic_tac_toe_console_interface
 import decision_games_with_ai.user_interfaces.tpai.tic_tac_toe_console_arena_interface
 import decision_games_with_ai.user_interfaces.tpai.checkers_console_arena_interface
 import decision_games_with_ai.user_interfaces.tui.checkers_console_interface
+from decision_games_with_ai.games.checkers.game_implementation.checkers_move import \
+    CheckersMove
+from decision_games_with_ai.games.checkers.game_implementation.endgame_database import \
+    EndgameDatabase
 from decision_games_with_ai.games.checkers.tree_builder import CheckersTreeBuilder
 from decision_games_with_ai.games.tic_tac_toe.tree_builder import TicTacToeTreeBuilder
 from decision_games_with_ai.games.utils.global_enums import SearchMethods
+from decision_games_with_ai.games.utils.move_ordering import MoveOrderer
 from decision_games_with_ai.players.human_player.console_interface_player import \
     ConsoleInterfacePlayer
 
@@ -23,11 +28,61 @@ class GameController:
     """Class that creates proper object instances and controls flow of the
      program by changing proper variable references"""
 
-    def __init__(self):
+    def __init__(self, tic_tac_toe_board_size=3, tic_tac_toe_winning_combination=3,
+                 tic_tac_toe_candidate_moves_distance=2, checkers_endgame_database_path=None):
+        """
+        :param tic_tac_toe_board_size: Number of fields in the row and column
+        of the tic tac toe board
+        :param tic_tac_toe_winning_combination: Number of signs in a row
+        needed to win the tic tac toe game
+        :param tic_tac_toe_candidate_moves_distance: Maximal distance of the
+        moves searched by the computer from the signs on the board, used for
+        boards bigger than 3x3, None searches all empty fields
+        :param checkers_endgame_database_path: Path of the file generated by
+        EndgameDatabaseGenerator used by the checkers alpha beta players,
+        None for the search without the database
+        """
         self.control_interface = None
         self.player1 = None
         self.player2 = None
         self.game = None
+        self.tic_tac_toe_board_size = tic_tac_toe_board_size
+        self.tic_tac_toe_winning_combination = tic_tac_toe_winning_combination
+        self.tic_tac_toe_candidate_moves_distance = tic_tac_toe_candidate_moves_distance
+        self.checkers_endgame_database_path = checkers_endgame_database_path
+
+    def _create_tic_tac_toe_game(self):
+        """
+        :return: Tic tac toe game with the board size and winning combination
+        set in the controller
+        """
+        return decision_games_with_ai.games.tic_tac_toe.game.Game(
+            board_size=self.tic_tac_toe_board_size,
+            winning_combination=self.tic_tac_toe_winning_combination
+        )
+
+    def _create_tic_tac_toe_tree_builder(self):
+        """
+        :return: Tic tac toe tree builder of the actual game
+        """
+        candidate_moves_distance = None
+        if self.tic_tac_toe_board_size > 3:
+            candidate_moves_distance = self.tic_tac_toe_candidate_moves_distance
+        return TicTacToeTreeBuilder(self.game, use_symmetries=True, use_bitboard=True,
+                                    candidate_moves_distance=candidate_moves_distance)
+
+    def _create_checkers_alphabeta_tree_builder(self):
+        """
+        :return: Checkers tree builder of the actual game for the alpha beta
+        search
+        """
+        endgame_database = None
+        if self.checkers_endgame_database_path is not None:
+            endgame_database = EndgameDatabase(self.checkers_endgame_database_path)
+        return CheckersTreeBuilder(
+            self.game, use_bitboard=True, transposition_table_size_mb=16,
+            move_orderer=MoveOrderer(CheckersMove.get_captures_num), use_quiescence=True,
+            use_symmetries=True, endgame_database=endgame_database)
 
     def play_tic_tac_toe_two_console_players(self):
         """
@@ -36,7 +91,7 @@ class GameController:
         """
         self.player1 = ConsoleInterfacePlayer("Human 1")
         self.player2 = ConsoleInterfacePlayer("Human 2")
-        self.game = decision_games_with_ai.games.tic_tac_toe.game.Game()
+        self.game = self._create_tic_tac_toe_game()
         self.control_interface = decision_games_with_ai.user_interfaces.tui. \
             tic_tac_toe_console_interface.TicTacToeConsoleInterface(self.game)
         self.control_interface.play(self.player1, self.player2)
@@ -48,10 +103,10 @@ class GameController:
         """
         self.player1 = ConsoleInterfacePlayer("Human 1")
 
-        self.game = decision_games_with_ai.games.tic_tac_toe.game.Game()
+        self.game = self._create_tic_tac_toe_game()
         self.player2 = VirtualEnemy(
             name="Computer player mini max",
-            tree_builder=TicTacToeTreeBuilder(self.game),
+            tree_builder=self._create_tic_tac_toe_tree_builder(),
             search_algorithm=MinimaxSearchAlgorithms(),
             search_method_enum=SearchMethods.ALPHABETA,
             search_depth=4
@@ -82,7 +137,7 @@ class GameController:
         self.game = decision_games_with_ai.games.checkers.game.Game()
         self.player2 = VirtualEnemy(
             name="Computer player minimax",
-            tree_builder=CheckersTreeBuilder(self.game),
+            tree_builder=self._create_checkers_alphabeta_tree_builder(),
             search_algorithm=MinimaxSearchAlgorithms(),
             search_method_enum=SearchMethods.ALPHABETA,
             search_depth=4
@@ -98,10 +153,10 @@ class GameController:
         """
         self.player1 = ConsoleInterfacePlayer("Human player")
 
-        self.game = decision_games_with_ai.games.tic_tac_toe.game.Game()
+        self.game = self._create_tic_tac_toe_game()
         self.player2 = VirtualEnemy(
             name="Computer player monte carlo",
-            tree_builder=TicTacToeTreeBuilder(self.game),
+            tree_builder=self._create_tic_tac_toe_tree_builder(),
             search_algorithm=MonteCarloSearchAlghoritm(),
             search_method_enum=SearchMethods.MONTECARLO,
             num_of_sim=100
@@ -121,7 +176,7 @@ class GameController:
         self.game = decision_games_with_ai.games.checkers.game.Game()
         self.player2 = VirtualEnemy(
             name="Computer player monet carlo",
-            tree_builder=CheckersTreeBuilder(self.game),
+            tree_builder=CheckersTreeBuilder(self.game, use_bitboard=True),
             search_algorithm=MonteCarloSearchAlghoritm(),
             search_method_enum=SearchMethods.MONTECARLO,
             num_of_sim=100
@@ -136,11 +191,11 @@ class GameController:
         Initializes proper objects for arena play between virtual players
         :return:
         """
-        self.game = decision_games_with_ai.games.tic_tac_toe.game.Game()
+        self.game = self._create_tic_tac_toe_game()
 
         self.player1 = VirtualEnemy(
             name="Virtual player 1",
-            tree_builder=TicTacToeTreeBuilder(self.game),
+            tree_builder=self._create_tic_tac_toe_tree_builder(),
             search_algorithm=MinimaxSearchAlgorithms(),
             search_method_enum=SearchMethods.ALPHABETA,
             search_depth=3
@@ -148,7 +203,7 @@ class GameController:
 
         self.player2 = VirtualEnemy(
             name="Virtual player 2",
-            tree_builder=TicTacToeTreeBuilder(self.game),
+            tree_builder=self._create_tic_tac_toe_tree_builder(),
             search_algorithm=MinimaxSearchAlgorithms(),
             search_method_enum=SearchMethods.ALPHABETA,
             search_depth=3
@@ -156,7 +211,7 @@ class GameController:
 
         self.control_interface = decision_games_with_ai.user_interfaces.tpai. \
             tic_tac_toe_console_arena_interface.TicTacToeConsoleArenaInterface(
-                self.game, 1000, print_val_interval=10)
+                self.game, 1000, print_val_interval=10, workers=None)
         self.control_interface.play(self.player1, self.player2)
 
     def play_multiple_games_between_computers_checkers(self):
@@ -168,7 +223,7 @@ class GameController:
 
         self.player1 = VirtualEnemy(
             name="Virtual player 1",
-            tree_builder=CheckersTreeBuilder(self.game),
+            tree_builder=self._create_checkers_alphabeta_tree_builder(),
             search_algorithm=MinimaxSearchAlgorithms(),
             search_method_enum=SearchMethods.ALPHABETA,
             search_depth=3
@@ -176,7 +231,8 @@ class GameController:
 
         self.player2 = VirtualEnemy(
             name="Virtual player 2",
-            tree_builder=CheckersTreeBuilder(self.game),
+            tree_builder=CheckersTreeBuilder(self.game, use_bitboard=True,
+                                             max_tree_nodes=200000),
             search_algorithm=MonteCarloSearchAlghoritm(),
             search_method_enum=SearchMethods.MONTECARLO,
             num_of_sim=100
@@ -184,7 +240,7 @@ class GameController:
 
         self.control_interface = decision_games_with_ai.user_interfaces.tpai. \
             checkers_console_arena_interface.CheckersConsoleArenaInterface(
-                self.game, 1000, print_val_interval=1)
+                self.game, 1000, print_val_interval=1, workers=None)
         self.control_interface.play(self.player1, self.player2)
 
 
@@ -23,6 +23,8 @@ class Game(GameABC):
         self.game_board = None
         self.current_players_turn = None
         self.starting_player = starting_player
+        # Moves made since the start of the game in UCI format
+        self.moves_list = []
 
     def make_move(self, move_coords):
         """
@@ -36,6 +38,7 @@ class Game(GameABC):
                             "was initialized")
 
         self.game_board.make_move(self.current_players_turn, move_coords)
+        self.moves_list.append(move_coords)
 
         next_player_dict = {
             GameBoard.Players.PLAYER1: GameBoard.Players.PLAYER2,
@@ -72,6 +75,7 @@ class Game(GameABC):
 
     def start_game(self):
         self.game_board = GameBoard()
+        self.moves_list = []
         if self.starting_player == GameBoard.Players.UNKNOWN:
             self.current_players_turn = random.choice([
                 GameBoard.Players.PLAYER1, GameBoard.Players.PLAYER2])
@@ -0,0 +1,83 @@
+"""Module providing static evaluation of many checkers positions in one
+vectorised pass. Positions are encoded as int8 arrays of square codes, 1 for
+the checker and 2 for the king of the first player, negative codes for the
+pawns of the second player and 0 for the empty squares"""
+import numpy as np
+
+from decision_games_with_ai.games.checkers.game_implementation.bitboard import BitBoard
+from decision_games_with_ai.games.checkers.game_implementation.checkers_move import \
+    SQUARE_FIELDS, SQUARES_NUM
+from decision_games_with_ai.games.checkers.game_implementation.game_board import GameBoard
+
+CHECKER_CODE = 1
+KING_CODE = 2
+
+SIGNS_CODES = {
+    GameBoard.BoardSigns.PLAYER1_CHECKER.value: CHECKER_CODE,
+    GameBoard.BoardSigns.PLAYER1_KING.value: KING_CODE,
+    GameBoard.BoardSigns.PLAYER2_CHECKER.value: -CHECKER_CODE,
+    GameBoard.BoardSigns.PLAYER2_KING.value: -KING_CODE
+}
+
+SQUARES_X = np.array([x_ind for x_ind, y_ind in SQUARE_FIELDS])
+SQUARES_Y = np.array([y_ind for x_ind, y_ind in SQUARE_FIELDS])
+SQUARES_SHIFTS = np.arange(SQUARES_NUM, dtype=np.int64)
+
+
+class BatchEvaluator:
+    """Class evaluating batches of positions, with the default weights the
+    values are the same as given by CheckersTreeBuilder._static_evaluation_value"""
+
+    def __init__(self, checker_weight=1, king_weight=8, positional_weights=None):
+        """
+        :param checker_weight: Value of the checker
+        :param king_weight: Value of the king
+        :param positional_weights: Sequence of 32 values added for the pawn
+        standing on the square, given for the first player, the second player
+        gets them rotated by 180 degrees, None for no positional values
+        """
+        self.codes_values = np.array([-king_weight, -checker_weight, 0, checker_weight,
+                                      king_weight])
+        if positional_weights is None:
+            positional_weights = np.zeros(SQUARES_NUM, dtype=self.codes_values.dtype)
+        self.positional_weights = np.asarray(positional_weights)
+        if self.positional_weights.shape != (SQUARES_NUM,):
+            raise ValueError("Positional weights have to be given for {} squares".format(
+                SQUARES_NUM))
+
+    @staticmethod
+    def encode_boards(boards):
+        """
+        Encodes boards as rows of square codes
+        :param boards: Sequence of boards in lists, tuples or BitBoard
+        representation
+        :return: int8 array of shape (N, 32)
+        """
+        if boards and isinstance(boards[0], BitBoard):
+            masks = np.array([(board.player1_pawns, board.player2_pawns, board.kings)
+                              for board in boards], dtype=np.int64)
+            bits = masks[:, :, None] >> SQUARES_SHIFTS & 1
+            return ((bits[:, 0] - bits[:, 1]) * (1 + bits[:, 2])).astype(np.int8)
+        return np.array([[SIGNS_CODES.get(board[y_ind][x_ind], 0)
+                          for x_ind, y_ind in SQUARE_FIELDS] for board in boards],
+                        dtype=np.int8).reshape(-1, SQUARES_NUM)
+
+    def evaluate(self, encoded_boards, player):
+        """
+        Evaluates all the encoded boards
+        :param encoded_boards: int8 array of shape (N, 32) given by
+        encode_boards, or (N, 8, 8) with the codes on the board fields
+        indexed by y and x like the lists boards
+        :param player: GameBoard.Players enum value of the player for which
+        the boards are evaluated
+        :return: Array of N values
+        """
+        codes = np.asarray(encoded_boards)
+        if codes.ndim == 3:
+            codes = codes[:, SQUARES_Y, SQUARES_X]
+        values = self.codes_values[codes + KING_CODE].sum(axis=1) + \
+            (codes > 0) @ self.positional_weights - \
+            (codes < 0) @ self.positional_weights[::-1]
+        if player == GameBoard.Players.PLAYER2:
+            return -values
+        return values
@@ -0,0 +1,486 @@
+"""Module containing bitboard representation of the checkers board and methods
+for generating and making moves on it.
+
+Only the 32 dark fields of the board are used, field with index ``square``
+lies in row ``square // 4``. Pawns of each player and kings are kept as
+separate integers, so moves can be found with shifts and masks instead of
+walking through the board lists field by field. Moves are generated in the
+same order and with the same rules as in the GameBoard class, so both
+representations give the same UCI move strings.
+"""
+import re
+from collections import namedtuple
+
+from decision_games_with_ai.games.checkers.game_implementation.checkers_move import \
+    CheckersMove, SQUARES_NUM, SQUARE_INDEXES, SQUARE_NAMES, square_to_xy, xy_to_square
+from decision_games_with_ai.games.checkers.game_implementation.diagonal_rays import \
+    BOARD_SIZE, DIAGONAL_RAYS
+from decision_games_with_ai.games.utils.events_exceptions import InvalidMoveException
+from decision_games_with_ai.games.utils.global_enums import GameStates
+
+FULL_MASK = (1 << SQUARES_NUM) - 1
+
+PLAYER1_INDEX = 0
+PLAYER2_INDEX = 1
+
+# Directions in the order of GameBoard.Direction enum values
+LEFT_UP = 0
+RIGHT_UP = 1
+RIGHT_DOWN = 2
+LEFT_DOWN = 3
+
+CHECKERS_DIRECTIONS = {
+    PLAYER1_INDEX: (RIGHT_UP, LEFT_UP),
+    PLAYER2_INDEX: (LEFT_DOWN, RIGHT_DOWN)
+}
+
+ALL_DIRECTIONS = (LEFT_UP, RIGHT_UP, RIGHT_DOWN, LEFT_DOWN)
+
+CHECKER_RANGE = 1
+KING_RANGE = 10
+
+
+def _compute_rays():
+    """
+    Translates diagonal rays of the board fields to the squares indexes
+    :return: Tuple indexed with [square][direction] containing tuples of
+    squares ordered by the distance from the given square
+    """
+    rays = []
+    for square in range(SQUARES_NUM):
+        x_ind, y_ind = square_to_xy(square)
+        rays.append(tuple(tuple(xy_to_square(*field) for field in ray)
+                          for ray in DIAGONAL_RAYS[y_ind][x_ind]))
+    return tuple(rays)
+
+
+def _compute_direction_shifts():
+    """
+    Computes masks and shift values, that move every square of the mask by
+    one field in given direction. Shift value depends on the row parity, so
+    each direction has a few (source mask, shift) pairs
+    :return: Tuple indexed with direction containing tuples of
+    (source_mask, shift) pairs
+    """
+    direction_shifts = []
+    for direction in ALL_DIRECTIONS:
+        masks = {}
+        for square in range(SQUARES_NUM):
+            if RAYS[square][direction]:
+                shift = RAYS[square][direction][0] - square
+                masks[shift] = masks.get(shift, 0) | (1 << square)
+        direction_shifts.append(tuple((source_mask, shift) for shift, source_mask in
+                                      sorted(masks.items())))
+    return tuple(direction_shifts)
+
+
+RAYS = _compute_rays()
+DIRECTION_SHIFTS = _compute_direction_shifts()
+
+PROMOTION_MASKS = {
+    PLAYER1_INDEX: sum(1 << xy_to_square(x, BOARD_SIZE - 1)
+                       for x in range(1, BOARD_SIZE, 2)),
+    PLAYER2_INDEX: sum(1 << xy_to_square(x, 0) for x in range(0, BOARD_SIZE, 2))
+}
+
+MOVE_PATTERN = re.compile('[a-z][0-9]+')
+
+BitBoardUndoRecord = namedtuple('BitBoardUndoRecord', [
+    'player1_pawns',
+    'player2_pawns',
+    'kings'
+])
+
+
+def shift_mask(mask, direction):
+    """
+    Moves every square of the mask by one field in given direction, squares
+    that would leave the board are dropped
+    :param mask: Bit mask of squares
+    :param direction: Direction index
+    :return: Shifted mask
+    """
+    shifted = 0
+    for source_mask, shift in DIRECTION_SHIFTS[direction]:
+        if shift > 0:
+            shifted |= (mask & source_mask) << shift
+        else:
+            shifted |= (mask & source_mask) >> -shift
+    return shifted
+
+
+def iterate_squares(mask):
+    """
+    Iterates over the squares set in the mask in ascending order
+    :param mask: Bit mask of squares
+    :return: Generator of square indexes
+    """
+    while mask:
+        lowest_bit = mask & -mask
+        yield lowest_bit.bit_length() - 1
+        mask ^= lowest_bit
+
+
+def count_squares(mask):
+    """
+    Counts squares set in the mask
+    :param mask: Bit mask of squares
+    :return: Number of the squares
+    """
+    return bin(mask).count('1')
+
+
+class BitBoard:
+    """Stores checkers position as three integers and provides methods for
+    finding and making moves on it. Objects are compared and hashed by the
+    position, so they can be used as dictionary keys as long as they are not
+    changed afterwards"""
+
+    __slots__ = ('player1_pawns', 'player2_pawns', 'kings')
+
+    def __init__(self, player1_pawns=0, player2_pawns=0, kings=0):
+        self.player1_pawns = player1_pawns
+        self.player2_pawns = player2_pawns
+        self.kings = kings
+
+    def __eq__(self, other):
+        return isinstance(other, BitBoard) and \
+            self.player1_pawns == other.player1_pawns and \
+            self.player2_pawns == other.player2_pawns and \
+            self.kings == other.kings
+
+    def __hash__(self):
+        return hash((self.player1_pawns, self.player2_pawns, self.kings))
+
+    def __repr__(self):
+        return "BitBoard({:#010x}, {:#010x}, {:#010x})".format(
+            self.player1_pawns, self.player2_pawns, self.kings)
+
+    def copy(self):
+        """
+        Creates copy of the bitboard
+        :return: New BitBoard object
+        """
+        return BitBoard(self.player1_pawns, self.player2_pawns, self.kings)
+
+    def get_players_pawns(self, player_index):
+        """
+        :param player_index: Index of the player (0 or 1)
+        :return: Bit mask of all players pawns
+        """
+        return self.player1_pawns if player_index == PLAYER1_INDEX else self.player2_pawns
+
+    def get_possible_moves(self, player_index):
+        """
+        Finds all moves for the given player
+        :param player_index: Index of the player (0 or 1)
+        :return: List of possible moves in a form of list of strings with move
+        in UCI format
+        """
+        all_possible_moves = []
+        for start_square, end_square, captured_mask in self._generate_moves(player_index):
+            all_possible_moves.append(SQUARE_NAMES[start_square] + SQUARE_NAMES[end_square])
+        return all_possible_moves
+
+    def get_legal_moves(self, player_index):
+        """
+        Finds all moves for the given player. Capture sequences with the same
+        start and end squares are reduced to the first one, the same as
+        the move in UCI format is understood by make_move
+        :param player_index: Index of the player (0 or 1)
+        :return: List of CheckersMove objects
+        """
+        legal_moves = []
+        found_captures = set()
+        for start_square, end_square, captured_mask in self._generate_moves(player_index):
+            if captured_mask:
+                if (start_square, end_square) in found_captures:
+                    continue
+                found_captures.add((start_square, end_square))
+            legal_moves.append(CheckersMove(start_square, end_square, captured_mask))
+        return legal_moves
+
+    def make_move(self, player_index, move_coords):
+        """
+        Makes move on the copy of the bitboard
+        :param player_index: Index of the moving player (0 or 1)
+        :param move_coords: Move coords in UCI format or CheckersMove found by
+        get_legal_moves, which is not validated again
+        :return: New BitBoard object after making move
+        """
+        new_board = self.copy()
+        if not isinstance(move_coords, CheckersMove):
+            move_coords = self._find_move(player_index, move_coords)
+        new_board._move_pawn(player_index, *move_coords)
+        return new_board
+
+    def apply_move(self, player_index, move_coords):
+        """
+        Makes move in place
+        :param player_index: Index of the moving player (0 or 1)
+        :param move_coords: Move coords in UCI format or CheckersMove found by
+        get_legal_moves, which is not validated again
+        :return: BitBoardUndoRecord for undo_move method
+        """
+        if not isinstance(move_coords, CheckersMove):
+            move_coords = self._find_move(player_index, move_coords)
+        undo_record = BitBoardUndoRecord(self.player1_pawns, self.player2_pawns, self.kings)
+        self._move_pawn(player_index, *move_coords)
+        return undo_record
+
+    def undo_move(self, undo_record):
+        """
+        Restores the position from before the move made by apply_move
+        :param undo_record: BitBoardUndoRecord returned by apply_move
+        :return:
+        """
+        self.player1_pawns, self.player2_pawns, self.kings = undo_record
+
+    def _find_move(self, player_index, move_coords):
+        """
+        Validates move in UCI format and finds it between the moves possible
+        for the pawn
+        :param player_index: Index of the moving player (0 or 1)
+        :param move_coords: Move coords in UCI format
+        :return: CheckersMove
+        """
+        move_coords_as_list = MOVE_PATTERN.findall(move_coords)
+        if len(move_coords_as_list) != 2:
+            raise InvalidMoveException("Invalid move format")
+        try:
+            start_square = SQUARE_INDEXES[move_coords_as_list[0]]
+            end_square = SQUARE_INDEXES[move_coords_as_list[1]]
+        except KeyError:
+            raise InvalidMoveException("Wrong move coordinates given")
+
+        own = self.get_players_pawns(player_index)
+        if not own >> start_square & 1:
+            raise InvalidMoveException("There is no pawn of the actual player on given field")
+
+        for move_end_square, captured_mask in self._find_moves_for_pawn(
+                start_square, player_index):
+            if move_end_square == end_square:
+                return CheckersMove(start_square, end_square, captured_mask)
+        raise InvalidMoveException("Wrong move coordinates given")
+
+    def check_game_state(self, player_index):
+        """
+        Checks the state of the game for the actual player, does not take
+        moves without capture limit into account
+        :param player_index: Index of the player whose turn it is
+        :return: Game state in a form of GameStates enum
+        """
+        if not self.player1_pawns:
+            return GameStates.PLAYER2WIN
+        elif player_index == PLAYER1_INDEX and not self.has_moves(PLAYER1_INDEX):
+            return GameStates.PLAYER2WIN
+
+        if not self.player2_pawns:
+            return GameStates.PLAYER1WIN
+        elif player_index == PLAYER2_INDEX and not self.has_moves(PLAYER2_INDEX):
+            return GameStates.PLAYER1WIN
+
+        return GameStates.ONGOING
+
+    def has_moves(self, player_index):
+        """
+        Checks if player has any move
+        :param player_index: Index of the player (0 or 1)
+        :return: True if there is at least one move, false otherwise
+        """
+        own = self.get_players_pawns(player_index)
+        empty = ~(self.player1_pawns | self.player2_pawns) & FULL_MASK
+        checkers = own & ~self.kings
+        for direction in CHECKERS_DIRECTIONS[player_index]:
+            if shift_mask(checkers, direction) & empty:
+                return True
+        kings = own & self.kings
+        for direction in ALL_DIRECTIONS:
+            if shift_mask(kings, direction) & empty:
+                return True
+        return self.has_captures(player_index)
+
+    def has_captures(self, player_index):
+        """
+        Checks if player has any capture possibility
+        :param player_index: Index of the player (0 or 1)
+        :return: True if any of the player pawns can capture, false otherwise
+        """
+        own = self.get_players_pawns(player_index)
+        enemy = self.get_players_pawns(1 - player_index)
+        empty = ~(own | enemy) & FULL_MASK
+        checkers = own & ~self.kings
+        for direction in ALL_DIRECTIONS:
+            if shift_mask(shift_mask(checkers, direction) & enemy, direction) & empty:
+                return True
+        for king_square in iterate_squares(own & self.kings):
+            if self._find_captures_positions(king_square, KING_RANGE, own, enemy):
+                return True
+        return False
+
+    def _move_pawn(self, player_index, start_square, end_square, captured_mask):
+        """
+        Moves pawn on the bitboard, promotes it to king when it gets to the
+        end of the board and removes captured pawns
+        :param player_index: Index of the moving player (0 or 1)
+        :param start_square: Square of the moving pawn
+        :param end_square: Destination square
+        :param captured_mask: Bit mask of captured enemy pawns
+        :return:
+        """
+        start_bit = 1 << start_square
+        end_bit = 1 << end_square
+        if player_index == PLAYER1_INDEX:
+            self.player1_pawns ^= start_bit | end_bit
+        else:
+            self.player2_pawns ^= start_bit | end_bit
+        if self.kings & start_bit:
+            self.kings ^= start_bit | end_bit
+        elif end_bit & PROMOTION_MASKS[player_index]:
+            self.kings |= end_bit
+        # Captured fields are emptied after the pawn is moved, the same as in
+        # GameBoard.make_move
+        self.player1_pawns &= ~captured_mask
+        self.player2_pawns &= ~captured_mask
+        self.kings &= ~captured_mask
+
+    def _generate_moves(self, player_index):
+        """
+        Generates all moves for the player ordered by the pawn squares
+        :param player_index: Index of the player (0 or 1)
+        :return: Generator of (start_square, end_square, captured_mask) tuples
+        """
+        own = self.get_players_pawns(player_index)
+        if self.has_captures(player_index):
+            for square in iterate_squares(own):
+                for end_square, captured_mask in self._find_capture_moves_for_pawn(
+                        square, player_index):
+                    yield square, end_square, captured_mask
+        else:
+            empty = ~(self.player1_pawns | self.player2_pawns) & FULL_MASK
+            checkers = own & ~self.kings
+            directions = CHECKERS_DIRECTIONS[player_index]
+            destinations = [shift_mask(checkers, direction) & empty
+                            for direction in directions]
+            for square in iterate_squares(own):
+                if self.kings >> square & 1:
+                    for end_square in self._find_king_simple_moves(square, empty):
+                        yield square, end_square, 0
+                else:
+                    for direction, direction_destinations in zip(directions, destinations):
+                        ray = RAYS[square][direction]
+                        if ray and direction_destinations >> ray[0] & 1:
+                            yield square, ray[0], 0
+
+    def _find_moves_for_pawn(self, square, player_index):
+        """
+        Finds moves for the pawn on given square
+        :param square: Square of the pawn
+        :param player_index: Index of the player (0 or 1)
+        :return: List of (end_square, captured_mask) tuples
+        """
+        capture_moves = self._find_capture_moves_for_pawn(square, player_index)
+        if capture_moves:
+            return capture_moves
+        if self.has_captures(player_index):
+            raise InvalidMoveException("You must make moves with captures possibility first")
+        if self.kings >> square & 1:
+            empty = ~(self.player1_pawns | self.player2_pawns) & FULL_MASK
+            return [(end_square, 0) for end_square in self._find_king_simple_moves(square, empty)]
+        moves = []
+        occupied = self.player1_pawns | self.player2_pawns
+        for direction in CHECKERS_DIRECTIONS[player_index]:
+            ray = RAYS[square][direction]
+            if ray and not occupied >> ray[0] & 1:
+                moves.append((ray[0], 0))
+        return moves
+
+    @staticmethod
+    def _find_king_simple_moves(square, empty):
+        """
+        Finds simple moves of the king
+        :param square: Square of the king
+        :param empty: Bit mask of empty squares
+        :return: List of end squares
+        """
+        end_squares = []
+        for ray in RAYS[square]:
+            for ray_square in ray:
+                if empty >> ray_square & 1:
+                    end_squares.append(ray_square)
+                else:
+                    break
+        return end_squares
+
+    def _find_capture_moves_for_pawn(self, square, player_index):
+        """
+        Finds all capture sequences of the pawn on given square
+        :param square: Square of the pawn
+        :param player_index: Index of the player (0 or 1)
+        :return: List of (end_square, captured_mask) tuples
+        """
+        own = self.get_players_pawns(player_index)
+        enemy = self.get_players_pawns(1 - player_index)
+        pawn_range = KING_RANGE if self.kings >> square & 1 else CHECKER_RANGE
+        capture_moves = []
+        for cap_square, direction in self._find_captures_positions(
+                square, pawn_range, own, enemy):
+            capture_moves += self._find_capture_moves(
+                cap_square, direction, pawn_range, own, enemy, 0)
+        return capture_moves
+
+    @staticmethod
+    def _find_captures_positions(square, pawn_range, own, enemy):
+        """
+        Finds enemy pawns that can be captured from given square. Same as in
+        GameBoard, pawns check for captures in every direction
+        :param square: Square from which the captures are checked
+        :param pawn_range: Range of the pawn
+        :param own: Bit mask of the capturing player pawns
+        :param enemy: Bit mask of the enemy pawns
+        :return: List of (captured_square, direction) tuples
+        """
+        possible_captures = []
+        for direction in ALL_DIRECTIONS:
+            ray = RAYS[square][direction]
+            for ray_ind, ray_square in enumerate(ray[:pawn_range]):
+                if enemy >> ray_square & 1:
+                    if ray_ind + 1 < len(ray) and \
+                            not (own | enemy) >> ray[ray_ind + 1] & 1:
+                        possible_captures.append((ray_square, direction))
+                    break
+                elif own >> ray_square & 1:
+                    break
+        return possible_captures
+
+    def _find_capture_moves(self, cap_square, direction, pawn_range, own, enemy,
+                            captured_mask):
+        """
+        Finds capture sequences after capturing pawn on the given square. The
+        captured pawns are removed from the board immediately and the moving
+        pawn stays on its starting square until the whole sequence is found,
+        the same as in GameBoard
+        :param cap_square: Square of the captured pawn
+        :param direction: Direction of the capture
+        :param pawn_range: Range of the capturing pawn
+        :param own: Bit mask of the capturing player pawns
+        :param enemy: Bit mask of the enemy pawns not captured yet
+        :param captured_mask: Bit mask of pawns captured so far
+        :return: List of (end_square, captured_mask) tuples
+        """
+        capture_moves = []
+        enemy_left = enemy & ~(1 << cap_square)
+        captured_mask |= 1 << cap_square
+        for landing_square in RAYS[cap_square][direction][:pawn_range]:
+            if (own | enemy) >> landing_square & 1:
+                break
+            next_captures = self._find_captures_positions(
+                landing_square, pawn_range, own, enemy_left)
+            if not next_captures:
+                capture_moves.append((landing_square, captured_mask))
+            else:
+                for next_cap_square, next_direction in next_captures:
+                    capture_moves += self._find_capture_moves(
+                        next_cap_square, next_direction, pawn_range, own, enemy_left,
+                        captured_mask)
+        return capture_moves
@@ -0,0 +1,78 @@
+"""Module containing compact representation of the checkers move, that is
+passed around inside search instead of the UCI strings.
+
+Fields of the board are identified by square indexes of the 32 dark fields,
+field with index ``square`` lies in row ``square // 4``.
+"""
+from collections import namedtuple
+
+from decision_games_with_ai.games.utils.coords_formatters import CoordsFormatter
+
+SQUARES_NUM = 32
+
+
+def square_to_xy(square):
+    """
+    Translates square index to board indexes
+    :param square: Index of the dark field in range 0 - 31
+    :return: X index, Y index
+    """
+    y_ind = square >> 2
+    return ((square & 3) << 1) + (y_ind & 1), y_ind
+
+
+def xy_to_square(x_ind, y_ind):
+    """
+    Translates board indexes of the dark field to square index
+    :param x_ind: X index of the field
+    :param y_ind: Y index of the field
+    :return: Square index or None when the field is not a dark one
+    """
+    if x_ind % 2 != y_ind % 2:
+        return None
+    return (y_ind << 2) + (x_ind >> 1)
+
+
+SQUARE_FIELDS = tuple(square_to_xy(square) for square in range(SQUARES_NUM))
+SQUARE_NAMES = tuple(CoordsFormatter.translate_from_xy_to_uci(*field)
+                     for field in SQUARE_FIELDS)
+SQUARE_INDEXES = {name: square for square, name in enumerate(SQUARE_NAMES)}
+
+
+class CheckersMove(namedtuple('CheckersMove', ['start', 'end', 'captured'])):
+    """Move of the pawn from start square to end square, captured is the bit
+    mask of squares of pawns removed by the move"""
+
+    __slots__ = ()
+
+    def to_uci(self):
+        """
+        :return: Move in UCI format
+        """
+        return SQUARE_NAMES[self.start] + SQUARE_NAMES[self.end]
+
+    def get_captures_num(self):
+        """
+        :return: Number of pawns captured by the move
+        """
+        return bin(self.captured).count('1')
+
+    def get_mirrored(self):
+        """
+        :return: The same move on the board rotated by 180 degrees, square
+        index changes to 31 - square
+        """
+        return CheckersMove(SQUARES_NUM - 1 - self.start, SQUARES_NUM - 1 - self.end,
+                            int('{:032b}'.format(self.captured)[::-1], 2))
+
+    def get_captured_squares(self):
+        """
+        :return: List of captured squares in ascending order
+        """
+        captured_squares = []
+        captured = self.captured
+        while captured:
+            lowest_bit = captured & -captured
+            captured_squares.append(lowest_bit.bit_length() - 1)
+            captured ^= lowest_bit
+        return captured_squares
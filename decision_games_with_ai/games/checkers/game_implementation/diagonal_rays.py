@@ -0,0 +1,43 @@
+"""Module providing diagonal rays of the checkers board, computed once at the
+import time. Ray is the ordered tuple of fields lying on the diagonal in the
+given direction, starting from the field next to the given one and ending at
+the edge of the board, so the move scanning functions can iterate over them
+without checking the board borders"""
+
+BOARD_SIZE = 8
+
+# Steps in the order of GameBoard.Direction enum values:
+# LEFT_UP, RIGHT_UP, RIGHT_DOWN, LEFT_DOWN
+DIRECTION_STEPS = (
+    (-1, 1),
+    (1, 1),
+    (1, -1),
+    (-1, -1)
+)
+
+
+def compute_diagonal_rays(board_size):
+    """
+    Computes diagonal rays for every field of the board
+    :param board_size: Size of the square board
+    :return: Tuples indexed with [y_ind][x_ind][direction value] containing
+    tuples of (x_ind, y_ind) fields ordered by the distance from the field
+    """
+    board_rays = []
+    for y_ind in range(board_size):
+        row_rays = []
+        for x_ind in range(board_size):
+            field_rays = []
+            for step_x, step_y in DIRECTION_STEPS:
+                ray = []
+                next_x, next_y = x_ind + step_x, y_ind + step_y
+                while 0 <= next_x < board_size and 0 <= next_y < board_size:
+                    ray.append((next_x, next_y))
+                    next_x, next_y = next_x + step_x, next_y + step_y
+                field_rays.append(tuple(ray))
+            row_rays.append(tuple(field_rays))
+        board_rays.append(tuple(row_rays))
+    return tuple(board_rays)
+
+
+DIAGONAL_RAYS = compute_diagonal_rays(BOARD_SIZE)
@@ -0,0 +1,449 @@
+"""Module providing checkers endgame database, generated offline with the
+retrograde analysis and probed by the search through the memory mapped file.
+
+Positions are grouped by the material signature, numbers of the first player
+checkers, first player kings, second player checkers and second player kings.
+Inside the signature every position has its index, the pieces of each group
+are placed on the squares left free by the previous groups and the index is
+the mixed radix number of the combinations ranks, positions with the second
+player to move follow all positions with the first player to move.
+
+Signatures are solved from the smallest ones, captures and promotions lead to
+the signatures that are already solved. Inside the signature the positions
+are resolved in the order of the distance, starting from the positions
+without moves and the moves leading to the solved signatures, and the values
+are passed back to the positions found by the unmoves. Positions that are
+never resolved are draws.
+
+Value of the position is kept from the point of view of the player to move,
+``distance`` for the win in distance plies, ``-distance - 1`` for the loss
+in distance plies and 0 for the draw. Database does not know about the moves
+without capture limit of the game.
+
+File starts with the header and the table of the signatures with offsets of
+their values, values are little endian int16 numbers, or int8 signs of the
+values when the distances are not stored.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from collections import namedtuple
+from itertools import product
+from math import comb
+
+from decision_games_with_ai.games.checkers.game_implementation.bitboard import \
+    ALL_DIRECTIONS, BitBoard, CHECKERS_DIRECTIONS, PLAYER1_INDEX, PROMOTION_MASKS, RAYS, \
+    count_squares, iterate_squares
+from decision_games_with_ai.games.checkers.game_implementation.checkers_move import \
+    SQUARES_NUM
+
+FILE_MAGIC = b'CKEGDB'
+FILE_VERSION = 1
+HEADER_FORMAT = '<6sBBHH'
+SIGNATURE_FORMAT = '<BBBBQ'
+
+# Children counter of the position that can not be lost, one of its moves
+# leads to the draw or to the win
+CAN_NOT_LOSE = 0xFFFF
+
+EndgameEntry = namedtuple('EndgameEntry', ['result', 'distance'])
+EndgameEntry.__doc__ = """Value of the position for the player to move,
+result is 1 for the win, -1 for the loss and 0 for the draw, distance is the
+number of plies to the end of the game, None for the draw or when the
+database does not store the distances"""
+
+
+def get_signature(board):
+    """
+    :param board: BitBoard object
+    :return: Tuple with numbers of the first player checkers, first player
+    kings, second player checkers and second player kings
+    """
+    return (count_squares(board.player1_pawns & ~board.kings),
+            count_squares(board.player1_pawns & board.kings),
+            count_squares(board.player2_pawns & ~board.kings),
+            count_squares(board.player2_pawns & board.kings))
+
+
+def get_signature_size(signature):
+    """
+    :param signature: Material signature of the positions
+    :return: Number of the positions of the signature with one player to move
+    """
+    size = 1
+    free_squares = SQUARES_NUM
+    for pieces_num in signature:
+        size *= comb(free_squares, pieces_num)
+        free_squares -= pieces_num
+    return size
+
+
+def get_groups_masks(board):
+    """
+    :param board: BitBoard object
+    :return: Tuple of the masks of the pieces groups in the signature order
+    """
+    return (board.player1_pawns & ~board.kings, board.player1_pawns & board.kings,
+            board.player2_pawns & ~board.kings, board.player2_pawns & board.kings)
+
+
+def get_position_rank(groups_masks):
+    """
+    Finds index of the position inside its signature, without the player to
+    move
+    :param groups_masks: Masks of the pieces groups in the signature order
+    :return: Rank of the position
+    """
+    rank = 0
+    occupied = 0
+    free_squares = SQUARES_NUM
+    for group_mask in groups_masks:
+        group_rank = 0
+        pieces_num = 0
+        for square in iterate_squares(group_mask):
+            # Square number among the squares not taken by the earlier groups
+            free_square = square - count_squares(occupied & ((1 << square) - 1))
+            pieces_num += 1
+            group_rank += comb(free_square, pieces_num)
+        rank = rank * comb(free_squares, pieces_num) + group_rank
+        occupied |= group_mask
+        free_squares -= pieces_num
+    return rank
+
+
+def get_position_from_rank(signature, rank):
+    """
+    Recreates the position from its rank, reverse of get_position_rank
+    :param signature: Material signature of the position
+    :param rank: Rank of the position
+    :return: BitBoard object
+    """
+    groups_ranks = []
+    free_squares = SQUARES_NUM
+    for pieces_num in signature:
+        groups_ranks.append(free_squares)
+        free_squares -= pieces_num
+    for group_ind in range(len(signature) - 1, -1, -1):
+        rank, groups_ranks[group_ind] = divmod(
+            rank, comb(groups_ranks[group_ind], signature[group_ind]))
+
+    groups_masks = []
+    occupied = 0
+    for pieces_num, group_rank in zip(signature, groups_ranks):
+        free_squares_list = [square for square in range(SQUARES_NUM)
+                             if not occupied >> square & 1]
+        group_mask = 0
+        free_square = len(free_squares_list)
+        for piece_ind in range(pieces_num, 0, -1):
+            free_square -= 1
+            while comb(free_square, piece_ind) > group_rank:
+                free_square -= 1
+            group_rank -= comb(free_square, piece_ind)
+            group_mask |= 1 << free_squares_list[free_square]
+        groups_masks.append(group_mask)
+        occupied |= group_mask
+    player1_checkers, player1_kings, player2_checkers, player2_kings = groups_masks
+    return BitBoard(player1_checkers | player1_kings, player2_checkers | player2_kings,
+                    player1_kings | player2_kings)
+
+
+def get_signatures(max_pieces):
+    """
+    :param max_pieces: Maximal number of the pieces on the board
+    :return: List of the signatures with pieces of both players, ordered so
+    that captures and promotions lead to the earlier signatures
+    """
+    signatures = [signature for signature in product(range(max_pieces + 1), repeat=4)
+                  if sum(signature) <= max_pieces and
+                  signature[0] + signature[1] and signature[2] + signature[3]]
+    return sorted(signatures, key=lambda signature: (sum(signature),
+                                                     signature[0] + signature[2], signature))
+
+
+class EndgameDatabaseGenerator:
+    """Class solving all positions up to the given number of pieces with the
+    retrograde analysis and writing them to the database file"""
+
+    def __init__(self, max_pieces=3, store_distance=True):
+        """
+        :param max_pieces: Maximal number of the pieces on the board of the
+        solved positions
+        :param store_distance: When set, number of plies to the end of the
+        game is stored with the result, otherwise only the result is stored
+        and the file is two times smaller
+        """
+        self.max_pieces = max_pieces
+        self.store_distance = store_distance
+        # Signature: array of the values of its positions
+        self.values = {}
+
+    def generate(self, database_path):
+        """
+        Solves all the signatures and writes the database file
+        :param database_path: Path of the written file
+        """
+        for signature in get_signatures(self.max_pieces):
+            self.values[signature] = self._solve_signature(signature)
+        self.save(database_path)
+
+    def save(self, database_path):
+        """
+        :param database_path: Path of the file the solved signatures are
+        written to
+        """
+        signatures = list(self.values)
+        entry_size = 2 if self.store_distance else 1
+        offset = struct.calcsize(HEADER_FORMAT) + \
+            len(signatures) * struct.calcsize(SIGNATURE_FORMAT)
+        with open(database_path, 'wb') as database_file:
+            database_file.write(struct.pack(HEADER_FORMAT, FILE_MAGIC, FILE_VERSION,
+                                            self.store_distance, self.max_pieces,
+                                            len(signatures)))
+            for signature in signatures:
+                database_file.write(struct.pack(SIGNATURE_FORMAT, *signature, offset))
+                offset += len(self.values[signature]) * entry_size
+            for signature in signatures:
+                values = self.values[signature]
+                if self.store_distance:
+                    if sys.byteorder != 'little':
+                        values = array('h', values)
+                        values.byteswap()
+                else:
+                    values = array('b', (min(max(value, -1), 1) for value in values))
+                database_file.write(values.tobytes())
+
+    def _get_value(self, board, player_index):
+        """
+        :param board: BitBoard object from the solved signature
+        :param player_index: Index of the player to move
+        :return: Value of the position for the player to move
+        """
+        if not board.get_players_pawns(player_index):
+            return -1
+        signature = get_signature(board)
+        rank = get_position_rank(get_groups_masks(board))
+        return self.values[signature][player_index * get_signature_size(signature) + rank]
+
+    def _solve_signature(self, signature):
+        """
+        Solves positions of the signature with the retrograde analysis
+        :param signature: Material signature of the positions
+        :return: Array of the values indexed with player_index * size + rank
+        """
+        size = get_signature_size(signature)
+        values = array('h', bytes(4 * size))
+        resolved = bytearray(2 * size)
+        children_left = array('H', bytes(4 * size))
+        loss_distances = array('H', bytes(4 * size))
+        # Distance: list of (index, value) of the positions resolved at it
+        queued = {}
+
+        for index in range(2 * size):
+            player_index, rank = divmod(index, size)
+            board = get_position_from_rank(signature, rank)
+            win_distance = None
+            loss_distance = 0
+            has_draw = False
+            internal_moves = 0
+            for move in board.get_legal_moves(player_index):
+                child_board = board.make_move(player_index, move)
+                if get_signature(child_board) == signature:
+                    internal_moves += 1
+                    continue
+                child_value = self._get_value(child_board, 1 - player_index)
+                if child_value < 0:
+                    if win_distance is None or -child_value < win_distance:
+                        win_distance = -child_value
+                elif child_value > 0:
+                    loss_distance = max(loss_distance, child_value + 1)
+                else:
+                    has_draw = True
+            if win_distance is not None or has_draw:
+                children_left[index] = CAN_NOT_LOSE
+                if win_distance is not None:
+                    queued.setdefault(win_distance, []).append((index, win_distance))
+            elif not internal_moves:
+                queued.setdefault(loss_distance, []).append((index, -loss_distance - 1))
+            else:
+                children_left[index] = internal_moves
+                loss_distances[index] = loss_distance
+
+        while queued:
+            distance = min(queued)
+            for index, value in queued.pop(distance):
+                if resolved[index]:
+                    continue
+                resolved[index] = 1
+                values[index] = value
+                player_index, rank = divmod(index, size)
+                board = get_position_from_rank(signature, rank)
+                for previous_board in self._get_previous_boards(board, 1 - player_index):
+                    previous_index = (1 - player_index) * size + get_position_rank(
+                        get_groups_masks(previous_board))
+                    if resolved[previous_index]:
+                        continue
+                    if value < 0:
+                        queued.setdefault(distance + 1, []).append(
+                            (previous_index, distance + 1))
+                    elif children_left[previous_index] != CAN_NOT_LOSE:
+                        children_left[previous_index] -= 1
+                        loss_distances[previous_index] = max(loss_distances[previous_index],
+                                                             distance + 1)
+                        if not children_left[previous_index]:
+                            loss_distance = loss_distances[previous_index]
+                            queued.setdefault(loss_distance, []).append(
+                                (previous_index, -loss_distance - 1))
+        return values
+
+    @staticmethod
+    def _get_previous_boards(board, player_index):
+        """
+        Finds positions from which the player could get to the board with
+        the move that neither captures nor promotes
+        :param board: BitBoard object
+        :param player_index: Index of the player that made the move
+        :return: List of BitBoard objects
+        """
+        own = board.get_players_pawns(player_index)
+        occupied = board.player1_pawns | board.player2_pawns
+        previous_boards = []
+        for square in iterate_squares(own):
+            square_bit = 1 << square
+            if board.kings & square_bit:
+                start_squares = []
+                for direction in ALL_DIRECTIONS:
+                    for ray_square in RAYS[square][direction]:
+                        if occupied >> ray_square & 1:
+                            break
+                        start_squares.append(ray_square)
+            else:
+                if square_bit & PROMOTION_MASKS[player_index]:
+                    continue
+                start_squares = []
+                # Checker came from the opposite side of its moves directions
+                for direction in CHECKERS_DIRECTIONS[1 - player_index]:
+                    ray = RAYS[square][direction]
+                    if ray and not occupied >> ray[0] & 1:
+                        start_squares.append(ray[0])
+            for start_square in start_squares:
+                moved_bits = square_bit | 1 << start_square
+                previous_board = board.copy()
+                if player_index == PLAYER1_INDEX:
+                    previous_board.player1_pawns ^= moved_bits
+                else:
+                    previous_board.player2_pawns ^= moved_bits
+                if board.kings & square_bit:
+                    previous_board.kings ^= moved_bits
+                # Captures are obligatory, the move was not possible when the
+                # player had any of them
+                if not previous_board.has_captures(player_index):
+                    previous_boards.append(previous_board)
+        return previous_boards
+
+
+class EndgameDatabase:
+    """Class probing the database file written by EndgameDatabaseGenerator.
+    The file is mapped to the memory and read only, so all processes using
+    it share the pages of the system cache. Copies sent to other processes
+    take only the path and map the file again"""
+
+    def __init__(self, database_path):
+        """
+        :param database_path: Path of the database file
+        """
+        self.database_path = database_path
+        self.hits = 0
+        self.max_pieces = 0
+        self.store_distance = False
+        # Signature: (offset of its values, size of the signature)
+        self.signatures = {}
+        self._database_file = None
+        self._database_map = None
+        self._open()
+
+    def _open(self):
+        """
+        Maps the database file and reads its signatures table
+        """
+        self._database_file = open(self.database_path, 'rb')
+        self._database_map = mmap.mmap(self._database_file.fileno(), 0,
+                                       access=mmap.ACCESS_READ)
+        magic, version, store_distance, self.max_pieces, signatures_num = \
+            struct.unpack_from(HEADER_FORMAT, self._database_map)
+        if magic != FILE_MAGIC or version != FILE_VERSION:
+            self.close()
+            raise ValueError("File is not a checkers endgame database")
+        self.store_distance = bool(store_distance)
+        self.signatures = {}
+        table_offset = struct.calcsize(HEADER_FORMAT)
+        for signature_ind in range(signatures_num):
+            *signature, offset = struct.unpack_from(
+                SIGNATURE_FORMAT, self._database_map,
+                table_offset + signature_ind * struct.calcsize(SIGNATURE_FORMAT))
+            self.signatures[tuple(signature)] = (offset, get_signature_size(signature))
+
+    def close(self):
+        """
+        Unmaps and closes the database file
+        """
+        if self._database_map is not None:
+            self._database_map.close()
+            self._database_map = None
+        if self._database_file is not None:
+            self._database_file.close()
+            self._database_file = None
+
+    def __getstate__(self):
+        """
+        :return: State of the database to pickle, without the mapped file
+        """
+        state = self.__dict__.copy()
+        state['_database_file'] = None
+        state['_database_map'] = None
+        return state
+
+    def __setstate__(self, state):
+        """
+        :param state: Pickled state, the file is mapped again
+        """
+        self.__dict__.update(state)
+        self._open()
+
+    def probe(self, board, player_index):
+        """
+        Looks for the position in the database
+        :param board: BitBoard object
+        :param player_index: Index of the player to move (0 or 1)
+        :return: EndgameEntry of the position, None when the database does not
+        contain it
+        """
+        if count_squares(board.player1_pawns | board.player2_pawns) > self.max_pieces:
+            return None
+        signature_info = self.signatures.get(get_signature(board))
+        if signature_info is None:
+            return None
+        offset, size = signature_info
+        index = player_index * size + get_position_rank(get_groups_masks(board))
+        if self.store_distance:
+            value = struct.unpack_from('<h', self._database_map, offset + 2 * index)[0]
+        else:
+            value = struct.unpack_from('<b', self._database_map, offset + index)[0]
+        self.hits += 1
+        if value > 0:
+            return EndgameEntry(1, value if self.store_distance else None)
+        if value < 0:
+            return EndgameEntry(-1, -value - 1 if self.store_distance else None)
+        return EndgameEntry(0, None)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generates checkers endgame database")
+    parser.add_argument('database_path')
+    parser.add_argument('--max-pieces', type=int, default=3)
+    parser.add_argument('--without-distance', action='store_true')
+    arguments = parser.parse_args()
+    EndgameDatabaseGenerator(arguments.max_pieces, not arguments.without_distance).generate(
+        arguments.database_path)
@@ -1,8 +1,15 @@
 """Module containing board of the checkers game and methods for
 manipulating it"""
 import re
+from collections import namedtuple
 from enum import Enum
 
+from decision_games_with_ai.games.checkers.game_implementation.bitboard import BitBoard, \
+    iterate_squares
+from decision_games_with_ai.games.checkers.game_implementation.checkers_move import \
+    CheckersMove, SQUARE_FIELDS, SQUARE_NAMES, square_to_xy, xy_to_square
+from decision_games_with_ai.games.checkers.game_implementation.diagonal_rays import \
+    DIAGONAL_RAYS
 from decision_games_with_ai.games.game_board_abc import GameBoardABC
 from decision_games_with_ai.games.utils.coords_formatters import CoordsFormatter
 from decision_games_with_ai.games.utils.events_exceptions import InvalidMoveException, \
@@ -10,6 +17,20 @@ from decision_games_with_ai.games.utils.events_exceptions import InvalidMoveExce
 from decision_games_with_ai.games.utils.global_enums import GameStates
 from decision_games_with_ai.games.utils.view_modificators import create_string_board_from_output
 
+MoveUndoRecord = namedtuple('MoveUndoRecord', [
+    'start',
+    'end',
+    'moved_pawn',
+    'captured_pawns',
+    'promoted',
+    'previous_move_count'
+])
+MoveUndoRecord.__doc__ = """Record returned by GameBoard.apply_move, that lets
+undo_move restore the board. Start and end are (x_ind, y_ind) tuples,
+moved_pawn is the sign of the pawn before the move, captured_pawns is a tuple
+of ((x_ind, y_ind), sign) of removed pawns, previous_move_count is None when
+the move was not made on the class board"""
+
 
 class GameBoard(GameBoardABC):
     """Stores game board tabs and provides method to manipulate on them"""
@@ -52,6 +73,8 @@ class GameBoard(GameBoardABC):
         Players.PLAYER2: Players.PLAYER1
     }
 
+    all_directions = tuple(Direction)
+
     players_checkers_directions = {
         Players.PLAYER1: (
             Direction.RIGHT_UP,
@@ -85,6 +108,10 @@ class GameBoard(GameBoardABC):
 
     max_moves_without_capture = 15
 
+    diagonal_rays = DIAGONAL_RAYS
+
+    move_pattern = re.compile('[a-z][0-9]+')
+
     def __init__(self):
         self.board_size = 8
         self.move_count = 0
@@ -104,6 +131,70 @@ class GameBoard(GameBoardABC):
 
         self.fill_board_with_starting_positions()
 
+    def get_board_copy(self, board_to_copy=None, copy_format='list'):
+        """
+        Creates copy of the given board, boards can be converted between the
+        lists and bitboard representation
+        :param board_to_copy: Two dimensional board or BitBoard to copy
+        :param copy_format: 'list', 'tuple' or 'bitboard'
+        :return: Board copy in the given format
+        """
+        if board_to_copy is None:
+            board_to_copy = self.board_arrays
+
+        if copy_format == 'bitboard':
+            if isinstance(board_to_copy, BitBoard):
+                return board_to_copy.copy()
+            return self._convert_board_to_bitboard(board_to_copy)
+
+        if isinstance(board_to_copy, BitBoard):
+            board_to_copy = self._convert_bitboard_to_board(board_to_copy)
+        return super().get_board_copy(board_to_copy, copy_format)
+
+    def _convert_board_to_bitboard(self, board):
+        """
+        Converts two dimensional board to the bitboard representation
+        :param board: Two dimensional board
+        :return: BitBoard object
+        """
+        bitboard = BitBoard()
+        for y_ind in range(self.board_size):
+            for x_ind in range(y_ind % 2, self.board_size, 2):
+                board_el = board[y_ind][x_ind]
+                if board_el == GameBoard.BoardSigns.EMPTY_BLACK.value:
+                    continue
+                square_bit = 1 << xy_to_square(x_ind, y_ind)
+                if board_el in GameBoard.allowed_pawns[GameBoard.Players.PLAYER1]:
+                    bitboard.player1_pawns |= square_bit
+                else:
+                    bitboard.player2_pawns |= square_bit
+                if board_el in (GameBoard.BoardSigns.PLAYER1_KING.value,
+                                GameBoard.BoardSigns.PLAYER2_KING.value):
+                    bitboard.kings |= square_bit
+        return bitboard
+
+    def _convert_bitboard_to_board(self, bitboard):
+        """
+        Converts bitboard to the two dimensional board
+        :param bitboard: BitBoard object
+        :return: Two dimensional board in a form of lists
+        """
+        board = [
+            [GameBoard.BoardSigns.EMPTY_BLACK.value if x % 2 == y % 2 else
+             GameBoard.BoardSigns.EMPTY_WHITE.value for x in range(self.board_size)]
+            for y in range(self.board_size)]
+        pawns_signs = (
+            (bitboard.player1_pawns, GameBoard.BoardSigns.PLAYER1_CHECKER.value,
+             GameBoard.BoardSigns.PLAYER1_KING.value),
+            (bitboard.player2_pawns, GameBoard.BoardSigns.PLAYER2_CHECKER.value,
+             GameBoard.BoardSigns.PLAYER2_KING.value)
+        )
+        for pawns, checker_sign, king_sign in pawns_signs:
+            for square in iterate_squares(pawns):
+                x_ind, y_ind = square_to_xy(square)
+                board[y_ind][x_ind] = king_sign if bitboard.kings >> square & 1 else checker_sign
+        return board
+
     def get_possible_moves(self, player_id, actual_board):
         """
         :param player_id: Id of the player that all moves will be find
@@ -111,6 +202,11 @@ class GameBoard(GameBoardABC):
         :return: List of possible moves in a form of list of strings with move
         in UCI format
         """
+        if isinstance(actual_board, BitBoard):
+            return actual_board.get_possible_moves(player_id.value)
+        if isinstance(actual_board, tuple):
+            actual_board = self.get_board_copy(actual_board)
+
         players_pawns = self._find_players_pawns(player_id, actual_board)
         all_possible_moves = []
 
@@ -124,14 +220,50 @@ class GameBoard(GameBoardABC):
             except InvalidMoveException:
                 pass
             else:
-                start_ind_str = CoordsFormatter.translate_from_xy_to_uci(
-                    start_x_ind, start_y_ind)
+                start_ind_str = SQUARE_NAMES[xy_to_square(start_x_ind, start_y_ind)]
                 for end_indexes, pawns_to_remove in possible_moves_for_pawn:
-                    end_ind_str = CoordsFormatter.translate_from_xy_to_uci(
-                        *end_indexes)
+                    end_ind_str = SQUARE_NAMES[xy_to_square(*end_indexes)]
                     all_possible_moves.append(start_ind_str + end_ind_str)
         return all_possible_moves
 
+    def get_legal_moves(self, player_id, actual_board):
+        """
+        Finds moves for the player in a form used inside search. Capture
+        sequences with the same start and end field are reduced to the first
+        one, the same as the move in UCI format is understood by make_move
+        :param player_id: Id of the player that all moves will be find
+        :param actual_board: Board to find the moves on
+        :return: List of CheckersMove objects
+        """
+        if isinstance(actual_board, BitBoard):
+            return actual_board.get_legal_moves(player_id.value)
+        if isinstance(actual_board, tuple):
+            actual_board = self.get_board_copy(actual_board)
+
+        legal_moves = []
+        for start_x_ind, start_y_ind, start_pawn_type in self._find_players_pawns(
+                player_id, actual_board):
+            try:
+                possible_moves_for_pawn = self._find_moves_for_pawn(
+                    x_ind=start_x_ind,
+                    y_ind=start_y_ind,
+                    player_id=player_id,
+                    board=actual_board)
+            except InvalidMoveException:
+                continue
+            start_square = xy_to_square(start_x_ind, start_y_ind)
+            found_end_squares = set()
+            for end_indexes, pawns_to_remove in possible_moves_for_pawn:
+                end_square = xy_to_square(*end_indexes)
+                if end_square in found_end_squares:
+                    continue
+                found_end_squares.add(end_square)
+                captured = 0
+                for rem_indexes in pawns_to_remove:
+                    captured |= 1 << xy_to_square(*rem_indexes)
+                legal_moves.append(CheckersMove(start_square, end_square, captured))
+        return legal_moves
+
     def fill_board_with_starting_positions(self, board_to_fill=None):
         """
         Fills board with starting pawns positions
@@ -157,6 +289,13 @@ class GameBoard(GameBoardABC):
         Checks the state of the game for the actual player
         :return: Game state in a form of GameStates enum
         """
+        if isinstance(board, BitBoard):
+            game_state = board.check_game_state(player_id.value)
+            if game_state == GameStates.ONGOING and \
+                    self.move_count == GameBoard.max_moves_without_capture:
+                return GameStates.DRAW
+            return game_state
+
         if isinstance(board, tuple):
             board = self.get_board_copy(board)
 
@@ -203,9 +342,14 @@ class GameBoard(GameBoardABC):
         :param board: Board on which the given move will be done
         :type player_id: Players enum value
         :param player_id: Which player is moving
-        :param move_coords: Move coords in UCI format
-        :return: Board after making move
+        :param move_coords: Move coords in UCI format or CheckersMove found by
+        get_legal_moves, which is not validated again
+        :return: Board after making move, new BitBoard object when bitboard
+        was given
         """
+        if isinstance(board, BitBoard):
+            return board.make_move(player_id.value, move_coords)
+
         was_tuple = False
         if isinstance(board, tuple):
             board = self.get_board_copy(board)
@@ -215,8 +359,79 @@ class GameBoard(GameBoardABC):
         if board is None:
             board = self.board_arrays
             changing_class_board = True
-        move_pattern = re.compile('[a-z][0-9]+')
-        move_coords_as_list = move_pattern.findall(move_coords)
+
+        start_indexes, end_indexes, pawn_rem_list = self._find_move(
+            player_id, move_coords, board)
+        self._apply_found_move(start_indexes, end_indexes, pawn_rem_list, board,
+                               changing_class_board)
+
+        if was_tuple:
+            return self.get_board_copy(board, copy_format='tuple')
+        return board
+
+    def apply_move(self, player_id, move_coords, board=None):
+        """
+        Makes move in place on the given board and returns record that lets
+        undo it, so search can go through the positions without copying boards
+        :param player_id: Which player is moving
+        :param move_coords: Move coords in UCI format or CheckersMove found by
+        get_legal_moves, which is not validated again
+        :param board: Board in a form of lists or BitBoard, class board when
+        not specified
+        :return: MoveUndoRecord (BitBoardUndoRecord for bitboards)
+        """
+        if isinstance(board, BitBoard):
+            return board.apply_move(player_id.value, move_coords)
+
+        changing_class_board = False
+        if board is None:
+            board = self.board_arrays
+            changing_class_board = True
+
+        start_indexes, end_indexes, pawn_rem_list = self._find_move(
+            player_id, move_coords, board)
+        return self._apply_found_move(start_indexes, end_indexes, pawn_rem_list, board,
+                                      changing_class_board)
+
+    def undo_move(self, undo_record, board=None):
+        """
+        Restores the board to the state before the move made by apply_move
+        :param undo_record: Record returned by apply_move
+        :param board: Board on which the move was made, class board when not
+        specified
+        :return:
+        """
+        if isinstance(board, BitBoard):
+            board.undo_move(undo_record)
+            return
+
+        if board is None:
+            board = self.board_arrays
+
+        for (x_rm_ind, y_rm_ind), removed_pawn in reversed(undo_record.captured_pawns):
+            board[y_rm_ind][x_rm_ind] = removed_pawn
+        start_x_ind, start_y_ind = undo_record.start
+        end_x_ind, end_y_ind = undo_record.end
+        board[end_y_ind][end_x_ind] = GameBoard.BoardSigns.EMPTY_BLACK.value
+        board[start_y_ind][start_x_ind] = undo_record.moved_pawn
+        if undo_record.previous_move_count is not None:
+            self.move_count = undo_record.previous_move_count
+
+    def _find_move(self, player_id, move_coords, board):
+        """
+        Validates move in UCI format and finds it between the moves possible
+        for the pawn, CheckersMove is only translated to the board indexes
+        :param player_id: Which player is moving
+        :param move_coords: Move coords in UCI format or CheckersMove
+        :param board: Board in a form of lists
+        :return: Start indexes, end indexes and list of indexes of pawns to be
+        removed
+        """
+        if isinstance(move_coords, CheckersMove):
+            return SQUARE_FIELDS[move_coords.start], SQUARE_FIELDS[move_coords.end], \
+                [SQUARE_FIELDS[square] for square in move_coords.get_captured_squares()]
+
+        move_coords_as_list = GameBoard.move_pattern.findall(move_coords)
         if len(move_coords_as_list) != 2:
             raise InvalidMoveException("Invalid move format")
         start_x_ind, start_y_ind = CoordsFormatter.translate_from_uci_to_xy(move_coords_as_list[0])
@@ -232,39 +447,47 @@ class GameBoard(GameBoardABC):
             board=board
         )
 
-        move_done = False
         for mov_ind, pawn_rem_list in possible_moves:
             if (end_x_ind, end_y_ind) == mov_ind:
-                if changing_class_board:
-                    self.move_count += 1
-                board[end_y_ind][end_x_ind] = \
-                    board[start_y_ind][start_x_ind]
-                board[start_y_ind][start_x_ind] = GameBoard.BoardSigns.EMPTY_BLACK.value
-                self.__change_checker_to_king_if_can(end_x_ind, end_y_ind, board)
-
-                for x_rm_ind, y_rm_ind in pawn_rem_list:
-                    if changing_class_board:
-                        self.move_count = 0
-                    if changing_class_board:
-                        self.board_arrays = self.get_board_without_pawn(
-                            board_to_get=self.board_arrays,
-                            rem_pawn_x=x_rm_ind,
-                            rem_pawn_y=y_rm_ind
-                        )
-                        board = self.board_arrays
-                    else:
-                        board = self.get_board_without_pawn(
-                            board_to_get=board,
-                            rem_pawn_x=x_rm_ind,
-                            rem_pawn_y=y_rm_ind
-                        )
-                move_done = True
-                break
-        if not move_done:
-            raise InvalidMoveException("Wrong move coordinates given")
-        if was_tuple:
-            return self.get_board_copy(board, copy_format='tuple')
-        return board
+                return (start_x_ind, start_y_ind), mov_ind, pawn_rem_list
+        raise InvalidMoveException("Wrong move coordinates given")
+
+    def _apply_found_move(self, start_indexes, end_indexes, pawn_rem_list, board,
+                          changing_class_board=False):
+        """
+        Moves the pawn in place, promotes it when it gets to the end of the
+        board and removes captured pawns
+        :param start_indexes: (x_ind, y_ind) of the moving pawn
+        :param end_indexes: (x_ind, y_ind) of the destination field
+        :param pawn_rem_list: List of (x_ind, y_ind) of captured pawns
+        :param board: Board in a form of lists
+        :param changing_class_board: Should the moves without capture counter
+        be updated
+        :return: MoveUndoRecord
+        """
+        start_x_ind, start_y_ind = start_indexes
+        end_x_ind, end_y_ind = end_indexes
+
+        previous_move_count = None
+        if changing_class_board:
+            previous_move_count = self.move_count
+            self.move_count = 0 if pawn_rem_list else self.move_count + 1
+
+        moved_pawn = board[start_y_ind][start_x_ind]
+        board[end_y_ind][end_x_ind] = moved_pawn
+        board[start_y_ind][start_x_ind] = GameBoard.BoardSigns.EMPTY_BLACK.value
+        self.__change_checker_to_king_if_can(end_x_ind, end_y_ind, board)
+        promoted = board[end_y_ind][end_x_ind] != moved_pawn
+
+        captured_pawns = []
+        for x_rm_ind, y_rm_ind in pawn_rem_list:
+            removed_pawn = board[y_rm_ind][x_rm_ind]
+            if removed_pawn != GameBoard.BoardSigns.EMPTY_BLACK.value:
+                captured_pawns.append(((x_rm_ind, y_rm_ind), removed_pawn))
+                board[y_rm_ind][x_rm_ind] = GameBoard.BoardSigns.EMPTY_BLACK.value
+
+        return MoveUndoRecord(start_indexes, end_indexes, moved_pawn, tuple(captured_pawns),
+                              promoted, previous_move_count)
 
     def __change_checker_to_king_if_can(self, end_x_ind, end_y_ind, board=None):
         """
@@ -304,9 +527,8 @@ class GameBoard(GameBoardABC):
         if board is None:
             board = self.board_arrays
 
-        board_to_check = self.get_board_copy(board)
         board_el = self.get_board_element_enum(
-            x_ind=x_ind, y_ind=y_ind, board=board_to_check)
+            x_ind=x_ind, y_ind=y_ind, board=board)
 
         if board_el in GameBoard.checker_pawns:
             pawn_range = 1
@@ -322,7 +544,7 @@ class GameBoard(GameBoardABC):
             player_id=player_id,
             x_ind=x_ind,
             y_ind=y_ind,
-            board_2d_container=board_to_check,
+            board_2d_container=board,
             check_backwards=True
         )
 
@@ -339,14 +561,14 @@ class GameBoard(GameBoardABC):
                     board=board
                 )
         else:
-            if self._check_for_other_captures(player_id, board_to_check):
+            if self._check_for_other_captures(player_id, board):
                 raise InvalidMoveException("You must make moves with captures possibility first")
             else:
                 moves_list += self._find_simple_moves(
                     pawn_range=pawn_range,
                     x_ind=x_ind,
                     y_ind=y_ind,
-                    board_to_check=board_to_check,
+                    board_to_check=board,
                     player_id=player_id,
                     check_backwards=check_backwards
                 )
@@ -394,48 +616,44 @@ class GameBoard(GameBoardABC):
         if board is None:
             board = self.get_board_copy(self.board_arrays)
 
-        next_x_ind = cap_x_ind
-        next_y_ind = cap_y_ind
-
         capture_moves = []
+        empty_field = GameBoard.BoardSigns.EMPTY_BLACK.value
+
+        # Captured pawn is removed in place for finding next captures and put
+        # back when all of them are found
+        captured_pawn = board[cap_y_ind][cap_x_ind]
+        new_container = board
+
+        ray = GameBoard.diagonal_rays[cap_y_ind][cap_x_ind][direction.value]
+        for next_x_ind, next_y_ind in ray[:pawn_range]:
+            if board[next_y_ind][next_x_ind] == empty_field:
+                cap_positions.append((cap_x_ind, cap_y_ind))
+                new_container[cap_y_ind][cap_x_ind] = empty_field
 
-        try:
-            for i in range(pawn_range):
-                next_x_ind, next_y_ind, next_el = self._find_next_cross_tab_el(
-                    next_x_ind, next_y_ind, direction, board_arrays=board)
-                if next_el == GameBoard.BoardSigns.EMPTY_BLACK.value:
-                    cap_positions.append((cap_x_ind, cap_y_ind))
-                    new_container = self.get_board_without_pawn(
-                        board_to_get=board,
-                        rem_pawn_x=cap_x_ind,
-                        rem_pawn_y=cap_y_ind
-                    )
-
-                    pos_cap_postions = self._find_captures_positions(
-                        pawn_range=pawn_range,
-                        player_id=player_id,
-                        x_ind=next_x_ind,
-                        y_ind=next_y_ind,
-                        check_backwards=True,
-                        board_2d_container=new_container
-                    )
-                    if not pos_cap_postions:
-                        capture_moves.append(((next_x_ind, next_y_ind), cap_positions))
-                    else:
-                        for cap_x_pos, cap_y_pos, cap_dir in pos_cap_postions:
-                            capture_moves += self._find_capture_moves(
-                                cap_x_ind=cap_x_pos,
-                                cap_y_ind=cap_y_pos,
-                                direction=cap_dir,
-                                pawn_range=pawn_range,
-                                player_id=player_id,
-                                board=new_container,
-                                cap_positions=list(cap_positions)
-                            )
+                pos_cap_postions = self._find_captures_positions(
+                    pawn_range=pawn_range,
+                    player_id=player_id,
+                    x_ind=next_x_ind,
+                    y_ind=next_y_ind,
+                    check_backwards=True,
+                    board_2d_container=new_container
+                )
+                if not pos_cap_postions:
+                    capture_moves.append(((next_x_ind, next_y_ind), cap_positions))
                 else:
-                    break
-        except MoveCheckOutsideOfArray:
-            pass
+                    for cap_x_pos, cap_y_pos, cap_dir in pos_cap_postions:
+                        capture_moves += self._find_capture_moves(
+                            cap_x_ind=cap_x_pos,
+                            cap_y_ind=cap_y_pos,
+                            direction=cap_dir,
+                            pawn_range=pawn_range,
+                            player_id=player_id,
+                            board=new_container,
+                            cap_positions=list(cap_positions)
+                        )
+                new_container[cap_y_ind][cap_x_ind] = captured_pawn
+            else:
+                break
 
         return capture_moves
 
@@ -470,29 +688,19 @@ class GameBoard(GameBoardABC):
         (x_ind, y_ind, direction) tuples
         """
         if check_backwards:
-            directions = [x for x in GameBoard.Direction]
+            directions = GameBoard.all_directions
         else:
             directions = GameBoard.players_checkers_directions[player_id]
 
-        # directions = [x for x in GameBoard.Direction] if check_backwards else [
-        #     GameBoard.Direction.LEFT_UP, GameBoard.Direction.RIGHT_UP]
-
         enemy_pawns = GameBoard.allowed_pawns[GameBoard.opposite_player[player_id]]
 
         possible_captures = []
 
         for direction in directions:
-            try:
-                next_x_ind = x_ind
-                next_y_ind = y_ind
-
-                capture_pawn_indexes_and_direction = self.__find_capture_in_given_dir(
-                    pawn_range, direction, enemy_pawns, board_2d_container, next_x_ind, next_y_ind)
-                if capture_pawn_indexes_and_direction is not None:
-                    possible_captures.append(capture_pawn_indexes_and_direction)
-
-            except MoveCheckOutsideOfArray:
-                pass
+            capture_pawn_indexes_and_direction = self.__find_capture_in_given_dir(
+                pawn_range, direction, enemy_pawns, board_2d_container, x_ind, y_ind)
+            if capture_pawn_indexes_and_direction is not None:
+                possible_captures.append(capture_pawn_indexes_and_direction)
 
         return possible_captures
 
@@ -504,23 +712,23 @@ class GameBoard(GameBoardABC):
         :param direction: Direction in which check will be don
         :param enemy_pawns: Tuple of enemy pawns
         :param board_2d_container: Board arrays in a form of two dimensional tuples
-        :param next_x_ind: Starting x index, that will iterate
-        :param next_y_ind: Starting y index, that will iterate
+        :param next_x_ind: X index of the pawn
+        :param next_y_ind: Y index of the pawn
         :return: X ind, Y ind, direction of given capture move, None when capture is not found
         """
-        for i in range(pawn_range):
-            next_x_ind, next_y_ind, next_el = \
-                self._find_next_cross_tab_el(next_x_ind, next_y_ind, direction, board_2d_container)
-            if next_el in enemy_pawns:
-                check_x_ind, check_y_ind, check_el = self._find_next_cross_tab_el(
-                    next_x_ind, next_y_ind, direction, board_2d_container)
-                if check_el == GameBoard.BoardSigns.EMPTY_BLACK.value:
-                    return next_x_ind, next_y_ind, direction
+        empty_field = GameBoard.BoardSigns.EMPTY_BLACK.value
+        ray = GameBoard.diagonal_rays[next_y_ind][next_x_ind][direction.value]
+        for ray_ind, (ray_x_ind, ray_y_ind) in enumerate(ray[:pawn_range]):
+            ray_el = board_2d_container[ray_y_ind][ray_x_ind]
+            if ray_el in enemy_pawns:
+                if ray_ind + 1 < len(ray):
+                    check_x_ind, check_y_ind = ray[ray_ind + 1]
+                    if board_2d_container[check_y_ind][check_x_ind] == empty_field:
+                        return ray_x_ind, ray_y_ind, direction
                 return None
-            elif next_el == GameBoard.BoardSigns.EMPTY_BLACK.value:
-                pass
-            else:
+            elif ray_el != empty_field:
                 return None
+        return None
 
     def _find_simple_moves(self, pawn_range, x_ind, y_ind, board_to_check, player_id,
                            check_backwards=False):
@@ -535,30 +743,24 @@ class GameBoard(GameBoardABC):
         :return: List with possible move indexes
         """
         if check_backwards:
-            directions = [x for x in GameBoard.Direction]
+            directions = GameBoard.all_directions
         else:
             directions = GameBoard.players_checkers_directions[player_id]
 
-        # directions = [x for x in GameBoard.Direction] if check_backwards else [
-        #     GameBoard.Direction.LEFT_UP, GameBoard.Direction.RIGHT_UP]
+        empty_field = GameBoard.BoardSigns.EMPTY_BLACK.value
+        field_rays = GameBoard.diagonal_rays[y_ind][x_ind]
 
         possible_moves = []
 
         for direction in directions:
-            try:
-                next_x_ind = x_ind
-                next_y_ind = y_ind
-                for i in range(pawn_range):
-                    next_x_ind, next_y_ind, next_el = self._find_next_cross_tab_el(
-                        next_x_ind, next_y_ind, direction, board_to_check)
-                    if next_el == GameBoard.BoardSigns.EMPTY_BLACK.value:
-                        possible_moves.append(((next_x_ind, next_y_ind), []))
-                    elif next_el == GameBoard.BoardSigns.EMPTY_WHITE.value:
-                        raise TypeError("Incorrect white value field")
-                    else:
-                        break
-            except MoveCheckOutsideOfArray:
-                pass
+            for next_x_ind, next_y_ind in field_rays[direction.value][:pawn_range]:
+                next_el = board_to_check[next_y_ind][next_x_ind]
+                if next_el == empty_field:
+                    possible_moves.append(((next_x_ind, next_y_ind), []))
+                elif next_el == GameBoard.BoardSigns.EMPTY_WHITE.value:
+                    raise TypeError("Incorrect white value field")
+                else:
+                    break
         return possible_moves
 
     def _find_players_pawns(self, player_id, board=None):
@@ -593,27 +795,14 @@ class GameBoard(GameBoardABC):
         if board_arrays is None:
             board_arrays = self.board_arrays
 
-        direction_map = {
-            GameBoard.Direction.LEFT_UP: (x_ind - 1, y_ind + 1),
-            GameBoard.Direction.RIGHT_UP: (x_ind + 1, y_ind + 1),
-            GameBoard.Direction.RIGHT_DOWN: (x_ind + 1, y_ind - 1),
-            GameBoard.Direction.LEFT_DOWN: (x_ind - 1, y_ind - 1)
-        }
-
-        new_x_ind, new_y_ind = direction_map[direction]
-
-        if new_x_ind < 0 or new_y_ind < 0:
+        ray = GameBoard.diagonal_rays[y_ind][x_ind][direction.value]
+        if not ray:
             raise MoveCheckOutsideOfArray(
                 "_find_next_cross_tab_el in checkers game board class has"
                 "moved outside the array")
 
-        try:
-            el_to_ret = board_arrays[new_y_ind][new_x_ind]
-        except IndexError:
-            raise MoveCheckOutsideOfArray(
-                "_find_next_cross_tab_el in checkers game board class has"
-                "moved outside the array")
-        return new_x_ind, new_y_ind, el_to_ret
+        new_x_ind, new_y_ind = ray[0]
+        return new_x_ind, new_y_ind, board_arrays[new_y_ind][new_x_ind]
 
     def get_board_element_enum(self, x_ind, y_ind, board=None):
         """
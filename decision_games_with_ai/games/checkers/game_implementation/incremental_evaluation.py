@@ -0,0 +1,154 @@
+"""Module providing evaluation of the checkers position updated along with the
+moves made during the search. Numbers of checkers and kings of both players and
+sums of their positional weights are kept, a move changes only its start, end
+and captured squares, so only they are counted again"""
+from decision_games_with_ai.games.checkers.game_implementation.bitboard import BitBoard
+from decision_games_with_ai.games.checkers.game_implementation.checkers_move import \
+    SQUARE_FIELDS, SQUARES_NUM
+from decision_games_with_ai.games.checkers.game_implementation.game_board import GameBoard
+
+# Indexes of the counters in the totals list
+PLAYER1_CHECKERS, PLAYER1_KINGS, PLAYER2_CHECKERS, PLAYER2_KINGS, PLAYER1_POSITIONAL, \
+    PLAYER2_POSITIONAL = range(6)
+
+SIGNS_COUNTERS = {
+    GameBoard.BoardSigns.PLAYER1_CHECKER.value: PLAYER1_CHECKERS,
+    GameBoard.BoardSigns.PLAYER1_KING.value: PLAYER1_KINGS,
+    GameBoard.BoardSigns.PLAYER2_CHECKER.value: PLAYER2_CHECKERS,
+    GameBoard.BoardSigns.PLAYER2_KING.value: PLAYER2_KINGS
+}
+
+
+class IncrementalEvaluation:
+    """Class keeping the evaluation of one board, the board is modified in
+    place by the search and every move is reported with before_move and
+    after_move, and every undo with undo. With the default weights the values
+    are the same as given by CheckersTreeBuilder._static_evaluation_value"""
+
+    def __init__(self, checker_weight=1, king_weight=8, positional_weights=None):
+        """
+        :param checker_weight: Value of the checker
+        :param king_weight: Value of the king
+        :param positional_weights: Sequence of 32 values added for the pawn
+        standing on the square, given for the first player, the second player
+        gets them rotated by 180 degrees, None for no positional values
+        """
+        self.checker_weight = checker_weight
+        self.king_weight = king_weight
+        if positional_weights is None:
+            positional_weights = [0] * SQUARES_NUM
+        if len(positional_weights) != SQUARES_NUM:
+            raise ValueError("Positional weights have to be given for {} squares".format(
+                SQUARES_NUM))
+        self.positional_weights = tuple(positional_weights)
+        self.player2_positional_weights = self.positional_weights[::-1]
+        self.board = None
+        self.totals = [0] * 6
+        self.history = []
+
+    def reset(self, board):
+        """
+        Starts keeping the evaluation of the board, counts it from scratch
+        :param board: Board in lists or BitBoard representation, modified in
+        place by the search
+        """
+        self.board = board
+        self.totals = self.get_squares_totals(board, range(SQUARES_NUM))
+        self.history = []
+
+    def tracks(self, board):
+        """
+        :param board: Board of the search
+        :return: True if the evaluation is kept for the board
+        """
+        return board is self.board
+
+    def before_move(self, move):
+        """
+        Remembers the squares of the move before it is applied on the board
+        :param move: CheckersMove that is going to be applied
+        """
+        move_squares = (move.start, move.end) + tuple(move.get_captured_squares())
+        self.history.append((self.totals, move_squares,
+                             self.get_squares_totals(self.board, move_squares)))
+
+    def after_move(self):
+        """
+        Updates the counters with the squares changed by the move applied on
+        the board
+        """
+        totals, move_squares, squares_totals_before = self.history[-1]
+        squares_totals_after = self.get_squares_totals(self.board, move_squares)
+        self.totals = [total - before + after for total, before, after in zip(
+            totals, squares_totals_before, squares_totals_after)]
+
+    def undo(self):
+        """
+        Restores the counters from before the last move
+        """
+        self.totals = self.history.pop()[0]
+
+    def get_value(self, player):
+        """
+        :param player: Player for which the board is evaluated
+        :return: Value of the kept board
+        """
+        return self.get_totals_value(self.totals, player)
+
+    def evaluate_board(self, board, player):
+        """
+        Evaluates other board from scratch with the same weights
+        :param board: Board in lists or BitBoard representation
+        :param player: Player for which the board is evaluated
+        :return: Value of the board
+        """
+        return self.get_totals_value(self.get_squares_totals(board, range(SQUARES_NUM)),
+                                     player)
+
+    def get_totals_value(self, totals, player):
+        """
+        :param totals: List of the counters
+        :param player: Player for which the counters are evaluated
+        :return: Value of the counters
+        """
+        value = (totals[PLAYER1_CHECKERS] - totals[PLAYER2_CHECKERS]) * self.checker_weight + \
+            (totals[PLAYER1_KINGS] - totals[PLAYER2_KINGS]) * self.king_weight + \
+            totals[PLAYER1_POSITIONAL] - totals[PLAYER2_POSITIONAL]
+        if player == GameBoard.Players.PLAYER2:
+            return -value
+        return value
+
+    def get_squares_totals(self, board, squares):
+        """
+        Counts pawns standing on the given squares
+        :param board: Board in lists or BitBoard representation
+        :param squares: Iterable of square indexes
+        :return: List of the counters
+        """
+        totals = [0] * 6
+        player1_weights = self.positional_weights
+        player2_weights = self.player2_positional_weights
+        if isinstance(board, BitBoard):
+            player1_pawns = board.player1_pawns
+            player2_pawns = board.player2_pawns
+            kings = board.kings
+            for square in squares:
+                if player1_pawns >> square & 1:
+                    totals[PLAYER1_KINGS if kings >> square & 1 else PLAYER1_CHECKERS] += 1
+                    totals[PLAYER1_POSITIONAL] += player1_weights[square]
+                elif player2_pawns >> square & 1:
+                    totals[PLAYER2_KINGS if kings >> square & 1 else PLAYER2_CHECKERS] += 1
+                    totals[PLAYER2_POSITIONAL] += player2_weights[square]
+            return totals
+
+        for square in squares:
+            x_ind, y_ind = SQUARE_FIELDS[square]
+            counter = SIGNS_COUNTERS.get(board[y_ind][x_ind])
+            if counter is None:
+                continue
+            totals[counter] += 1
+            if counter <= PLAYER1_KINGS:
+                totals[PLAYER1_POSITIONAL] += player1_weights[square]
+            else:
+                totals[PLAYER2_POSITIONAL] += player2_weights[square]
+        return totals
@@ -0,0 +1,147 @@
+"""Module providing Zobrist keys of the checkers positions. Key of the position
+is the xor of random numbers assigned to each (square, pawn sign) pair on the
+board and to the player to move, so after the move it can be updated only with
+the squares that the move has changed.
+
+Position with the colours of the pawns swapped and the board rotated by 180
+degrees, with the other player to move, is the same position for the player
+to move. With the symmetry used the key keeps the keys of both positions in
+its upper and lower bits, so both of them are updated with one xor"""
+import random
+
+from decision_games_with_ai.games.checkers.game_implementation.bitboard import BitBoard
+from decision_games_with_ai.games.checkers.game_implementation.checkers_move import \
+    SQUARE_FIELDS, SQUARES_NUM
+from decision_games_with_ai.games.checkers.game_implementation.game_board import GameBoard
+
+KEY_BITS = 64
+KEY_MASK = (1 << KEY_BITS) - 1
+
+
+class ZobristHashing:
+    """Class providing computing and incremental updating of the position keys
+    for both board representations"""
+
+    pawns_signs = (
+        GameBoard.BoardSigns.PLAYER1_CHECKER.value,
+        GameBoard.BoardSigns.PLAYER1_KING.value,
+        GameBoard.BoardSigns.PLAYER2_CHECKER.value,
+        GameBoard.BoardSigns.PLAYER2_KING.value
+    )
+
+    # Signs of the pawns after swapping their colours
+    mirrored_signs = {
+        GameBoard.BoardSigns.PLAYER1_CHECKER.value: GameBoard.BoardSigns.PLAYER2_CHECKER.value,
+        GameBoard.BoardSigns.PLAYER1_KING.value: GameBoard.BoardSigns.PLAYER2_KING.value,
+        GameBoard.BoardSigns.PLAYER2_CHECKER.value: GameBoard.BoardSigns.PLAYER1_CHECKER.value,
+        GameBoard.BoardSigns.PLAYER2_KING.value: GameBoard.BoardSigns.PLAYER1_KING.value
+    }
+
+    def __init__(self, seed=0, use_symmetry=False):
+        """
+        :param seed: Seed of the random numbers, the same seed gives the same
+        keys
+        :param use_symmetry: When set, keys contain also the key of the
+        mirrored position and get_table_key gives the same key for both
+        """
+        rng = random.Random(seed)
+        self.use_symmetry = use_symmetry
+        self.squares_keys = tuple(
+            {sign: rng.getrandbits(KEY_BITS) for sign in self.pawns_signs}
+            for _ in range(SQUARES_NUM)
+        )
+        player2_key = rng.getrandbits(KEY_BITS)
+        # Keys xored for the player to move, their xor is applied after
+        # every move
+        self.players_keys = {
+            GameBoard.Players.PLAYER1: 0,
+            GameBoard.Players.PLAYER2: player2_key
+        }
+        if use_symmetry:
+            self.squares_keys = tuple(
+                {sign: square_key << KEY_BITS |
+                    self.squares_keys[SQUARES_NUM - 1 - square][self.mirrored_signs[sign]]
+                 for sign, square_key in square_keys.items()}
+                for square, square_keys in enumerate(self.squares_keys)
+            )
+            self.players_keys = {
+                GameBoard.Players.PLAYER1: player2_key,
+                GameBoard.Players.PLAYER2: player2_key << KEY_BITS
+            }
+        self.turn_key = self.players_keys[GameBoard.Players.PLAYER1] ^ \
+            self.players_keys[GameBoard.Players.PLAYER2]
+
+    def get_board_key(self, board, player_id):
+        """
+        Computes key of the position from scratch
+        :param board: Board in lists, tuples or BitBoard representation
+        :param player_id: Player to move
+        :return: Key of the position
+        """
+        return self.get_squares_key(board, range(SQUARES_NUM)) ^ self.players_keys[player_id]
+
+    def get_squares_key(self, board, squares):
+        """
+        Computes xor of the keys of pawns standing on the given squares
+        :param board: Board in lists, tuples or BitBoard representation
+        :param squares: Iterable of square indexes
+        :return: Part of the key made by the given squares
+        """
+        key = 0
+        if isinstance(board, BitBoard):
+            for square in squares:
+                bit = 1 << square
+                if board.player1_pawns & bit:
+                    sign = GameBoard.BoardSigns.PLAYER1_KING.value if board.kings & bit \
+                        else GameBoard.BoardSigns.PLAYER1_CHECKER.value
+                elif board.player2_pawns & bit:
+                    sign = GameBoard.BoardSigns.PLAYER2_KING.value if board.kings & bit \
+                        else GameBoard.BoardSigns.PLAYER2_CHECKER.value
+                else:
+                    continue
+                key ^= self.squares_keys[square][sign]
+            return key
+
+        for square in squares:
+            x_ind, y_ind = SQUARE_FIELDS[square]
+            square_key = self.squares_keys[square].get(board[y_ind][x_ind])
+            if square_key is not None:
+                key ^= square_key
+        return key
+
+    @staticmethod
+    def get_move_squares(move):
+        """
+        :param move: CheckersMove object
+        :return: Tuple of squares that can be changed by the move
+        """
+        return (move.start, move.end) + tuple(move.get_captured_squares())
+
+    def get_key_after_move(self, key, move_squares, squares_key_before, board):
+        """
+        Updates key of the position after the move was applied on the board
+        :param key: Key of the position before the move
+        :param move_squares: Squares returned by get_move_squares for the move
+        :param squares_key_before: Value of get_squares_key for the move
+        squares computed before the move was applied
+        :param board: Board after the move
+        :return: Key of the position after the move
+        """
+        return key ^ squares_key_before ^ self.get_squares_key(board, move_squares) ^ \
+            self.turn_key
+
+    def get_table_key(self, key):
+        """
+        Gives the key under which the position is kept in the transposition
+        table, the same for the position and its mirror when symmetry is used
+        :param key: Key of the position
+        :return: Tuple of the table key and the flag telling if the moves of
+        the position have to be mirrored for the table
+        """
+        if not self.use_symmetry:
+            return key, False
+        key_mirrored = key & KEY_MASK
+        key >>= KEY_BITS
+        if key_mirrored < key:
+            return key_mirrored, True
+        return key, False
@@ -1,21 +1,48 @@
 """Module responsible for building of the decision trees of tic tac toe game"""
 import datetime
+import multiprocessing
+import pickle
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from math import log, sqrt
-from random import choice
+from random import choice, getrandbits, randrange
 
 from anytree import Node, RenderTree
 from anytree.exporter import DotExporter
 
+from decision_games_with_ai.games.checkers.game_implementation.bitboard import BitBoard, \
+    count_squares
+from decision_games_with_ai.games.checkers.game_implementation.checkers_move import \
+    CheckersMove
 from decision_games_with_ai.games.checkers.game_implementation.game_board import GameBoard
+from decision_games_with_ai.games.checkers.game_implementation.zobrist_hashing import \
+    ZobristHashing
 from decision_games_with_ai.games.tree_builder_abc import TreeBuilderABC
 
 import anytree
 
-from decision_games_with_ai.games.utils.global_enums import GameStates, SearchMethods
+from decision_games_with_ai.games.utils.events_exceptions import SearchTimeout
+from decision_games_with_ai.games.utils.global_enums import GameStates, \
+    MonteCarloParallelization, SearchMethods
+from decision_games_with_ai.games.utils.monte_carlo import MonteCarloMoveStats, \
+    MonteCarloNode, MonteCarloNodesLimit, SimulationLimits
+from decision_games_with_ai.games.utils import parallel_alphabeta
+from decision_games_with_ai.games.utils.parallel_monte_carlo import run_independent_search, \
+    run_play_outs
+from decision_games_with_ai.games.utils.transposition_table import ENTRY_SIZE, \
+    TranspositionTable
 
 MIN_VAL = -100000
 MAX_VAL = 100000
+# Scores of the game ends are moved from the bounds by the number of plies to
+# the end, which is lower than MAX_PLY
+MAX_PLY = 1000
+
+QuiescenceStats = namedtuple('QuiescenceStats', ['nodes', 'max_depth', 'limit_hits'])
+QuiescenceStats.__doc__ = """Number of positions searched by the quiescence
+search, the longest searched capture sequence and number of times the search
+was cut by the node limit"""
 
 
 class CheckersTreeBuilder(TreeBuilderABC):
@@ -58,28 +85,113 @@ class CheckersTreeBuilder(TreeBuilderABC):
 
     }
 
-    def __init__(self, game):
+    def __init__(self, game, use_bitboard=False, transposition_table_size_mb=None,
+                 replacement_policy=TranspositionTable.ReplacementPolicy.DEPTH_PREFERRED,
+                 max_tree_nodes=None,
+                 eviction_policy=MonteCarloNodesLimit.EvictionPolicy.LEAST_VISITED,
+                 move_orderer=None, use_quiescence=False, quiescence_nodes_limit=100000,
+                 batch_evaluator=None, incremental_evaluation=None, use_symmetries=False,
+                 endgame_database=None):
+        """
+        :param game: Game object which the trees will be built for
+        :param use_bitboard: When set, positions are kept in the BitBoard
+        representation during search, which is much faster than the lists one
+        :param transposition_table_size_mb: Size of the transposition table
+        used by alpha beta search, the table is kept between the moves, None
+        disables it
+        :param replacement_policy: TranspositionTable.ReplacementPolicy enum
+        value used by the transposition table
+        :param max_tree_nodes: Maximal number of nodes of the monte carlo
+        tree, None for no limit
+        :param eviction_policy: MonteCarloNodesLimit.EvictionPolicy enum value
+        deciding which nodes are removed when the tree reaches the limit
+        :param move_orderer: MoveOrderer object ordering moves of alpha beta
+        search, e.g. MoveOrderer(CheckersMove.get_captures_num), None keeps
+        the moves in the order of the board
+        :param use_quiescence: When set, alpha beta and pvs searches do not
+        stop at the search depth in the middle of the captures, only capture
+        moves are searched further until the position is quiet
+        :param quiescence_nodes_limit: Maximal number of the positions
+        searched by the quiescence search during one search
+        :param batch_evaluator: BatchEvaluator object, when given alpha beta
+        and pvs searches evaluate all the children of the positions one move
+        before the search depth in one call to it, it is not used together
+        with the quiescence search. It pays off for the lists representation,
+        the BitBoard one is evaluated quickly enough leaf by leaf
+        :param incremental_evaluation: IncrementalEvaluation object, when
+        given it is updated with the moves of alpha beta and pvs searches,
+        so their leaves are evaluated without scanning the board, other
+        boards are evaluated from scratch with its weights
+        :param use_symmetries: When set, position and the position with
+        swapped colours rotated by 180 degrees share one entry of the
+        transposition table
+        :param endgame_database: EndgameDatabase object, alpha beta and pvs
+        searches take exact scores of the positions it contains instead of
+        searching them, faster wins get bigger scores when it stores the
+        distances
+        """
+        self.use_bitboard = use_bitboard
+        self.transposition_table = None
+        self.zobrist_hashing = None
+        if transposition_table_size_mb is not None:
+            self.transposition_table = TranspositionTable(transposition_table_size_mb,
+                                                          replacement_policy)
+            self.zobrist_hashing = ZobristHashing(use_symmetry=use_symmetries)
+        self.move_orderer = move_orderer
+        self.use_quiescence = use_quiescence
+        self.quiescence_nodes_limit = quiescence_nodes_limit
+        self.quiescence_nodes = 0
+        self.quiescence_max_depth = 0
+        self.quiescence_limit_hits = 0
+        self.batch_evaluator = batch_evaluator
+        self.incremental_evaluation = incremental_evaluation
+        self.endgame_database = endgame_database
+        self.searched_nodes = 0
+        self.searched_depth = 0
+        self.aspiration_researches = 0
+        self.deadline = None
         self.max_moves_mt = 100
-        self.mt_wins = {}
-        self.mt_plays = {}
+        self.mt_root = None
+        self.mt_root_history = ()
+        self.mt_nodes_limit = MonteCarloNodesLimit(max_tree_nodes, eviction_policy)
+        self.mt_executor = None
+        self.mt_executor_workers = None
+        self.ab_executor = None
+        self.ab_executor_workers = None
+        self.ab_shared_alpha = None
         self.mt_C = 1.4
         self.max_depth = 0
+        self.mt_games = 0
         self.game = game
         self.print_info = False
         # self.game_board = self.game.game_board
 
-    def build_monte_carlo_tree(self, num_of_sim):
+    def build_monte_carlo_tree(self, num_of_sim=None, time_limit_ms=None, stop_event=None,
+                               parallelization=None, workers=2):
         """
-        Builds tree using monte carlo method
-        :param num_of_sim: Time limit in seconds after which this method will
-        return built tree
-        :return:
+        Builds tree using monte carlo method, simulations run until any of the
+        given limits is reached. The best move found so far can be taken at
+        any moment with get_monte_carlo_best_move. Subtree of the actual
+        position is kept from the previous search
+        :param num_of_sim: Number of simulations
+        :param time_limit_ms: Time limit of the simulations in milliseconds
+        :param stop_event: threading.Event, simulations stop when it gets set,
+        not used by ROOT parallelization
+        :param parallelization: MonteCarloParallelization enum value, ROOT
+        builds independent trees in the worker processes and sums their root
+        statistics, LEAF runs play outs of every expanded node in the worker
+        processes, None runs the simulations in this process
+        :param workers: Number of the worker processes
+        :return: Best move in UCI format
         """
+        simulation_limits = SimulationLimits(num_of_sim, time_limit_ms, stop_event)
         self.max_depth = 0
+        self.mt_games = 0
         # raise NotImplementedError("Monte Carlo tree search to do")
-        actual_board = self.game.game_board.get_board_copy(copy_format='tuple')
+        actual_board = self._get_board_copy()
         player = self.game.current_players_turn
-        possible_moves = self.game.game_board.get_possible_moves(player, actual_board)
+        possible_moves = self.game.game_board.get_legal_moves(player, actual_board)
+        self.mt_root = self._get_monte_carlo_root(player)
 
         # Return if there is no choice to be made
         if not possible_moves:
@@ -88,95 +200,294 @@ class CheckersTreeBuilder(TreeBuilderABC):
         if len(possible_moves) == 1:
             if self.print_info:
                 print("Only one move possible, returning it")
-            return possible_moves[0]
-
-        games = 0
-
-        # time_for_move = datetime.timedelta(seconds=time_limit)
-        # start_time = datetime.datetime.utcnow()
-        # while datetime.datetime.utcnow() - start_time < time_for_move:
-        while games <= num_of_sim:
-            self._run_monte_carlo_simulation(actual_board, player, player)
-            games += 1
-            if games % 10 == 0 and self.print_info:
-                print(games)
+            return possible_moves[0].to_uci()
+
+        if parallelization is not None:
+            executor = self._get_monte_carlo_executor(workers)
+        if parallelization == MonteCarloParallelization.ROOT:
+            self.mt_root = self._run_root_parallel_search(player, possible_moves, executor,
+                                                          workers, num_of_sim, time_limit_ms)
+        elif parallelization == MonteCarloParallelization.LEAF:
+            search_id = getrandbits(64)
+            tree_builder_bytes = pickle.dumps(self)
+            while not simulation_limits.is_reached(self.mt_games):
+                self.mt_games += self._run_leaf_parallel_simulation(
+                    self.mt_root, actual_board, executor, workers, search_id,
+                    tree_builder_bytes)
+        else:
+            while not simulation_limits.is_reached(self.mt_games):
+                self._run_monte_carlo_simulation(self.mt_root, actual_board)
+                self.mt_games += 1
+                if self.mt_games % 10 == 0 and self.print_info:
+                    print(self.mt_games)
         if self.print_info:
-            print("Number of games: {}".format(games))
-
-        moves_tuples = [(move_cords, self.game.game_board.make_move(
-            player_id=player,
-            move_coords=move_cords,
-            board=actual_board,
-        )) for move_cords in possible_moves]
-
-        percent_wins, move = max(
-            (self.mt_wins.get((player, act_board), 0) /
-             self.mt_plays.get((player, act_board), 1),
-             move) for move, act_board in moves_tuples
-        )
+            print("Number of games: {}".format(self.mt_games))
+
+        best_move_stats = self.get_monte_carlo_best_move()
 
         if self.print_info:
             for x in sorted(
-                    ((100 * self.mt_wins.get((player, S), 0) /
-                      self.mt_plays.get((player, S), 1),
-                      self.mt_wins.get((player, S), 0),
-                      self.mt_plays.get((player, S), 0), p)
-                     for p, S in moves_tuples),
+                    ((100 * stats.wins / (stats.plays or 1), stats.wins, stats.plays,
+                      stats.move) for stats in self.get_monte_carlo_statistics()),
                     reverse=True
             ):
                 print("{3}: {0:.2f}% ({1} /{2})".format(*x))
             print("Maximum depth searched:", self.max_depth)
 
-        return move
-
-    def _run_monte_carlo_simulation(self, actual_board, actual_player, player):
-        visited_states = set()
-        board_copy = self.game.game_board.get_board_copy(actual_board, copy_format='tuple')
-
-        expand = True
-        for i in range(self.max_moves_mt):
-            possible_moves = self.game.game_board.get_possible_moves(actual_player, board_copy)
-
-            moves_boards = [(p, self.game.game_board.get_board_copy(
-                self.game.game_board.make_move(
-                    actual_player, p, self.game.game_board.get_board_copy(board_copy)),
-                copy_format='tuple'
-            )) for p in possible_moves]
-
-            if all(self.mt_plays.get((actual_player, S)) for p, S in moves_boards):
-                log_total = log(
-                    sum(self.mt_plays[(actual_player, S)] for p, S in moves_boards))
-                value, play, brd = max(
-                    ((self.mt_wins[(actual_player, S)] / self.mt_plays[(actual_player, S)]) +
-                     self.mt_C * sqrt(log_total / self.mt_plays[(actual_player, S)]), p, S)
-                    for p, S in moves_boards
-                )
-            else:
-                play, brd = choice(moves_boards)
+        return best_move_stats.move
 
-            board_copy = brd
+    def _get_monte_carlo_root(self, player):
+        """
+        Finds node of the actual position in the tree of the previous search,
+        following the moves made in the game since then, so the statistics
+        gathered for the position are reused
+        :param player: Player to move in the actual position
+        :return: Root node for the search
+        """
+        moves_history = tuple(self.game.moves_list)
+        root_node = None
+        root_history_len = len(self.mt_root_history)
+        if self.mt_root is not None and \
+                moves_history[:root_history_len] == self.mt_root_history:
+            root_node = self.mt_root.find_descendant(moves_history[root_history_len:],
+                                                     CheckersMove.to_uci)
+        if root_node is None or self.next_player_dict[root_node.player] != player:
+            root_node = MonteCarloNode(None, self.next_player_dict[player])
+        root_node.parent = None
+        self.mt_root_history = moves_history
+        self.mt_nodes_limit.set_root(root_node)
+        return root_node
 
-            if expand and (actual_player, board_copy) not in self.mt_plays:
-                expand = False
-                self.mt_plays[(actual_player, board_copy)] = 0
-                self.mt_wins[(actual_player, board_copy)] = 0
-                if i > self.max_depth:
-                    self.max_depth = i
+    def get_monte_carlo_statistics(self):
+        """
+        Gives statistics of the root moves of the last, or actually running
+        monte carlo search, can be called from the other thread
+        :return: List of MonteCarloMoveStats
+        """
+        root_node = self.mt_root
+        if root_node is None:
+            return []
+        get_move_name = CheckersMove.to_uci
+        moves_stats = [MonteCarloMoveStats(get_move_name(child_node.move), child_node.wins,
+                                           child_node.plays)
+                       for child_node in list(root_node.children)]
+        moves_stats += [MonteCarloMoveStats(get_move_name(move), 0, 0)
+                        for move in list(root_node.untried_moves or ())]
+        return moves_stats
 
-            visited_states.add((actual_player, board_copy))
+    def get_monte_carlo_tree_stats(self):
+        """
+        :return: MonteCarloTreeStats with the size of the monte carlo tree and
+        the eviction counters
+        """
+        return self.mt_nodes_limit.get_stats()
 
-            actual_player = self.next_player_dict[actual_player]
-            game_state = self.game.game_board.check_game_state(actual_player, board_copy)
-            if game_state in (GameStates.PLAYER1WIN, GameStates.PLAYER2WIN, GameStates.DRAW):
-                break
+    def get_monte_carlo_best_move(self):
+        """
+        Gives the best root move found so far by the monte carlo search, can
+        be called at any moment, also from the other thread
+        :return: MonteCarloMoveStats of the move with the best wins ratio,
+        None if the search has not started
+        """
+        moves_stats = self.get_monte_carlo_statistics()
+        if not moves_stats:
+            return None
+        return max(moves_stats, key=lambda stats: (
+            stats.wins / stats.plays if stats.plays else 0, stats.move))
+
+    def _run_monte_carlo_simulation(self, root_node, actual_board):
+        """
+        Runs one simulation of the game from the root node till the terminal
+        condition, adds one node to the tree
+        :param root_node: Root node of the search tree
+        :param actual_board: Board of the root position, it is not modified
+        """
+        node, board_copy, depth = self._select_and_expand(root_node, actual_board)
+        winner = self.play_out(self.next_player_dict[node.player], board_copy, depth)
+        node.backpropagate(winner, self.mt_nodes_limit.next_visit())
 
-        for act_player, act_board in visited_states:
-            if (act_player, act_board) not in self.mt_plays:
+    def _run_leaf_parallel_simulation(self, root_node, actual_board, executor, workers,
+                                      search_id, tree_builder_bytes):
+        """
+        Runs simulations from one selected leaf, play outs are run in the
+        worker processes
+        :param root_node: Root node of the search tree
+        :param actual_board: Board of the root position, it is not modified
+        :param executor: Pool of the worker processes
+        :param workers: Number of the play outs, one for every worker
+        :param search_id: Identifier of the search, sent to the workers
+        :param tree_builder_bytes: Pickled tree builder sent to the workers
+        :return: Number of the run simulations
+        """
+        node, board_copy, depth = self._select_and_expand(root_node, actual_board)
+        actual_player = self.next_player_dict[node.player]
+        futures = [executor.submit(run_play_outs, search_id, tree_builder_bytes, actual_player,
+                                   board_copy, depth, 1, getrandbits(32))
+                   for _ in range(workers)]
+        simulations_num = 0
+        for future in futures:
+            for winner in future.result():
+                node.backpropagate(winner, self.mt_nodes_limit.next_visit())
+                simulations_num += 1
+        return simulations_num
+
+    def _run_root_parallel_search(self, player, possible_moves, executor, workers,
+                                  num_of_sim, time_limit_ms):
+        """
+        Builds independent trees in the worker processes and sums statistics
+        of their root moves
+        :param player: Player to move
+        :param possible_moves: Legal moves of the actual position
+        :param executor: Pool of the worker processes
+        :param workers: Number of the independent trees
+        :param num_of_sim: Number of simulations divided between the trees
+        :param time_limit_ms: Time limit of the simulations in milliseconds
+        :return: Root node with the summed statistics of the root moves
+        """
+        tree_builder_bytes = pickle.dumps(self)
+        futures = []
+        for worker_num in range(workers):
+            worker_num_of_sim = None
+            if num_of_sim is not None:
+                worker_num_of_sim = num_of_sim // workers + (worker_num < num_of_sim % workers)
+            futures.append(executor.submit(run_independent_search, tree_builder_bytes,
+                                           worker_num_of_sim, time_limit_ms, getrandbits(32)))
+
+        moves_stats = {}
+        for future in futures:
+            for stats in future.result():
+                wins, plays = moves_stats.get(stats.move, (0, 0))
+                moves_stats[stats.move] = (wins + stats.wins, plays + stats.plays)
+
+        root_node = MonteCarloNode(None, self.next_player_dict[player])
+        root_node.untried_moves = []
+        for move in possible_moves:
+            wins, plays = moves_stats.get(move.to_uci(), (0, 0))
+            if not plays:
+                root_node.untried_moves.append(move)
                 continue
-            self.mt_plays[(act_player, act_board)] += 1
-            # game_state = self.game.game_board.check_game_state(act_board)
-            if game_state == self.player_desired_game_state[player]:
-                self.mt_wins[(act_player, act_board)] += 1
+            child_node = root_node.add_child(move, player)
+            child_node.wins = wins
+            child_node.plays = plays
+            root_node.plays += plays
+        self.mt_nodes_limit.set_root(root_node)
+        self.mt_games = root_node.plays
+        return root_node
+
+    def _select_and_expand(self, root_node, actual_board):
+        """
+        Selects the node of the tree with UCB1 and expands it with one of its
+        untried moves
+        :param root_node: Root node of the search tree
+        :param actual_board: Board of the root position, it is not modified
+        :return: Tuple of the reached node, board of its position and its
+        depth
+        """
+        self.mt_nodes_limit.make_room(root_node)
+        board_copy = self._get_board_copy(actual_board)
+        node = root_node
+        depth = 0
+
+        # Selection of the already expanded nodes
+        while node.is_fully_expanded() and node.children:
+            node = node.select_child(self.mt_C)
+            self.game.game_board.apply_move(node.player, node.move, board_copy)
+            depth += 1
+
+        # Expansion of the node with one of its untried moves
+        if node.untried_moves is None:
+            node.untried_moves = self.game.game_board.get_legal_moves(
+                self.next_player_dict[node.player], board_copy)
+        if node.untried_moves and self.mt_nodes_limit.has_room():
+            move = node.untried_moves.pop(randrange(len(node.untried_moves)))
+            actual_player = self.next_player_dict[node.player]
+            self.game.game_board.apply_move(actual_player, move, board_copy)
+            node = node.add_child(move, actual_player)
+            self.mt_nodes_limit.node_added()
+            depth += 1
+        if depth > self.max_depth:
+            self.max_depth = depth
+        return node, board_copy, depth
+
+    def play_out(self, actual_player, board_copy, depth):
+        """
+        Plays random game from the given position, player without moves has
+        lost
+        :param actual_player: Player to move
+        :param board_copy: Board of the position, it gets modified
+        :param depth: Number of moves already made in the simulation
+        :return: Winner of the game, None when the game was not finished
+        """
+        for i in range(depth, self.max_moves_mt + 1):
+            possible_moves = self.game.game_board.get_legal_moves(actual_player, board_copy)
+            if not possible_moves:
+                return self.next_player_dict[actual_player]
+            self.game.game_board.apply_move(actual_player, choice(possible_moves), board_copy)
+            actual_player = self.next_player_dict[actual_player]
+        return None
+
+    def _get_monte_carlo_executor(self, workers):
+        """
+        Gives the pool of the worker processes, the pool is kept between the
+        searches
+        :param workers: Number of the worker processes
+        :return: ProcessPoolExecutor object
+        """
+        if self.mt_executor is None or self.mt_executor_workers != workers:
+            if self.mt_executor is not None:
+                self.mt_executor.shutdown()
+            self.mt_executor = ProcessPoolExecutor(max_workers=workers)
+            self.mt_executor_workers = workers
+        return self.mt_executor
+
+    def _get_alphabeta_executor(self, workers):
+        """
+        Gives the pool of the worker processes of the parallel alpha beta
+        search, the pool and the transposition tables of the workers are kept
+        between the searches
+        :param workers: Number of the worker processes
+        :return: ProcessPoolExecutor object
+        """
+        if self.ab_executor is None or self.ab_executor_workers != workers:
+            if self.ab_executor is not None:
+                self.ab_executor.shutdown()
+            self.ab_shared_alpha = multiprocessing.Value('d', MIN_VAL)
+            self.ab_executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=parallel_alphabeta.init_worker,
+                initargs=(pickle.dumps(self), self.ab_shared_alpha))
+            self.ab_executor_workers = workers
+        return self.ab_executor
+
+    def shutdown_workers(self):
+        """
+        Stops the worker processes of the parallel monte carlo and alpha beta
+        searches
+        """
+        if self.mt_executor is not None:
+            self.mt_executor.shutdown()
+            self.mt_executor = None
+        if self.ab_executor is not None:
+            self.ab_executor.shutdown()
+            self.ab_executor = None
+
+    def __getstate__(self):
+        """
+        Copies of the builder sent to other processes do not take the pools of
+        the worker processes and the monte carlo tree with them, they get an
+        empty transposition table
+        :return: State of the builder to pickle
+        """
+        state = self.__dict__.copy()
+        state['mt_executor'] = None
+        state['mt_root'] = None
+        state['mt_root_history'] = ()
+        state['ab_executor'] = None
+        state['ab_shared_alpha'] = None
+        if self.transposition_table is not None:
+            state['transposition_table'] = TranspositionTable(
+                self.transposition_table.entries_num * ENTRY_SIZE / (1024 * 1024),
+                self.transposition_table.replacement_policy)
+        return state
 
     def build_minimax_tree(self, depth):
         """
@@ -192,15 +503,75 @@ class CheckersTreeBuilder(TreeBuilderABC):
             player=self.game.current_players_turn,
             actual_player=self.game.current_players_turn,
             parent_node=main_root,
-            actual_board=self.game.game_board.get_board_copy(),
+            actual_board=self._get_board_copy(),
             move=None
         )
 
         # print(RenderTree(main_root))
 
-        return main_root.children[0]
+        return self._get_root_with_uci_moves(main_root)
         # input("pause")
 
+    def find_minimax_move(self, depth):
+        """
+        Searches for the best move with minimax algorithm without building
+        the tree
+        :param depth: Depth at which the algorithm will stop searching
+        :return: Tuple of the best move in UCI format and its score
+        """
+        score, move = self._search_minimax(
+            depth=depth,
+            actual_player=self.game.current_players_turn,
+            player=self.game.current_players_turn,
+            actual_board=self._get_board_copy()
+        )
+        return move.to_uci(), score
+
+    def _search_minimax(self, depth, actual_player, player, actual_board):
+        """
+        Finds minimax value of the position, gives the same values and moves
+        as the tree built by build_minimax_tree
+        :param depth: Depth at which this particular branch can search further
+        :param actual_player: Player to move
+        :param player: The player for which the move is discovered
+        :param actual_board: Board modified in place during the search
+        :return: Tuple of the position value and the best move, move is None
+        for the leaves
+        """
+        if depth == 0:
+            return self._static_evaluation_value(actual_board=actual_board,
+                                                 player=player), None
+
+        game_state = self.game.game_board.check_game_state(actual_player,
+                                                           actual_board)
+        if game_state == GameStates.DRAW:
+            return 0, None
+        elif game_state == self.player_desired_game_state[player]:
+            return MAX_VAL, None
+        elif game_state == self.player_desired_game_state[self.next_player_dict[player]]:
+            return MIN_VAL, None
+
+        maximize = actual_player == player
+        best_move = None
+        best = None
+        for pos_move in self.game.game_board.get_legal_moves(actual_player, actual_board):
+            undo_record = self.game.game_board.apply_move(
+                player_id=actual_player,
+                move_coords=pos_move,
+                board=actual_board
+            )
+            value, _ = self._search_minimax(
+                depth=depth - 1,
+                actual_player=self.next_player_dict[actual_player],
+                player=player,
+                actual_board=actual_board
+            )
+            self.game.game_board.undo_move(undo_record, actual_board)
+            if best_move is None or (value > best if maximize else value < best):
+                best, best_move = value, pos_move
+
+        return best, best_move
+
     def _create_one_tree_layer_minimax(self, depth, actual_player, player, parent_node,
                                        actual_board, move):
         """
@@ -240,26 +611,26 @@ class CheckersTreeBuilder(TreeBuilderABC):
         elif game_state == undesired_game_state:
             return Node(MIN_VAL, parent=parent_node, move=move)
 
-        possible_moves = self.game.game_board.get_possible_moves(actual_player,
-                                                                 actual_board)
+        possible_moves = self.game.game_board.get_legal_moves(actual_player,
+                                                              actual_board)
 
         actual_node = Node(None, parent=parent_node, move=move)
 
         for pos_move in possible_moves:
-            board_copy = self.game.game_board.get_board_copy(actual_board)
-            board_copy = self.game.game_board.make_move(
+            undo_record = self.game.game_board.apply_move(
                 player_id=actual_player,
                 move_coords=pos_move,
-                board=board_copy
+                board=actual_board
             )
             self._create_one_tree_layer_minimax(
                 depth=depth - 1,
                 actual_player=self.next_player_dict[actual_player],
                 player=player,
                 parent_node=actual_node,
-                actual_board=board_copy,
+                actual_board=actual_board,
                 move=pos_move
             )
+            self.game.game_board.undo_move(undo_record, actual_board)
 
     def build_alphabeta_tree(self, depth):
         """
@@ -269,25 +640,40 @@ class CheckersTreeBuilder(TreeBuilderABC):
         """
 
         main_root = anytree.Node(None)
+        actual_board, key = self._start_search()
 
         move_node = self._create_one_tree_layer_alphabeta(
             depth=depth,
             player=self.game.current_players_turn,
             actual_player=self.game.current_players_turn,
             parent_node=main_root,
-            actual_board=self.game.game_board.get_board_copy(),
+            actual_board=actual_board,
             move=None,
             alpha=Node(MIN_VAL),
-            beta=Node(MAX_VAL)
+            beta=Node(MAX_VAL),
+            key=key
         )
         # print(RenderTree(main_root))
         # print(move_node)
         # return move_node.move
         # print("Alpha beta was called")
-        return main_root.children[0]
+        return self._get_root_with_uci_moves(main_root)
+
+    @staticmethod
+    def _get_root_with_uci_moves(main_root):
+        """
+        Translates moves of the first tree layer to the UCI format, deeper
+        nodes keep CheckersMove objects used during search
+        :param main_root: Helper node, parent of the tree root
+        :return: Root of the built tree
+        """
+        root_node = main_root.children[0]
+        for child_node in root_node.children:
+            child_node.move = child_node.move.to_uci()
+        return root_node
 
     def _create_one_tree_layer_alphabeta(self, depth, actual_player, player, parent_node,
-                                         actual_board, move, alpha, beta):
+                                         actual_board, move, alpha, beta, key=None):
         """
         Creates one tree layer for one move of a particular player, then finds
         self recursively value of its nodes
@@ -299,11 +685,14 @@ class CheckersTreeBuilder(TreeBuilderABC):
         :param actual_board: Board arrays with actually estimated board
         simulation
         :param move: Last move in tuple
+        :param key: Zobrist key of the actual board, None when transposition
+        table is not used
         :return: Node containing possible moves
         """
+        self.searched_nodes += 1
         if depth == 0:
-            return Node(self._static_evaluation_value(actual_board=actual_board,
-                                                      player=player),
+            return Node(self._evaluate_leaf(actual_board, actual_player, player, alpha.name,
+                                            beta.name),
                         parent=parent_node, move=move)
 
         game_state = self.game.game_board.check_game_state(actual_player,
@@ -327,38 +716,56 @@ class CheckersTreeBuilder(TreeBuilderABC):
 
         if actual_player == player:
             layer_factor = self.PlayerFactor.MAX
+            score_factor = 1
         else:
             layer_factor = self.PlayerFactor.MIN
+            score_factor = -1
+
+        possible_moves = self.game.game_board.get_legal_moves(actual_player,
+                                                              actual_board)
+        ply = parent_node.depth
+        self._order_moves(possible_moves, ply)
 
-        possible_moves = self.game.game_board.get_possible_moves(actual_player,
-                                                                 actual_board)
+        # Window and scores of the transposition table are kept from the
+        # point of view of the player to move
+        if score_factor == 1:
+            window = (alpha.name, beta.name)
+        else:
+            window = (-beta.name, -alpha.name)
+        # The root has to be expanded to give the moves to choose from
+        table_entry = self._probe_transposition_table(key, depth, window, possible_moves,
+                                                      allow_cutoff=move is not None)
+        if table_entry is not None:
+            return Node(score_factor * table_entry.score, parent=parent_node, move=move)
 
         nodes_le_lambda = lambda x, y: x.name <= y.name
 
+        best_move = None
         actual_node = Node(None, parent=parent_node, move=move)
         if layer_factor == self.PlayerFactor.MAX:
             best = Node(MIN_VAL)
-            for pos_move in possible_moves:
-                board_copy = self.game.game_board.get_board_copy(actual_board)
-                board_copy = self.game.game_board.make_move(
-                    player_id=actual_player,
-                    move_coords=pos_move,
-                    board=board_copy
-                )
+            for move_num, pos_move in enumerate(possible_moves):
+                undo_record, child_key = self._apply_move_with_key(
+                    actual_player, pos_move, actual_board, key)
                 val_returned = self._create_one_tree_layer_alphabeta(
                     depth=depth - 1,
                     actual_player=self.next_player_dict[actual_player],
                     player=player,
                     parent_node=actual_node,
-                    actual_board=board_copy,
+                    actual_board=actual_board,
                     move=pos_move,
                     alpha=alpha,
-                    beta=beta
+                    beta=beta,
+                    key=child_key
                 )
+                self._undo_move(undo_record, actual_board)
                 try:
+                    if best_move is None or val_returned.name > best.name:
+                        best_move = pos_move
                     best = max([val_returned, best], key=lambda x: x.name)
                     alpha = max([val_returned, alpha], key=lambda x: x.name)
                     if nodes_le_lambda(beta, alpha):
+                        self._record_cutoff(pos_move, ply, depth, move_num)
                         break
                 except TypeError:
                     print("Val returned - {}\n Best value - {}\n alpha - {}\nbeta - {}\n\n".format(
@@ -366,35 +773,804 @@ class CheckersTreeBuilder(TreeBuilderABC):
                     raise
         else:
             best = Node(MAX_VAL)
-            for pos_move in possible_moves:
-                board_copy = self.game.game_board.get_board_copy(actual_board)
-                board_copy = self.game.game_board.make_move(
-                    player_id=actual_player,
-                    move_coords=pos_move,
-                    board=board_copy
-                )
+            for move_num, pos_move in enumerate(possible_moves):
+                undo_record, child_key = self._apply_move_with_key(
+                    actual_player, pos_move, actual_board, key)
                 val_returned = self._create_one_tree_layer_alphabeta(
                     depth=depth - 1,
                     actual_player=self.next_player_dict[actual_player],
                     player=player,
                     parent_node=actual_node,
-                    actual_board=board_copy,
+                    actual_board=actual_board,
                     move=pos_move,
                     alpha=alpha,
-                    beta=beta
+                    beta=beta,
+                    key=child_key
                 )
+                self._undo_move(undo_record, actual_board)
                 try:
+                    if best_move is None or val_returned.name < best.name:
+                        best_move = pos_move
                     best = min([val_returned, best], key=lambda x: x.name)
                     beta = min([val_returned, beta], key=lambda x: x.name)
                     if nodes_le_lambda(beta, alpha):
+                        self._record_cutoff(pos_move, ply, depth, move_num)
                         break
                 except TypeError:
                     print("Val returned - {}\n Best value - {}\n beta - {}\nalpha - {}\n\n".format(
                         val_returned, best, beta, alpha))
                     raise
 
+        self._store_in_transposition_table(key, depth, window, score_factor * best.name,
+                                           best_move)
+
+        return best
+
+    def find_alphabeta_move(self, depth):
+        """
+        Searches for the best move with alpha beta algorithm without building
+        the tree, alpha and beta are kept as plain numbers
+        :param depth: Depth at which the algorithm will stop searching
+        :return: Tuple of the best move in UCI format and its score
+        """
+        actual_board, key = self._start_search()
+        player = self.game.current_players_turn
+
+        score, move = self._search_alphabeta(
+            depth=depth,
+            actual_player=player,
+            player=player,
+            actual_board=actual_board,
+            alpha=MIN_VAL,
+            beta=MAX_VAL,
+            key=key,
+            is_root=True
+        )
+        return move.to_uci(), score
+
+    def find_parallel_alphabeta_move(self, depth, workers=2):
+        """
+        Searches for the best move with alpha beta algorithm with the root
+        moves split between the worker processes. First root move is searched
+        in this process to get the alpha bound, the rest of them is searched
+        by the workers, which share the best score found so far. Without the
+        transposition table the move and the score are the same as given by
+        find_alphabeta_move
+        :param depth: Depth at which the algorithm will stop searching
+        :param workers: Number of the worker processes
+        :return: Tuple of the best move in UCI format and its score
+        """
+        actual_board, key = self._start_search()
+        player = self.game.current_players_turn
+        opponent = self.next_player_dict[player]
+        possible_moves = self.game.game_board.get_legal_moves(player, actual_board)
+        if len(possible_moves) == 1 or depth <= 1:
+            return self.find_alphabeta_move(depth)
+        self._order_moves(possible_moves, 0)
+
+        executor = self._get_alphabeta_executor(workers)
+        self._probe_transposition_table(key, depth, (MIN_VAL, MAX_VAL), possible_moves,
+                                        allow_cutoff=False)
+
+        # Young brothers wait for the score of the eldest one
+        undo_record, child_key = self._apply_move_with_key(player, possible_moves[0],
+                                                           actual_board, key)
+        best, _ = self._search_alphabeta(
+            depth - 1, opponent, player, actual_board, MIN_VAL, MAX_VAL, child_key, ply=1,
+            moves_without_capture=self._get_child_moves_without_capture(possible_moves[0]))
+        self._undo_move(undo_record, actual_board)
+        best_move = possible_moves[0]
+        with self.ab_shared_alpha.get_lock():
+            self.ab_shared_alpha.value = best
+
+        futures = []
+        for pos_move in possible_moves[1:]:
+            undo_record, child_key = self._apply_move_with_key(player, pos_move, actual_board,
+                                                               key)
+            futures.append(executor.submit(
+                parallel_alphabeta.search_root_move, depth - 1, opponent, player,
+                self._get_board_copy(actual_board), MIN_VAL, MAX_VAL, child_key,
+                self._get_child_moves_without_capture(pos_move)))
+            self._undo_move(undo_record, actual_board)
+
+        # Scores lower than the best one are only bounds, equal and higher
+        # ones are exact, so the first move with the highest score wins
+        for pos_move, future in zip(possible_moves[1:], futures):
+            value, searched_nodes, quiescence_stats = future.result()
+            self.searched_nodes += searched_nodes
+            self.quiescence_nodes += quiescence_stats.nodes
+            self.quiescence_max_depth = max(self.quiescence_max_depth,
+                                            quiescence_stats.max_depth)
+            self.quiescence_limit_hits += quiescence_stats.limit_hits
+            if value > best:
+                best, best_move = value, pos_move
+
+        self._store_in_transposition_table(key, depth, (MIN_VAL, MAX_VAL), best, best_move)
+        return best_move.to_uci(), best
+
+    def find_iterative_deepening_move(self, time_limit_ms, max_depth=64):
+        """
+        Searches with alpha beta algorithm at depth 1, 2, 3... until the time
+        limit runs out. Best move of the previous depth is searched first, the
+        transposition table, when used, orders moves of the deeper positions
+        :param time_limit_ms: Time limit for the move in milliseconds, the
+        first depth is always completed
+        :param max_depth: Depth after which the search stops before the time
+        limit
+        :return: Tuple of the best move in UCI format and its score found at
+        the last completed depth
+        """
+        deadline = time.monotonic() + time_limit_ms / 1000
+        actual_board, key = self._start_search()
+        player = self.game.current_players_turn
+
+        possible_moves = self.game.game_board.get_legal_moves(player, actual_board)
+        if len(possible_moves) == 1:
+            self.searched_depth = 0
+            return possible_moves[0].to_uci(), None
+
+        move = None
+        score = None
+        try:
+            for depth in range(1, max_depth + 1):
+                depth_score, depth_move = self._search_alphabeta(
+                    depth=depth,
+                    actual_player=player,
+                    player=player,
+                    actual_board=actual_board,
+                    alpha=MIN_VAL,
+                    beta=MAX_VAL,
+                    key=key,
+                    is_root=True,
+                    first_move=move
+                )
+                score, move = depth_score, depth_move
+                self.searched_depth = depth
+                self.deadline = deadline
+                if abs(score) >= MAX_VAL - MAX_PLY or time.monotonic() >= deadline:
+                    break
+        except SearchTimeout:
+            pass
+        finally:
+            self.deadline = None
+
+        return move.to_uci(), score
+
+    def find_pvs_move(self, depth):
+        """
+        Searches for the best move with negamax principal variation search,
+        gives the same move and score as find_alphabeta_move when the
+        transposition table is not used
+        :param depth: Depth at which the algorithm will stop searching
+        :return: Tuple of the best move in UCI format and its score
+        """
+        actual_board, key = self._start_search()
+        player = self.game.current_players_turn
+
+        score, move = self._search_pvs(
+            depth=depth,
+            actual_player=player,
+            player=player,
+            actual_board=actual_board,
+            alpha=MIN_VAL,
+            beta=MAX_VAL,
+            key=key,
+            is_root=True
+        )
+        return move.to_uci(), score
+
+    def find_pvs_iterative_deepening_move(self, time_limit_ms, max_depth=64,
+                                          aspiration_delta=2):
+        """
+        Searches with principal variation search at depth 1, 2, 3... until
+        the time limit runs out. Every depth after the first one starts with
+        the aspiration window around the score of the previous depth, the
+        window is widened when the score falls outside of it
+        :param time_limit_ms: Time limit for the move in milliseconds, the
+        first depth is always completed
+        :param max_depth: Depth after which the search stops before the time
+        limit
+        :param aspiration_delta: Distance of the aspiration window bounds from
+        the previous score
+        :return: Tuple of the best move in UCI format and its score found at
+        the last completed depth
+        """
+        deadline = time.monotonic() + time_limit_ms / 1000
+        actual_board, key = self._start_search()
+        player = self.game.current_players_turn
+        self.aspiration_researches = 0
+
+        possible_moves = self.game.game_board.get_legal_moves(player, actual_board)
+        if len(possible_moves) == 1:
+            self.searched_depth = 0
+            return possible_moves[0].to_uci(), None
+
+        move = None
+        score = None
+        try:
+            for depth in range(1, max_depth + 1):
+                if score is None:
+                    window = (MIN_VAL, MAX_VAL)
+                else:
+                    window = (max(MIN_VAL, score - aspiration_delta),
+                              min(MAX_VAL, score + aspiration_delta))
+                delta = aspiration_delta
+                while True:
+                    depth_score, depth_move = self._search_pvs(
+                        depth=depth,
+                        actual_player=player,
+                        player=player,
+                        actual_board=actual_board,
+                        alpha=window[0],
+                        beta=window[1],
+                        key=key,
+                        is_root=True,
+                        first_move=move
+                    )
+                    # Score outside of the window is a bound, the window is
+                    # widened beyond it
+                    delta *= 2
+                    if MIN_VAL < window[0] and depth_score <= window[0]:
+                        window = (max(MIN_VAL, min(window[0], depth_score) - delta), window[1])
+                    elif depth_score >= window[1] and window[1] < MAX_VAL:
+                        window = (window[0], min(MAX_VAL, max(window[1], depth_score) + delta))
+                    else:
+                        break
+                    self.aspiration_researches += 1
+                score, move = depth_score, depth_move
+                self.searched_depth = depth
+                self.deadline = deadline
+                if abs(score) >= MAX_VAL - MAX_PLY or time.monotonic() >= deadline:
+                    break
+        except SearchTimeout:
+            pass
+        finally:
+            self.deadline = None
+
+        return move.to_uci(), score
+
+    def _start_search(self):
+        """
+        Prepares the builder for the search without the tree
+        :return: Tuple of the actual game board copy and its Zobrist key, key
+        is None when transposition table is not used
+        """
+        actual_board = self._get_board_copy()
+
+        self._reset_search_stats()
+        key = None
+        if self.transposition_table is not None:
+            self.transposition_table.new_search()
+            key = self.zobrist_hashing.get_board_key(actual_board,
+                                                     self.game.current_players_turn)
+        if self.incremental_evaluation is not None:
+            self.incremental_evaluation.reset(actual_board)
+        return actual_board, key
+
+    def _reset_search_stats(self):
+        """
+        Resets the counters of the search and starts the new search of the
+        move orderer, the worker processes of the parallel search call it for
+        every searched root move
+        """
+        self.searched_nodes = 0
+        self.quiescence_nodes = 0
+        self.quiescence_max_depth = 0
+        self.quiescence_limit_hits = 0
+        if self.move_orderer is not None:
+            self.move_orderer.new_search()
+
+    def _get_child_moves_without_capture(self, move):
+        """
+        :param move: CheckersMove made in the root of the search
+        :return: Number of moves made since the last capture after the move
+        """
+        return 0 if move.captured else self.game.game_board.move_count + 1
+
+    def _search_alphabeta(self, depth, actual_player, player, actual_board, alpha, beta,
+                          key=None, is_root=False, first_move=None, ply=0,
+                          moves_without_capture=None):
+        """
+        Finds alpha beta value of the position, gives the same values and
+        moves as the tree built by build_alphabeta_tree
+        :param depth: Depth at which this particular branch can search further
+        :param actual_player: Player to move
+        :param player: The player for which the move is discovered
+        :param actual_board: Board modified in place during the search
+        :param alpha: Value that the maximizing player is already assured of
+        :param beta: Value that the minimizing player is already assured of
+        :param key: Zobrist key of the actual board, None when transposition
+        table is not used
+        :param is_root: Tells if the position is the root of the search
+        :param first_move: Move that is searched first in the position
+        :param ply: Distance of the position from the root of the search
+        :param moves_without_capture: Number of moves made since the last
+        capture, move count of the game board when None
+        :return: Tuple of the position value and the best move, move is None
+        for the leaves
+        """
+        self.searched_nodes += 1
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise SearchTimeout("Time limit of the search exceeded")
+        if moves_without_capture is None:
+            moves_without_capture = self.game.game_board.move_count
+        if not is_root:
+            endgame_score = self._probe_endgame_database(actual_board, actual_player, ply,
+                                                         moves_without_capture)
+            if endgame_score is not None:
+                return endgame_score if actual_player == player else -endgame_score, None
+        if depth == 0:
+            return self._evaluate_leaf(actual_board, actual_player, player, alpha, beta), None
+
+        game_state = self.game.game_board.check_game_state(actual_player,
+                                                           actual_board)
+        if game_state == GameStates.DRAW:
+            return 0, None
+        elif game_state == self.player_desired_game_state[player]:
+            return MAX_VAL, None
+        elif game_state == self.player_desired_game_state[self.next_player_dict[player]]:
+            return MIN_VAL, None
+
+        maximize = actual_player == player
+        score_factor = 1 if maximize else -1
+
+        possible_moves = self.game.game_board.get_legal_moves(actual_player,
+                                                              actual_board)
+        self._order_moves(possible_moves, ply)
+
+        window = (alpha, beta) if maximize else (-beta, -alpha)
+        table_entry = self._probe_transposition_table(key, depth, window, possible_moves,
+                                                      allow_cutoff=not is_root)
+        if table_entry is not None:
+            return score_factor * table_entry.score, table_entry.best_move
+        if first_move in possible_moves:
+            possible_moves.remove(first_move)
+            possible_moves.insert(0, first_move)
+
+        children_values = None
+        if depth == 1:
+            children_values = self._evaluate_children(actual_player, player, possible_moves,
+                                                      actual_board, ply,
+                                                      moves_without_capture)
+
+        best_move = None
+        best = MIN_VAL if maximize else MAX_VAL
+        for move_num, pos_move in enumerate(possible_moves):
+            if children_values is not None:
+                value = children_values[move_num]
+            else:
+                undo_record, child_key = self._apply_move_with_key(
+                    actual_player, pos_move, actual_board, key)
+                value, _ = self._search_alphabeta(
+                    depth=depth - 1,
+                    actual_player=self.next_player_dict[actual_player],
+                    player=player,
+                    actual_board=actual_board,
+                    alpha=alpha,
+                    beta=beta,
+                    key=child_key,
+                    ply=ply + 1,
+                    moves_without_capture=0 if pos_move.captured else
+                    moves_without_capture + 1
+                )
+                self._undo_move(undo_record, actual_board)
+            if maximize:
+                if best_move is None or value > best:
+                    best, best_move = value, pos_move
+                alpha = max(alpha, value)
+            else:
+                if best_move is None or value < best:
+                    best, best_move = value, pos_move
+                beta = min(beta, value)
+            if beta <= alpha:
+                self._record_cutoff(pos_move, ply, depth, move_num)
+                break
+
+        self._store_in_transposition_table(key, depth, window, score_factor * best,
+                                           best_move)
+
+        return best, best_move
+
+    def _search_pvs(self, depth, actual_player, player, actual_board, alpha, beta, key=None,
+                    is_root=False, first_move=None, ply=0, moves_without_capture=None):
+        """
+        Finds negamax value of the position with principal variation search,
+        first move gets the full window, the rest of them is searched with the
+        null window and searched again when it turns out better. Scores,
+        alpha and beta are from the point of view of the player to move
+        :param depth: Depth at which this particular branch can search further
+        :param actual_player: Player to move
+        :param player: The player for which the move is discovered, leaves
+        are evaluated for him
+        :param actual_board: Board modified in place during the search
+        :param alpha: Value that the player to move is already assured of
+        :param beta: Value that the opponent is already assured of
+        :param key: Zobrist key of the actual board, None when transposition
+        table is not used
+        :param is_root: Tells if the position is the root of the search
+        :param first_move: Move that is searched first in the position
+        :param ply: Distance of the position from the root of the search
+        :param moves_without_capture: Number of moves made since the last
+        capture, move count of the game board when None
+        :return: Tuple of the position value and the best move, move is None
+        for the leaves
+        """
+        self.searched_nodes += 1
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise SearchTimeout("Time limit of the search exceeded")
+        if moves_without_capture is None:
+            moves_without_capture = self.game.game_board.move_count
+        if not is_root:
+            endgame_score = self._probe_endgame_database(actual_board, actual_player, ply,
+                                                         moves_without_capture)
+            if endgame_score is not None:
+                return endgame_score, None
+        if depth == 0:
+            if actual_player == player:
+                return self._evaluate_leaf(actual_board, actual_player, player, alpha,
+                                           beta), None
+            return -self._evaluate_leaf(actual_board, actual_player, player, -beta,
+                                        -alpha), None
+
+        game_state = self.game.game_board.check_game_state(actual_player,
+                                                           actual_board)
+        if game_state == GameStates.DRAW:
+            return 0, None
+        elif game_state == self.player_desired_game_state[actual_player]:
+            return MAX_VAL, None
+        elif game_state == self.player_desired_game_state[self.next_player_dict[actual_player]]:
+            return MIN_VAL, None
+
+        possible_moves = self.game.game_board.get_legal_moves(actual_player,
+                                                              actual_board)
+        self._order_moves(possible_moves, ply)
+
+        window = (alpha, beta)
+        table_entry = self._probe_transposition_table(key, depth, window, possible_moves,
+                                                      allow_cutoff=not is_root)
+        if table_entry is not None:
+            return table_entry.score, table_entry.best_move
+        if first_move in possible_moves:
+            possible_moves.remove(first_move)
+            possible_moves.insert(0, first_move)
+
+        children_values = None
+        if depth == 1:
+            children_values = self._evaluate_children(actual_player, player, possible_moves,
+                                                      actual_board, ply,
+                                                      moves_without_capture)
+            if children_values is not None and actual_player != player:
+                children_values = [-value for value in children_values]
+
+        best_move = None
+        best = MIN_VAL
+        for move_num, pos_move in enumerate(possible_moves):
+            if children_values is not None:
+                value = children_values[move_num]
+            else:
+                undo_record, child_key = self._apply_move_with_key(
+                    actual_player, pos_move, actual_board, key)
+                child_search = dict(
+                    depth=depth - 1,
+                    actual_player=self.next_player_dict[actual_player],
+                    player=player,
+                    actual_board=actual_board,
+                    key=child_key,
+                    ply=ply + 1,
+                    moves_without_capture=0 if pos_move.captured else
+                    moves_without_capture + 1
+                )
+                if move_num == 0:
+                    value = -self._search_pvs(alpha=-beta, beta=-alpha, **child_search)[0]
+                else:
+                    value = -self._search_pvs(alpha=-alpha - 1, beta=-alpha,
+                                              **child_search)[0]
+                    if alpha < value < beta:
+                        value = -self._search_pvs(alpha=-beta, beta=-alpha,
+                                                  **child_search)[0]
+                self._undo_move(undo_record, actual_board)
+            if best_move is None or value > best:
+                best, best_move = value, pos_move
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                self._record_cutoff(pos_move, ply, depth, move_num)
+                break
+
+        self._store_in_transposition_table(key, depth, window, best, best_move)
+
+        return best, best_move
+
+    def _evaluate_children(self, actual_player, player, possible_moves, actual_board, ply,
+                           moves_without_capture):
+        """
+        Evaluates positions after all the moves in one call to the batch
+        evaluator, positions found in the endgame database get their exact
+        scores instead, the same as in the search
+        :param actual_player: Player making the moves
+        :param player: The player for which the move is discovered
+        :param possible_moves: Moves of the position
+        :param actual_board: Board of the position, it is restored after the
+        moves
+        :param ply: Distance of the position from the root of the search
+        :param moves_without_capture: Number of moves made since the last
+        capture before the moves
+        :return: List of the values of the positions for the player, None when
+        the batch evaluator is not used
+        """
+        if self.batch_evaluator is None or self.use_quiescence:
+            return None
+        next_player = self.next_player_dict[actual_player]
+        children_values = []
+        children_boards = []
+        for pos_move in possible_moves:
+            undo_record = self.game.game_board.apply_move(
+                player_id=actual_player,
+                move_coords=pos_move,
+                board=actual_board
+            )
+            endgame_score = self._probe_endgame_database(
+                actual_board, next_player, ply + 1,
+                0 if pos_move.captured else moves_without_capture + 1)
+            if endgame_score is None:
+                children_values.append(None)
+                children_boards.append(self._get_board_copy(actual_board))
+            else:
+                children_values.append(endgame_score if next_player == player else
+                                       -endgame_score)
+            self.game.game_board.undo_move(undo_record, actual_board)
+        self.searched_nodes += len(children_values)
+        if children_boards:
+            batch_values = iter(self.batch_evaluator.evaluate(
+                self.batch_evaluator.encode_boards(children_boards), player).tolist())
+            children_values = [next(batch_values) if value is None else value
+                               for value in children_values]
+        return children_values
+
+    def _evaluate_leaf(self, actual_board, actual_player, player, alpha, beta):
+        """
+        Evaluates the position at the end of the search depth, searches the
+        captures further when quiescence search is used
+        :param actual_board: Board of the position
+        :param actual_player: Player to move
+        :param player: The player for which the move is discovered
+        :param alpha: Value that the maximizing player is already assured of
+        :param beta: Value that the minimizing player is already assured of
+        :return: Value of the position for the player
+        """
+        if not self.use_quiescence:
+            return self._static_evaluation_value(actual_board=actual_board, player=player)
+        return self._quiescence_search(actual_player, player, actual_board, alpha, beta, 0)
+
+    def _quiescence_search(self, actual_player, player, actual_board, alpha, beta,
+                           quiescence_depth):
+        """
+        Searches only the capture moves until the player to move has none of
+        them, captures are forced so the player can not choose the static
+        value instead. Search is cut at the static value when the node limit
+        of the quiescence search is reached
+        :param actual_player: Player to move
+        :param player: The player for which the move is discovered
+        :param actual_board: Board modified in place during the search
+        :param alpha: Value that the maximizing player is already assured of
+        :param beta: Value that the minimizing player is already assured of
+        :param quiescence_depth: Number of captures made after the search
+        depth
+        :return: Value of the quiet position for the player
+        """
+        self.quiescence_nodes += 1
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise SearchTimeout("Time limit of the search exceeded")
+        if quiescence_depth > self.quiescence_max_depth:
+            self.quiescence_max_depth = quiescence_depth
+
+        possible_moves = self.game.game_board.get_legal_moves(actual_player, actual_board)
+        if not possible_moves:
+            # Player without moves has lost the game, the same as in
+            # _search_alphabeta
+            return MIN_VAL if actual_player == player else MAX_VAL
+        if not possible_moves[0].captured:
+            return self._static_evaluation_value(actual_board=actual_board, player=player)
+        if self.quiescence_nodes > self.quiescence_nodes_limit:
+            self.quiescence_limit_hits += 1
+            return self._static_evaluation_value(actual_board=actual_board, player=player)
+        possible_moves.sort(key=CheckersMove.get_captures_num, reverse=True)
+
+        maximize = actual_player == player
+        best = MIN_VAL if maximize else MAX_VAL
+        for pos_move in possible_moves:
+            undo_record, _ = self._apply_move_with_key(actual_player, pos_move, actual_board,
+                                                       None)
+            value = self._quiescence_search(self.next_player_dict[actual_player], player,
+                                            actual_board, alpha, beta, quiescence_depth + 1)
+            self._undo_move(undo_record, actual_board)
+            if maximize:
+                best = max(best, value)
+                alpha = max(alpha, value)
+            else:
+                best = min(best, value)
+                beta = min(beta, value)
+            if beta <= alpha:
+                break
         return best
 
+    def get_quiescence_stats(self):
+        """
+        :return: QuiescenceStats of the last search
+        """
+        return QuiescenceStats(self.quiescence_nodes, self.quiescence_max_depth,
+                               self.quiescence_limit_hits)
+
+    def _order_moves(self, possible_moves, ply):
+        """
+        Orders moves of the position with the move orderer, when it is used
+        :param possible_moves: List of moves of the position, gets reordered
+        :param ply: Distance of the position from the root of the search
+        """
+        if self.move_orderer is not None:
+            self.move_orderer.order_moves(possible_moves, ply)
+
+    def _record_cutoff(self, move, ply, depth, move_num):
+        """
+        Passes the move that caused the cutoff to the move orderer, when it is
+        used
+        :param move: Move that caused the cutoff
+        :param ply: Distance of the position from the root of the search
+        :param depth: Depth left for the search of the position
+        :param move_num: Index of the move in the searched order
+        """
+        if self.move_orderer is not None:
+            self.move_orderer.record_cutoff(move, ply, depth, move_num)
+
+    def get_move_ordering_stats(self):
+        """
+        :return: MoveOrderingStats of the last alpha beta search, None when
+        the move orderer is not used
+        """
+        if self.move_orderer is None:
+            return None
+        return self.move_orderer.get_stats()
+
+    def _probe_transposition_table(self, key, depth, window, possible_moves, allow_cutoff):
+        """
+        Looks for the position in the transposition table, moves the stored
+        best move to the front of possible moves
+        :param key: Zobrist key of the position, None when table is not used
+        :param depth: Depth at which the position is going to be searched
+        :param window: Tuple of (alpha, beta) from the point of view of the
+        player to move
+        :param possible_moves: List of moves of the position, gets reordered
+        :param allow_cutoff: Tells if the stored score can replace the search
+        :return: Table entry when its score can be returned without the
+        search, None otherwise
+        """
+        if key is None:
+            return None
+        table_key, mirrored = self.zobrist_hashing.get_table_key(key)
+        table_entry = self.transposition_table.probe(table_key)
+        if table_entry is None:
+            return None
+        if mirrored and table_entry.best_move is not None:
+            table_entry = table_entry._replace(best_move=table_entry.best_move.get_mirrored())
+        if allow_cutoff and table_entry.depth >= depth and (
+                table_entry.bound == TranspositionTable.Bound.EXACT or
+                (table_entry.bound == TranspositionTable.Bound.LOWER and
+                 table_entry.score >= window[1]) or
+                (table_entry.bound == TranspositionTable.Bound.UPPER and
+                 table_entry.score <= window[0])):
+            return table_entry
+        if table_entry.best_move in possible_moves:
+            possible_moves.remove(table_entry.best_move)
+            possible_moves.insert(0, table_entry.best_move)
+        return None
+
+    def _store_in_transposition_table(self, key, depth, window, score, best_move):
+        """
+        Stores result of the position search in the transposition table
+        :param key: Zobrist key of the position, None when table is not used
+        :param depth: Depth at which the position was searched
+        :param window: Tuple of (alpha, beta) from the point of view of the
+        player to move, with which the search was started
+        :param score: Score from the point of view of the player to move
+        :param best_move: Best move found in the position
+        """
+        if key is None:
+            return
+        if score <= window[0]:
+            bound = TranspositionTable.Bound.UPPER
+        elif score >= window[1]:
+            bound = TranspositionTable.Bound.LOWER
+        else:
+            bound = TranspositionTable.Bound.EXACT
+        table_key, mirrored = self.zobrist_hashing.get_table_key(key)
+        if mirrored and best_move is not None:
+            best_move = best_move.get_mirrored()
+        self.transposition_table.store(table_key, depth, bound, score, best_move)
+
+    def _probe_endgame_database(self, actual_board, actual_player, ply, moves_without_capture):
+        """
+        Looks for the position in the endgame database. The database does not
+        know about the moves without capture limit, so the win or the loss is
+        only taken when its distance fits in the moves left before the limit,
+        the position is searched otherwise
+        :param actual_board: Board of the position
+        :param actual_player: Player to move
+        :param ply: Distance of the position from the root of the search,
+        added to the distance to the end of the game
+        :param moves_without_capture: Number of moves made since the last
+        capture before the position, the root moves of the game board
+        included
+        :return: Score of the position from the point of view of the player to
+        move, None when the database is not used or does not contain it
+        """
+        if self.endgame_database is None or \
+                moves_without_capture >= GameBoard.max_moves_without_capture:
+            return None
+        if not isinstance(actual_board, BitBoard):
+            actual_board = self.game.game_board.get_board_copy(actual_board, 'bitboard')
+        endgame_entry = self.endgame_database.probe(actual_board, actual_player.value)
+        if endgame_entry is None:
+            return None
+        if endgame_entry.result == 0:
+            return 0
+        if endgame_entry.distance is None or endgame_entry.distance > \
+                GameBoard.max_moves_without_capture - moves_without_capture:
+            return None
+        distance = ply + endgame_entry.distance
+        return MAX_VAL - distance if endgame_entry.result > 0 else MIN_VAL + distance
+
+    def _apply_move_with_key(self, actual_player, move, actual_board, key):
+        """
+        Applies move on the board and updates Zobrist key of the position and
+        the incremental evaluation when it is kept for the board
+        :param actual_player: Player making the move
+        :param move: CheckersMove to apply
+        :param actual_board: Board that gets modified
+        :param key: Zobrist key of the board before the move, None when keys
+        are not tracked
+        :return: Undo record of the move, key of the board after the move
+        """
+        evaluation_tracked = self.incremental_evaluation is not None and \
+            self.incremental_evaluation.tracks(actual_board)
+        if evaluation_tracked:
+            self.incremental_evaluation.before_move(move)
+        if key is not None:
+            move_squares = self.zobrist_hashing.get_move_squares(move)
+            squares_key = self.zobrist_hashing.get_squares_key(actual_board, move_squares)
+        undo_record = self.game.game_board.apply_move(
+            player_id=actual_player,
+            move_coords=move,
+            board=actual_board
+        )
+        if evaluation_tracked:
+            self.incremental_evaluation.after_move()
+        if key is None:
+            return undo_record, None
+        return undo_record, self.zobrist_hashing.get_key_after_move(
+            key, move_squares, squares_key, actual_board)
+
+    def _undo_move(self, undo_record, actual_board):
+        """
+        Undoes move applied with _apply_move_with_key
+        :param undo_record: Undo record of the move
+        :param actual_board: Board that gets restored
+        """
+        self.game.game_board.undo_move(undo_record, actual_board)
+        if self.incremental_evaluation is not None and \
+                self.incremental_evaluation.tracks(actual_board):
+            self.incremental_evaluation.undo()
+
+    def _get_board_copy(self, board=None, copy_format='list'):
+        """
+        Creates copy of the given board, keeps it in the BitBoard
+        representation when bitboard backend is used
+        :param board: Board to copy, actual game board if not specified
+        :param copy_format: Format of the copy for the lists backend
+        :return: Board copy
+        """
+        if self.use_bitboard:
+            copy_format = 'bitboard'
+        return self.game.game_board.get_board_copy(board, copy_format=copy_format)
+
     def _static_evaluation_value(self, actual_board, player):
         """
         Function for static evaluation of the board for minimax algorithm
@@ -403,7 +1579,12 @@ class CheckersTreeBuilder(TreeBuilderABC):
         returned
         :return: Value of evaluated board
         """
-        player_pawns = GameBoard.allowed_pawns[player]
+        if self.incremental_evaluation is not None:
+            if self.incremental_evaluation.tracks(actual_board):
+                return self.incremental_evaluation.get_value(player)
+            return self.incremental_evaluation.evaluate_board(actual_board, player)
+        if isinstance(actual_board, BitBoard):
+            return self._static_evaluation_value_bitboard(actual_board, player)
 
         total_value = 0
 
@@ -415,6 +1596,27 @@ class CheckersTreeBuilder(TreeBuilderABC):
 
         return total_value
 
+    def _static_evaluation_value_bitboard(self, actual_board, player):
+        """
+        Static evaluation of the board in BitBoard representation, gives the
+        same values as _static_evaluation_value
+        :param actual_board: BitBoard that will get evaluated
+        :param player: Player for which evaluated score of the board will be
+        returned
+        :return: Value of evaluated board
+        """
+        pawns_values = CheckersTreeBuilder.pawns_values[player]
+        total_value = 0
+        for pawns, checker_sign, king_sign in (
+                (actual_board.player1_pawns, GameBoard.BoardSigns.PLAYER1_CHECKER.value,
+                 GameBoard.BoardSigns.PLAYER1_KING.value),
+                (actual_board.player2_pawns, GameBoard.BoardSigns.PLAYER2_CHECKER.value,
+                 GameBoard.BoardSigns.PLAYER2_KING.value)):
+            kings_num = count_squares(pawns & actual_board.kings)
+            total_value += kings_num * pawns_values[king_sign] + \
+                (count_squares(pawns) - kings_num) * pawns_values[checker_sign]
+        return total_value
+
 
 if __name__ == '__main__':
     pass
@@ -13,17 +13,24 @@ class Game(GameABC):
         started"""
         pass
 
-    def __init__(self, starting_player=GameBoard.BoardSigns.EMPTY):
+    def __init__(self, starting_player=GameBoard.BoardSigns.EMPTY, board_size=3,
+                 winning_combination=3):
         """
         The game should be started for start_game method after initialization
         :param starting_player: Tells which player will be moving first, when
         enum value is set to EMPTY, first player will be drawn
         (GameBoard.BoardSigns enum value)
+        :param board_size: Number of fields in the row and column of the board
+        :param winning_combination: Number of signs in a row needed to win
         """
+        self.board_size = board_size
+        self.winning_combination = winning_combination
 
         self.game_board = None
         self.current_players_turn = None
         self.starting_player = starting_player
+        # Moves made since the start of the game in UCI format
+        self.moves_list = []
 
     def make_move(self, move_coords):
         """
@@ -33,6 +40,7 @@ class Game(GameABC):
         :return:
         """
         self.game_board.make_move(self.current_players_turn, move_coords)
+        self.moves_list.append(move_coords)
 
         next_player_dict = {
             GameBoard.BoardSigns.PLAYER1: GameBoard.BoardSigns.PLAYER2,
@@ -45,7 +53,8 @@ class Game(GameABC):
         Method that returns actual game state
         :return: GameStates enum representing actual game state
         """
-        return self.game_board.check_game_state()
+        return self.game_board.check_game_state(
+            last_move=self.moves_list[-1] if self.moves_list else None)
 
     def get_board(self):
         """
@@ -65,7 +74,8 @@ class Game(GameABC):
         return self.current_players_turn
 
     def start_game(self):
-        self.game_board = GameBoard()
+        self.game_board = GameBoard(self.board_size, self.winning_combination)
+        self.moves_list = []
         if self.starting_player == GameBoard.BoardSigns.EMPTY:
             self.current_players_turn = random.choice([
                 GameBoard.BoardSigns.PLAYER1, GameBoard.BoardSigns.PLAYER2])
@@ -0,0 +1,88 @@
+"""Module providing static evaluation of many tic tac toe positions in one
+vectorised pass. Positions are encoded as int8 arrays of the board fields, 1
+for the sign of the first player, 2 for the sign of the second player and 0
+for the empty fields. Neighbours of all the fields are counted at once with
+the sum over the 3x3 window around every field"""
+import numpy as np
+
+from decision_games_with_ai.games.tic_tac_toe.game_implementation.bitboard import BitBoard
+from decision_games_with_ai.games.tic_tac_toe.game_implementation.game_board import GameBoard
+
+EMPTY_CODE = 0
+
+SIGNS_CODES = {
+    GameBoard.BoardSigns.PLAYER1.value: 1,
+    GameBoard.BoardSigns.PLAYER2.value: 2
+}
+
+PLAYERS_CODES = {
+    GameBoard.BoardSigns.PLAYER1: 1,
+    GameBoard.BoardSigns.PLAYER2: 2
+}
+
+
+def get_window_sums(fields):
+    """
+    Sums values of the 3x3 window around every field, fields outside of the
+    board count as zeros
+    :param fields: Array of shape (N, size, size)
+    :return: Array of the same shape with the sums
+    """
+    padded = np.pad(fields, ((0, 0), (1, 1), (1, 1)))
+    rows_sums = padded[:, :, :-2] + padded[:, :, 1:-1] + padded[:, :, 2:]
+    return rows_sums[:, :-2] + rows_sums[:, 1:-1] + rows_sums[:, 2:]
+
+
+class BatchEvaluator:
+    """Class evaluating batches of positions, with the default values the
+    results are the same as given by
+    TicTacToeTreeBuilder._static_evaluation_value"""
+
+    def __init__(self, value_of_neigh_signs=5, value_of_near_empty_field=1):
+        """
+        :param value_of_neigh_signs: Value of the players sign next to the
+        players sign
+        :param value_of_near_empty_field: Value of the empty field next to the
+        players sign
+        """
+        self.value_of_neigh_signs = value_of_neigh_signs
+        self.value_of_near_empty_field = value_of_near_empty_field
+
+    @staticmethod
+    def encode_boards(boards):
+        """
+        Encodes boards as arrays of the fields codes
+        :param boards: Sequence of boards of the same size in lists, tuples or
+        BitBoard representation
+        :return: int8 array of shape (N, size, size)
+        """
+        if boards and isinstance(boards[0], BitBoard):
+            board_size = boards[0].masks.board_size
+            fields_num = board_size * board_size
+            bytes_num = (fields_num + 7) // 8
+            signs_bytes = b''.join(
+                board.player1_signs.to_bytes(bytes_num, 'little') +
+                board.player2_signs.to_bytes(bytes_num, 'little') for board in boards)
+            bits = np.unpackbits(np.frombuffer(signs_bytes, dtype=np.uint8).reshape(
+                len(boards), 2, bytes_num), axis=2, bitorder='little')[:, :, :fields_num]
+            return (bits[:, 0] + 2 * bits[:, 1]).astype(np.int8).reshape(
+                -1, board_size, board_size)
+        return np.array([[[SIGNS_CODES.get(sign, EMPTY_CODE) for sign in row] for row in board]
+                         for board in boards], dtype=np.int8)
+
+    def evaluate(self, encoded_boards, player):
+        """
+        Evaluates all the encoded boards
+        :param encoded_boards: int8 array of shape (N, size, size) given by
+        encode_boards
+        :param player: GameBoard.BoardSigns enum value of the player for which
+        the boards are evaluated
+        :return: Array of N values
+        """
+        codes = np.asarray(encoded_boards)
+        players_fields = (codes == PLAYERS_CODES[player]).astype(np.int32)
+        empty_fields = (codes == EMPTY_CODE).astype(np.int32)
+        fields_values = \
+            self.value_of_neigh_signs * (get_window_sums(players_fields) - players_fields) + \
+            self.value_of_near_empty_field * get_window_sums(empty_fields)
+        return (players_fields * fields_values).sum(axis=(1, 2))
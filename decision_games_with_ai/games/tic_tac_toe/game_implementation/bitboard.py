@@ -0,0 +1,283 @@
+"""Module containing bitboard representation of the tic tac toe board.
+
+Field with indexes (x, y) has index ``y * board_size + x``, signs of each
+player are kept as one integer with the bits of their fields set. Move is a
+single or, possible moves are the fields outside of the occupied mask and the
+win is found by comparing the signs with the precomputed masks of the lines,
+only the lines going through the last move when it is known.
+
+When the masks are created with the candidates distance, the bitboard keeps
+also the mask of the candidate moves, empty fields not further than the
+distance from any sign. It is updated with every move and possible moves are
+limited to it, which keeps the branching factor of the big boards small.
+"""
+from functools import lru_cache
+
+from decision_games_with_ai.games.utils.coords_formatters import CoordsFormatter
+from decision_games_with_ai.games.utils.events_exceptions import InvalidMoveException
+from decision_games_with_ai.games.utils.global_enums import GameStates
+
+PLAYER1_INDEX = 0
+PLAYER2_INDEX = 1
+
+# Directions of the rows, columns and both diagonals
+LINES_DIRECTIONS = ((1, 0), (0, 1), (1, 1), (1, -1))
+
+NEIGHBOURS_DIRECTIONS = tuple((x_dir, y_dir) for y_dir in (-1, 0, 1) for x_dir in (-1, 0, 1)
+                              if x_dir or y_dir)
+
+
+def count_fields(mask):
+    """
+    Counts fields set in the mask
+    :param mask: Bit mask of fields
+    :return: Number of the fields
+    """
+    return bin(mask).count('1')
+
+
+class BitBoardMasks:
+    """Class with the masks precomputed for the board size and the winning
+    combination, shared by all bitboards of the same game"""
+
+    def __init__(self, board_size, winning_combination, candidates_distance=None):
+        """
+        :param board_size: Number of fields in the row and column of the board
+        :param winning_combination: Number of signs in a row needed to win
+        :param candidates_distance: Maximal distance of the candidate move from
+        the signs on the board, counted in fields also along the diagonals,
+        None for all empty fields being possible moves
+        """
+        self.board_size = board_size
+        self.winning_combination = winning_combination
+        self.candidates_distance = candidates_distance
+        fields_num = board_size * board_size
+        self.full_mask = (1 << fields_num) - 1
+        self.fields_names = tuple(
+            CoordsFormatter.translate_from_xy_to_uci(field % board_size, field // board_size)
+            for field in range(fields_num))
+        self.fields_indexes = {name: field for field, name in enumerate(self.fields_names)}
+
+        self.winning_masks = []
+        fields_winning_masks = [[] for _ in range(fields_num)]
+        for y_ind in range(board_size):
+            for x_ind in range(board_size):
+                for x_dir, y_dir in LINES_DIRECTIONS:
+                    line_fields = [(x_ind + distance * x_dir, y_ind + distance * y_dir)
+                                   for distance in range(winning_combination)]
+                    if not all(0 <= x < board_size and 0 <= y < board_size
+                               for x, y in line_fields):
+                        continue
+                    line_mask = 0
+                    for x, y in line_fields:
+                        line_mask |= 1 << (y * board_size + x)
+                    self.winning_masks.append(line_mask)
+                    for x, y in line_fields:
+                        fields_winning_masks[y * board_size + x].append(line_mask)
+        self.winning_masks = tuple(self.winning_masks)
+        self.fields_winning_masks = tuple(tuple(masks) for masks in fields_winning_masks)
+
+        # (source mask, shift) pairs, shifting the board right by the shift
+        # puts the neighbour in the direction on the field, source mask
+        # contains fields that have the neighbour on the board
+        self.neighbours_shifts = []
+        for x_dir, y_dir in NEIGHBOURS_DIRECTIONS:
+            source_mask = 0
+            for field in range(fields_num):
+                y_ind, x_ind = divmod(field, board_size)
+                if 0 <= x_ind + x_dir < board_size and 0 <= y_ind + y_dir < board_size:
+                    source_mask |= 1 << field
+            self.neighbours_shifts.append((source_mask, y_dir * board_size + x_dir))
+        self.neighbours_shifts = tuple(self.neighbours_shifts)
+
+        # Fields not further than the candidates distance from each field,
+        # the middle field is the only candidate on the empty board
+        self.neighbourhood_masks = None
+        self.middle_mask = 1 << (board_size // 2 * board_size + board_size // 2)
+        if candidates_distance is not None:
+            self.neighbourhood_masks = []
+            for field in range(fields_num):
+                y_ind, x_ind = divmod(field, board_size)
+                neighbourhood_mask = 0
+                for near_y in range(max(0, y_ind - candidates_distance),
+                                    min(board_size, y_ind + candidates_distance + 1)):
+                    for near_x in range(max(0, x_ind - candidates_distance),
+                                        min(board_size, x_ind + candidates_distance + 1)):
+                        neighbourhood_mask |= 1 << (near_y * board_size + near_x)
+                self.neighbourhood_masks.append(neighbourhood_mask)
+            self.neighbourhood_masks = tuple(self.neighbourhood_masks)
+
+
+@lru_cache(maxsize=None)
+def get_bitboard_masks(board_size, winning_combination, candidates_distance=None):
+    """
+    :param board_size: Number of fields in the row and column of the board
+    :param winning_combination: Number of signs in a row needed to win
+    :param candidates_distance: Maximal distance of the candidate move from
+    the signs on the board, None for no candidate moves limit
+    :return: BitBoardMasks object, the same one for the same parameters
+    """
+    return BitBoardMasks(board_size, winning_combination, candidates_distance)
+
+
+class BitBoard:
+    """Stores tic tac toe position as two integers and provides methods for
+    finding and making moves and checking the game state on it"""
+
+    __slots__ = ('player1_signs', 'player2_signs', 'masks', 'candidates')
+
+    def __init__(self, masks, player1_signs=0, player2_signs=0, candidates=None):
+        """
+        :param masks: BitBoardMasks of the game
+        :param player1_signs: Bit mask of the fields of the first player
+        :param player2_signs: Bit mask of the fields of the second player
+        :param candidates: Bit mask of the candidate moves, computed from the
+        signs when not given and the masks have the candidates distance
+        """
+        self.masks = masks
+        self.player1_signs = player1_signs
+        self.player2_signs = player2_signs
+        self.candidates = candidates
+        if candidates is None and masks.neighbourhood_masks is not None:
+            self.update_candidates()
+
+    def __eq__(self, other):
+        return isinstance(other, BitBoard) and \
+            self.player1_signs == other.player1_signs and \
+            self.player2_signs == other.player2_signs and \
+            self.masks.board_size == other.masks.board_size
+
+    def __hash__(self):
+        return hash((self.player1_signs, self.player2_signs))
+
+    def __repr__(self):
+        return "BitBoard({:#x}, {:#x})".format(self.player1_signs, self.player2_signs)
+
+    def copy(self):
+        """
+        Creates copy of the bitboard
+        :return: New BitBoard object
+        """
+        return BitBoard(self.masks, self.player1_signs, self.player2_signs, self.candidates)
+
+    def update_candidates(self):
+        """
+        Computes the candidate moves mask from scratch, needed after the signs
+        are changed other way than with apply_move
+        """
+        occupied = self.player1_signs | self.player2_signs
+        candidates = 0
+        neighbourhood_masks = self.masks.neighbourhood_masks
+        signs = occupied
+        while signs:
+            lowest_bit = signs & -signs
+            candidates |= neighbourhood_masks[lowest_bit.bit_length() - 1]
+            signs ^= lowest_bit
+        self.candidates = candidates & ~occupied
+
+    def get_players_signs(self, player_index):
+        """
+        :param player_index: Index of the player (0 or 1)
+        :return: Bit mask of the players signs
+        """
+        return self.player1_signs if player_index == PLAYER1_INDEX else self.player2_signs
+
+    def get_possible_moves(self):
+        """
+        Finds empty fields of the board, only the candidate moves when the
+        masks have the candidates distance
+        :return: List of moves in UCI format, ordered the same as the fields
+        of the lists board
+        """
+        occupied = self.player1_signs | self.player2_signs
+        empty_fields = self.masks.full_mask & ~occupied
+        if self.candidates:
+            empty_fields = self.candidates
+        elif not occupied and self.masks.neighbourhood_masks is not None:
+            empty_fields = self.masks.middle_mask
+        fields_names = self.masks.fields_names
+        possible_moves = []
+        while empty_fields:
+            lowest_bit = empty_fields & -empty_fields
+            possible_moves.append(fields_names[lowest_bit.bit_length() - 1])
+            empty_fields ^= lowest_bit
+        return possible_moves
+
+    def make_move(self, player_index, move_coords):
+        """
+        Makes move on the copy of the bitboard
+        :param player_index: Index of the player (0 or 1)
+        :param move_coords: Move in UCI format
+        :return: New BitBoard object after making move
+        """
+        new_board = self.copy()
+        new_board.apply_move(player_index, move_coords)
+        return new_board
+
+    def apply_move(self, player_index, move_coords):
+        """
+        Puts sign of the player on the field in place
+        :param player_index: Index of the player (0 or 1)
+        :param move_coords: Move in UCI format
+        """
+        field = self.masks.fields_indexes[move_coords]
+        field_bit = 1 << field
+        if (self.player1_signs | self.player2_signs) & field_bit:
+            raise InvalidMoveException("The chosen field is not empty. Move is invalid.")
+        if player_index == PLAYER1_INDEX:
+            self.player1_signs |= field_bit
+        else:
+            self.player2_signs |= field_bit
+        if self.candidates is not None:
+            self.candidates = (self.candidates | self.masks.neighbourhood_masks[field]) & \
+                ~(self.player1_signs | self.player2_signs)
+
+    def get_game_state(self, last_move=None):
+        """
+        Checks if the game has ended
+        :param last_move: Last move made on the board in UCI format, when
+        given only the lines going through its field are checked, which
+        requires that the game was ongoing before the move
+        :return: GameStates state in which game is now
+        """
+        if last_move is not None:
+            field = self.masks.fields_indexes[last_move]
+            if self.player1_signs >> field & 1:
+                signs, winner_state = self.player1_signs, GameStates.PLAYER1WIN
+            else:
+                signs, winner_state = self.player2_signs, GameStates.PLAYER2WIN
+            for line_mask in self.masks.fields_winning_masks[field]:
+                if signs & line_mask == line_mask:
+                    return winner_state
+        else:
+            for line_mask in self.masks.winning_masks:
+                if self.player1_signs & line_mask == line_mask:
+                    return GameStates.PLAYER1WIN
+                if self.player2_signs & line_mask == line_mask:
+                    return GameStates.PLAYER2WIN
+
+        if self.player1_signs | self.player2_signs == self.masks.full_mask:
+            return GameStates.DRAW
+        return GameStates.ONGOING
+
+    def get_neighbours_counts(self, player_index):
+        """
+        Counts pairs of the neighbouring fields, fields touching with the
+        corner are neighbours too
+        :param player_index: Index of the player (0 or 1)
+        :return: Tuple of the number of players signs next to the players
+        signs and the number of empty fields next to the players signs
+        """
+        signs = self.get_players_signs(player_index)
+        empty_fields = self.masks.full_mask & ~(self.player1_signs | self.player2_signs)
+        signs_neighbours = 0
+        empty_neighbours = 0
+        for source_mask, shift in self.masks.neighbours_shifts:
+            source_signs = signs & source_mask
+            if shift > 0:
+                signs_neighbours += count_fields(source_signs & (signs >> shift))
+                empty_neighbours += count_fields(source_signs & (empty_fields >> shift))
+            else:
+                signs_neighbours += count_fields(source_signs & (signs << -shift))
+                empty_neighbours += count_fields(source_signs & (empty_fields << -shift))
+        return signs_neighbours, empty_neighbours
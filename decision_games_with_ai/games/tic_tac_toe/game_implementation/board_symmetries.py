@@ -0,0 +1,103 @@
+"""Module providing symmetries of the square tic tac toe board. Rotations and
+reflections of the board do not change the game, so positions equal after
+one of them share one canonical key and moves leading to symmetric positions
+need to be searched only once"""
+from decision_games_with_ai.games.tic_tac_toe.game_implementation.game_board import GameBoard
+from decision_games_with_ai.games.utils.coords_formatters import CoordsFormatter
+
+
+class BoardSymmetries:
+    """Class providing the eight symmetries of the square board. Fields are
+    indexed y * board_size + x, symmetry is a tuple telling which field of the
+    original board lands on each field of the transformed one"""
+
+    # Digits of the fields in the position key
+    signs_digits = {
+        GameBoard.BoardSigns.EMPTY.value: 0,
+        GameBoard.BoardSigns.PLAYER1.value: 1,
+        GameBoard.BoardSigns.PLAYER2.value: 2
+    }
+
+    def __init__(self, board_size):
+        """
+        :param board_size: Number of fields in the row and column of the board
+        """
+        self.board_size = board_size
+        self.symmetries = self._create_symmetries()
+
+    def _create_symmetries(self):
+        """
+        :return: Tuple of the symmetries, the identity is the first one
+        """
+        symmetries = []
+        for transpose in (False, True):
+            for flip_x in (False, True):
+                for flip_y in (False, True):
+                    symmetry = []
+                    for field in range(self.board_size * self.board_size):
+                        y_ind, x_ind = divmod(field, self.board_size)
+                        if transpose:
+                            x_ind, y_ind = y_ind, x_ind
+                        if flip_x:
+                            x_ind = self.board_size - 1 - x_ind
+                        if flip_y:
+                            y_ind = self.board_size - 1 - y_ind
+                        symmetry.append(y_ind * self.board_size + x_ind)
+                    symmetries.append(tuple(symmetry))
+        return tuple(symmetries)
+
+    @staticmethod
+    def get_fields(board):
+        """
+        :param board: Board arrays
+        :return: List of the board signs indexed y * board_size + x
+        """
+        return [sign for row in board for sign in row]
+
+    def get_canonical_key(self, fields, player):
+        """
+        Finds key of the position that is the same for all its symmetries
+        :param fields: List of the board signs indexed y * board_size + x
+        :param player: Player to move (GameBoard.BoardSigns enum value)
+        :return: Tuple of the smallest key among the symmetric positions and
+        the symmetry that gives it, fields of the canonical position are
+        mapped back to the board with symmetry[field]
+        """
+        signs_digits = self.signs_digits
+        best_key = None
+        best_symmetry = None
+        for symmetry in self.symmetries:
+            key = signs_digits[player.value]
+            for field in symmetry:
+                key = key * 3 + signs_digits[fields[field]]
+            if best_key is None or key < best_key:
+                best_key, best_symmetry = key, symmetry
+        return best_key, best_symmetry
+
+    def get_unique_moves(self, board, possible_moves):
+        """
+        Removes moves leading to the same position as some earlier move after
+        a symmetry that leaves the board unchanged
+        :param board: Board arrays
+        :param possible_moves: List of moves in UCI format
+        :return: List of moves with the first move of every group of the
+        symmetric ones, in the order of possible_moves
+        """
+        fields = self.get_fields(board)
+        invariant_symmetries = [
+            symmetry for symmetry in self.symmetries[1:]
+            if all(fields[original] == fields[field] for field, original in enumerate(symmetry))
+        ]
+        if not invariant_symmetries:
+            return possible_moves
+
+        unique_moves = []
+        covered_fields = set()
+        for move in possible_moves:
+            x_ind, y_ind = CoordsFormatter.translate_from_uci_to_xy(move)
+            field = y_ind * self.board_size + x_ind
+            if field in covered_fields:
+                continue
+            unique_moves.append(move)
+            covered_fields.update(symmetry[field] for symmetry in invariant_symmetries)
+        return unique_moves
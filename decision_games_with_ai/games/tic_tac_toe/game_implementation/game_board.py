@@ -1,12 +1,42 @@
 from enum import Enum
 
 from decision_games_with_ai.games.game_board_abc import GameBoardABC
+from decision_games_with_ai.games.tic_tac_toe.game_implementation.bitboard import BitBoard, \
+    PLAYER1_INDEX, PLAYER2_INDEX, get_bitboard_masks
 from decision_games_with_ai.games.utils.events_exceptions import InvalidMoveException
 from decision_games_with_ai.games.utils.coords_formatters import CoordsFormatter
 from decision_games_with_ai.games.utils.global_enums import GameStates
 from decision_games_with_ai.games.utils.view_modificators import create_string_board_from_output
 
 
+class ListBoard(list):
+    """Board in lists which counts its empty fields, so the draw is found
+    without scanning the board. GameBoard.make_move keeps the counter, after
+    changing the rows in other way update_empty_fields has to be called"""
+
+    __slots__ = ('empty_fields',)
+
+    def __init__(self, rows=(), empty_fields=None):
+        """
+        :param rows: Rows of the board
+        :param empty_fields: Number of the empty fields, counted from the rows
+        when not given
+        """
+        super().__init__(rows)
+        self.empty_fields = empty_fields
+        if empty_fields is None:
+            self.update_empty_fields()
+
+    def update_empty_fields(self):
+        """
+        Counts the empty fields of the board from scratch
+        """
+        self.empty_fields = sum(row.count(GameBoard.BoardSigns.EMPTY.value) for row in self)
+
+    def __reduce__(self):
+        return ListBoard, (list(self), self.empty_fields)
+
+
 class GameBoard(GameBoardABC):
     """Stores game board and provides method to manipulate on it"""
 
@@ -16,9 +46,24 @@ class GameBoard(GameBoardABC):
         PLAYER2 = 'o'
         EMPTY = '-'
 
-    def __init__(self):
-        self.board_size = 3
-        self.winning_combination = 3
+    # Directions of the rows, columns and both diagonals
+    lines_directions = ((1, 0), (0, 1), (1, 1), (1, -1))
+
+    players_indexes = {
+        BoardSigns.PLAYER1: PLAYER1_INDEX,
+        BoardSigns.PLAYER2: PLAYER2_INDEX
+    }
+
+    def __init__(self, board_size=3, winning_combination=3):
+        """
+        :param board_size: Number of fields in the row and column of the board
+        :param winning_combination: Number of signs in a row, column or
+        diagonal that wins the game
+        """
+        if not 0 < winning_combination <= board_size:
+            raise ValueError("Winning combination has to fit on the board")
+        self.board_size = board_size
+        self.winning_combination = winning_combination
         self._initialize_board()
 
     def _initialize_board(self):
@@ -27,9 +72,9 @@ class GameBoard(GameBoardABC):
         :return:
         """
 
-        self.board_arrays = [
-            [GameBoard.BoardSigns.EMPTY.value for x in range(self.board_size)]
-            for y in range(self.board_size)]
+        self.board_arrays = ListBoard(
+            [[GameBoard.BoardSigns.EMPTY.value for x in range(self.board_size)]
+             for y in range(self.board_size)], self.board_size * self.board_size)
         self.moves_list = []
 
     # @create_string_board_from_output(should_add_indexes=True)
@@ -40,12 +85,80 @@ class GameBoard(GameBoardABC):
     #     """
     #     return [list(act_list) for act_list in reversed(self.board_arrays)]
 
+    def get_board_copy(self, board_to_copy=None, copy_format='list', candidates_distance=None):
+        """
+        Creates copy of the given board, boards can be converted between the
+        lists and bitboard representation
+        :param board_to_copy: Two dimensional board or BitBoard to copy
+        :param copy_format: 'list', 'tuple' or 'bitboard'
+        :param candidates_distance: Candidates distance of the bitboard
+        created from the lists board, BitBoard copy keeps its own one
+        :return: Board copy in the given format, lists copy is the ListBoard
+        """
+        if board_to_copy is None:
+            board_to_copy = self.board_arrays
+
+        if copy_format == 'bitboard':
+            if isinstance(board_to_copy, BitBoard):
+                return board_to_copy.copy()
+            return self._convert_board_to_bitboard(board_to_copy, candidates_distance)
+
+        if isinstance(board_to_copy, BitBoard):
+            board_to_copy = self._convert_bitboard_to_board(board_to_copy)
+        board_copy = super().get_board_copy(board_to_copy, copy_format)
+        if copy_format == 'list':
+            return ListBoard(board_copy, getattr(board_to_copy, 'empty_fields', None))
+        return board_copy
+
+    def _convert_board_to_bitboard(self, board, candidates_distance=None):
+        """
+        Converts two dimensional board to the bitboard representation
+        :param board: Two dimensional board
+        :param candidates_distance: Maximal distance of the candidate moves
+        from the signs, None for all empty fields being possible moves
+        :return: BitBoard object
+        """
+        bitboard = BitBoard(get_bitboard_masks(self.board_size, self.winning_combination,
+                                               candidates_distance))
+        for y_ind, row in enumerate(board):
+            for x_ind, sign in enumerate(row):
+                field_bit = 1 << (y_ind * self.board_size + x_ind)
+                if sign == GameBoard.BoardSigns.PLAYER1.value:
+                    bitboard.player1_signs |= field_bit
+                elif sign == GameBoard.BoardSigns.PLAYER2.value:
+                    bitboard.player2_signs |= field_bit
+        if candidates_distance is not None:
+            bitboard.update_candidates()
+        return bitboard
+
+    def _convert_bitboard_to_board(self, bitboard):
+        """
+        Converts bitboard to the two dimensional board
+        :param bitboard: BitBoard object
+        :return: Two dimensional board in lists
+        """
+        board = []
+        for y_ind in range(self.board_size):
+            row = []
+            for x_ind in range(self.board_size):
+                field = y_ind * self.board_size + x_ind
+                if bitboard.player1_signs >> field & 1:
+                    row.append(GameBoard.BoardSigns.PLAYER1.value)
+                elif bitboard.player2_signs >> field & 1:
+                    row.append(GameBoard.BoardSigns.PLAYER2.value)
+                else:
+                    row.append(GameBoard.BoardSigns.EMPTY.value)
+            board.append(row)
+        return board
+
     def get_possible_moves(self, board):
         """
         Gets possible moves for given board
         :param board: Board for which the moves will be found
         :return: List of possible moves in list of strnig in UCI format
         """
+        if isinstance(board, BitBoard):
+            return board.get_possible_moves()
         possible_moves = []
         for i, row in enumerate(board):
             for j, el in enumerate(row):
@@ -53,85 +166,79 @@ class GameBoard(GameBoardABC):
                     possible_moves.append(CoordsFormatter.translate_from_xy_to_uci(j, i))
         return possible_moves
 
-    def check_game_state(self, board=None):
+    def check_game_state(self, board=None, last_move=None):
         """
         Checks if game has ended
+        :param board: Board that will be checked, actual game board if not
+        specified
+        :param last_move: Last move made on the board in UCI format, when
+        given only the lines going through its field are checked, which
+        requires that the game was ongoing before the move
         :return: GameStates state in which game is now
         """
+        if isinstance(board, BitBoard):
+            return board.get_game_state(last_move)
+
         if isinstance(board, tuple):
             board = self.get_board_copy(board)
 
         if board is None:
             board = self.board_arrays
 
-        wining_lines_list = []
-
-        # I copy the references of the actual boards lists, be careful not to
-        # modify them there
-        wining_lines_list += [*board]
-        wining_lines_list += [[part_line[i] for part_line in board]
-                              for i in range(self.board_size)]
-
-        for possible_combination_num in range(len(board)):
-            new_row_list = []
-            try:
-                for row_ind, row in enumerate(board[possible_combination_num:]):
-                    new_row_list.append(row[row_ind])
-            except IndexError:
-                pass
-            wining_lines_list.append(new_row_list)
-
-            new_row_list = []
-            try:
-                for row_ind, row in enumerate(board):
-                    new_row_list.append((row[row_ind + possible_combination_num]))
-            except IndexError:
-                pass
-            wining_lines_list.append(new_row_list)
-
-            new_row_list = []
-            try:
-                for row_ind, row in enumerate(reversed(board[:possible_combination_num])):
-                    new_row_list.append(row[row_ind])
-            except IndexError:
-                pass
-            wining_lines_list.append(new_row_list)
-
-            new_row_list = []
-            try:
-                for row_ind, row in enumerate(reversed(board)):
-                    new_row_list.append((row[row_ind + possible_combination_num]))
-            except IndexError:
-                pass
-            wining_lines_list.append(new_row_list)
-
-        for par_win_line in wining_lines_list:
-            previous_sign = GameBoard.BoardSigns.EMPTY.value
-            signs_counter = 0
-            for sign in par_win_line:
-                if sign == GameBoard.BoardSigns.EMPTY.value:
-                    previous_sign = GameBoard.BoardSigns.EMPTY.value
-                    signs_counter = 0
-                else:
-                    if sign == previous_sign:
-                        signs_counter += 1
-                        if signs_counter >= self.winning_combination:
-                            if sign == GameBoard.BoardSigns.PLAYER1.value:
-                                return GameStates.PLAYER1WIN
-                            elif sign == GameBoard.BoardSigns.PLAYER2.value:
-                                return GameStates.PLAYER2WIN
-                            else:
-                                return TypeError("Unexpected sign type")
-                    else:
-                        signs_counter = 1
-                        previous_sign = sign
-
-        if all(GameBoard.BoardSigns.EMPTY.value not in part_win_line for
-               part_win_line in wining_lines_list):
+        winner_sign = None
+        if last_move is not None:
+            x_ind, y_ind = CoordsFormatter.translate_from_uci_to_xy(last_move)
+            if self._is_winning_field(board, x_ind, y_ind):
+                winner_sign = board[y_ind][x_ind]
+        else:
+            for y_ind, row in enumerate(board):
+                for x_ind, sign in enumerate(row):
+                    if self._is_winning_field(board, x_ind, y_ind):
+                        winner_sign = sign
+                        break
+                if winner_sign is not None:
+                    break
+
+        if winner_sign == GameBoard.BoardSigns.PLAYER1.value:
+            return GameStates.PLAYER1WIN
+        elif winner_sign == GameBoard.BoardSigns.PLAYER2.value:
+            return GameStates.PLAYER2WIN
+
+        if isinstance(board, ListBoard):
+            if not board.empty_fields:
+                return GameStates.DRAW
+        elif all(GameBoard.BoardSigns.EMPTY.value not in row for row in board):
             return GameStates.DRAW
 
         return GameStates.ONGOING
 
+    def _is_winning_field(self, board, x_ind, y_ind):
+        """
+        Checks if the sign on the field makes the winning combination in any
+        of the lines going through the field, only winning_combination - 1
+        fields are checked in each direction
+        :param board: Board that will be checked
+        :param x_ind: X index of the field
+        :param y_ind: Y index of the field
+        :return: True if the sign on the field has won
+        """
+        sign = board[y_ind][x_ind]
+        if sign == GameBoard.BoardSigns.EMPTY.value:
+            return False
+        for x_dir, y_dir in self.lines_directions:
+            signs_counter = 1
+            for direction in (1, -1):
+                for distance in range(1, self.winning_combination):
+                    next_x = x_ind + direction * distance * x_dir
+                    next_y = y_ind + direction * distance * y_dir
+                    if not (0 <= next_x < self.board_size and 0 <= next_y < self.board_size) \
+                            or board[next_y][next_x] != sign:
+                        break
+                    signs_counter += 1
+            if signs_counter >= self.winning_combination:
+                return True
+        return False
+
     def make_move(self, player_id, move_coords, board=None):
         """
         Makes move on the board on the specific coords
@@ -139,8 +246,12 @@ class GameBoard(GameBoardABC):
         :type player_id: BoardSigns enum value
         :param player_id: Which player is moving
         :param move_coords: Move coords in UCI format
-        :return: Board after making move
+        :return: Board after making move, bitboard is changed in place
         """
+        if isinstance(board, BitBoard):
+            board.apply_move(self.players_indexes[player_id], move_coords)
+            return board
+
         was_tuple = False
         if isinstance(board, tuple):
             board = self.get_board_copy(board, copy_format='list')
@@ -152,6 +263,8 @@ class GameBoard(GameBoardABC):
 
         if board[y_ind][x_ind] == GameBoard.BoardSigns.EMPTY.value:
             board[y_ind][x_ind] = player_id.value
+            if isinstance(board, ListBoard):
+                board.empty_fields -= 1
         else:
             raise InvalidMoveException("The chosen field is not empty. Move is invalid.")
         if not was_tuple:
@@ -0,0 +1,177 @@
+"""Module providing table of the perfect play for 3x3 tic tac toe. Every
+position reachable from the empty board is solved once, positions that are
+the same after one of eight symmetries of the board share one entry, so the
+move is found without searching"""
+import os
+import pickle
+
+from decision_games_with_ai.games.tic_tac_toe.game_implementation.board_symmetries import \
+    BoardSymmetries
+from decision_games_with_ai.games.tic_tac_toe.game_implementation.game_board import GameBoard
+from decision_games_with_ai.games.utils.coords_formatters import CoordsFormatter
+
+BOARD_SIZE = 3
+FIELDS_NUM = BOARD_SIZE * BOARD_SIZE
+
+# Fields making the row, column or diagonal, fields are indexed y * 3 + x
+WINNING_LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),
+    (0, 4, 8), (2, 4, 6)
+)
+
+
+class PerfectPlayTable:
+    """Class solving all positions of 3x3 tic tac toe and answering with
+    their values and best moves. The table is built on the first use, or
+    loaded from the file when it was saved before"""
+
+    next_player_dict = {
+        GameBoard.BoardSigns.PLAYER1: GameBoard.BoardSigns.PLAYER2,
+        GameBoard.BoardSigns.PLAYER2: GameBoard.BoardSigns.PLAYER1
+    }
+
+    def __init__(self, table_path=None):
+        """
+        :param table_path: Path of the file with the table, when it does not
+        exist the built table is saved there, None keeps the table only in
+        the memory
+        """
+        self.table_path = table_path
+        self.board_symmetries = BoardSymmetries(BOARD_SIZE)
+        # Key of the canonical position: (value, best moves mask), value is
+        # from the point of view of the player to move, moves are fields of
+        # the canonical position
+        self.entries = None
+
+    def get_entries(self):
+        """
+        :return: Dictionary with the entries of the table, loaded or built
+        when it is needed for the first time
+        """
+        if self.entries is None:
+            if self.table_path is not None and os.path.exists(self.table_path):
+                self.load(self.table_path)
+            else:
+                self.build()
+                if self.table_path is not None:
+                    self.save(self.table_path)
+        return self.entries
+
+    def build(self):
+        """
+        Solves every position reachable from the empty board, with any of the
+        players starting
+        """
+        self.entries = {}
+        empty_fields = [GameBoard.BoardSigns.EMPTY.value] * FIELDS_NUM
+        for player in self.next_player_dict:
+            self._solve(empty_fields, player)
+
+    def load(self, table_path):
+        """
+        :param table_path: Path of the file written by save
+        """
+        with open(table_path, 'rb') as table_file:
+            self.entries = pickle.load(table_file)
+
+    def save(self, table_path):
+        """
+        :param table_path: Path of the file the table is written to
+        """
+        with open(table_path, 'wb') as table_file:
+            pickle.dump(self.get_entries(), table_file, pickle.HIGHEST_PROTOCOL)
+
+    def get_value(self, board, player):
+        """
+        :param board: Board arrays of 3x3 game
+        :param player: Player to move (GameBoard.BoardSigns enum value)
+        :return: Value of the position for the player to move, positive for
+        the win, negative for the loss and 0 for the draw. Faster wins and
+        slower losses have bigger values
+        """
+        return self._get_entry(board, player)[0][0]
+
+    def get_best_moves(self, board, player):
+        """
+        :param board: Board arrays of 3x3 game
+        :param player: Player to move (GameBoard.BoardSigns enum value)
+        :return: List of the best moves in UCI format, empty for the ended
+        game
+        """
+        (value, moves_mask), symmetry = self._get_entry(board, player)
+        best_moves = []
+        for field in range(FIELDS_NUM):
+            if moves_mask >> field & 1:
+                y_ind, x_ind = divmod(symmetry[field], BOARD_SIZE)
+                best_moves.append(CoordsFormatter.translate_from_xy_to_uci(x_ind, y_ind))
+        return sorted(best_moves)
+
+    def _get_entry(self, board, player):
+        """
+        :param board: Board arrays of 3x3 game
+        :param player: Player to move
+        :return: Tuple of the entry of the position and the symmetry giving
+        its canonical orientation
+        """
+        key, symmetry = self.board_symmetries.get_canonical_key(self._get_fields(board),
+                                                                player)
+        entry = self.get_entries().get(key)
+        if entry is None:
+            raise ValueError("Position is not reachable in the game")
+        return entry, symmetry
+
+    @staticmethod
+    def _get_fields(board):
+        """
+        :param board: Board arrays of 3x3 game
+        :return: List of the board signs indexed y * 3 + x
+        """
+        if len(board) != BOARD_SIZE or any(len(row) != BOARD_SIZE for row in board):
+            raise ValueError("Perfect play table supports only 3x3 board")
+        return BoardSymmetries.get_fields(board)
+
+    def _solve(self, fields, player):
+        """
+        Solves the position with negamax and stores it with all positions
+        reachable from it
+        :param fields: List of the board signs indexed y * 3 + x, it is
+        modified during the search and restored afterwards
+        :param player: Player to move
+        :return: Value of the position for the player to move
+        """
+        key, symmetry = self.board_symmetries.get_canonical_key(fields, player)
+        entry = self.entries.get(key)
+        if entry is not None:
+            return entry[0]
+
+        empty_value = GameBoard.BoardSigns.EMPTY.value
+        empty_fields = [field for field in range(FIELDS_NUM) if fields[field] == empty_value]
+        opponent_sign = self.next_player_dict[player].value
+        if any(fields[a] == fields[b] == fields[c] == opponent_sign
+               for a, b, c in WINNING_LINES):
+            # The opponent has won, the earlier the bigger loss
+            self.entries[key] = (-len(empty_fields) - 1, 0)
+            return self.entries[key][0]
+        if not empty_fields:
+            self.entries[key] = (0, 0)
+            return 0
+
+        best_value = None
+        best_fields = []
+        for field in empty_fields:
+            fields[field] = player.value
+            value = -self._solve(fields, self.next_player_dict[player])
+            fields[field] = empty_value
+            if best_value is None or value > best_value:
+                best_value, best_fields = value, [field]
+            elif value == best_value:
+                best_fields.append(field)
+
+        # Moves are stored for the canonical orientation of the position
+        canonical_fields = {original: canonical for canonical, original in enumerate(symmetry)}
+        moves_mask = 0
+        for field in best_fields:
+            moves_mask |= 1 << canonical_fields[field]
+        self.entries[key] = (best_value, moves_mask)
+        return best_value
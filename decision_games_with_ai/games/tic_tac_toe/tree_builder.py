@@ -1,19 +1,27 @@
 """Module responsible for building of the decision trees of tic tac toe game"""
 import datetime
+import time
 from copy import deepcopy
-from math import log, sqrt
 from enum import Enum
-from random import choice
+from random import choice, randrange
 
 import anytree
 from anytree import Node, RenderTree
 from anytree.exporter import DotExporter
 
 from decision_games_with_ai.games.tic_tac_toe.game import Game
+from decision_games_with_ai.games.tic_tac_toe.game_implementation.bitboard import BitBoard
+from decision_games_with_ai.games.tic_tac_toe.game_implementation.board_symmetries import \
+    BoardSymmetries
 from decision_games_with_ai.games.tic_tac_toe.game_implementation.game_board import GameBoard
+from decision_games_with_ai.games.tic_tac_toe.game_implementation.perfect_play_table import \
+    PerfectPlayTable
 from decision_games_with_ai.games.tree_builder_abc import TreeBuilderABC
 
+from decision_games_with_ai.games.utils.events_exceptions import SearchTimeout
 from decision_games_with_ai.games.utils.global_enums import GameStates
+from decision_games_with_ai.games.utils.monte_carlo import MonteCarloMoveStats, \
+    MonteCarloNode, MonteCarloNodesLimit, SimulationLimits
 from decision_games_with_ai.games.utils.iter_functions import previous_and_next
 
 MAX_VAL = 100000
@@ -37,6 +45,11 @@ class TicTacToeTreeBuilder(TreeBuilderABC):
         GameBoard.BoardSigns.PLAYER2: GameStates.PLAYER2WIN
     }
 
+    game_state_winner = {
+        GameStates.PLAYER1WIN: GameBoard.BoardSigns.PLAYER1,
+        GameStates.PLAYER2WIN: GameBoard.BoardSigns.PLAYER2
+    }
+
     players_pawns_values = {
         GameBoard.BoardSigns.PLAYER1: GameBoard.BoardSigns.PLAYER1.value,
         GameBoard.BoardSigns.PLAYER2: GameBoard.BoardSigns.PLAYER2.value
@@ -47,32 +60,82 @@ class TicTacToeTreeBuilder(TreeBuilderABC):
         GameBoard.BoardSigns.PLAYER2.value
     )
 
-    def __init__(self, game):
+    def __init__(self, game, max_tree_nodes=None,
+                 eviction_policy=MonteCarloNodesLimit.EvictionPolicy.LEAST_VISITED,
+                 perfect_play_table=None, use_symmetries=False, use_bitboard=False,
+                 batch_evaluator=None, candidate_moves_distance=None):
+        """
+        :param game: Game object which the trees will be built for
+        :param max_tree_nodes: Maximal number of nodes of the monte carlo
+        tree, None for no limit
+        :param eviction_policy: MonteCarloNodesLimit.EvictionPolicy enum value
+        deciding which nodes are removed when the tree reaches the limit
+        :param perfect_play_table: PerfectPlayTable used by
+        find_perfect_play_move, table kept only in the memory is created when
+        not given
+        :param use_symmetries: When set, moves leading to positions symmetric
+        to the position after an earlier move are skipped at the root of the
+        searches without the tree and in every node of the monte carlo tree
+        :param use_bitboard: When set, positions are kept in the BitBoard
+        representation during search and monte carlo simulations
+        :param batch_evaluator: BatchEvaluator object, when given alpha beta
+        and pvs searches evaluate all the children of the positions one move
+        before the search depth in one call to it
+        :param candidate_moves_distance: When given, searches and monte carlo
+        simulations consider only the empty fields not further than the
+        distance from the signs on the board, positions are kept in the
+        BitBoard representation then. None considers all empty fields
+        """
+        self.use_bitboard = use_bitboard
+        self.batch_evaluator = batch_evaluator
+        self.candidate_moves_distance = candidate_moves_distance
+
         # monte carlo variables
         self.game = game
         self.max_moves_mt = 100
-        self.mt_wins = {}
-        self.mt_plays = {}
+        self.mt_root = None
+        self.mt_root_history = ()
+        self.mt_nodes_limit = MonteCarloNodesLimit(max_tree_nodes, eviction_policy)
         self.mt_C = 3
         self.max_depth = 0
+        self.mt_games = 0
         self.print_info = False
 
+        # alpha beta variables
+        self.searched_depth = 0
+        self.aspiration_researches = 0
+        self.deadline = None
+
+        # perfect play variables
+        self.perfect_play_table = perfect_play_table
+
+        # symmetries variables
+        self.use_symmetries = use_symmetries
+        self.board_symmetries = None
+
         # minimax variables
         self.value_of_neigh_signs = 5
         self.value_of_near_empty_field = 1
 
-    def build_monte_carlo_tree(self, num_of_sim):
+    def build_monte_carlo_tree(self, num_of_sim=None, time_limit_ms=None, stop_event=None):
         """
-        Builds tree using monte carlo method
-        :param num_of_sim: Time limit in seconds after which this method will
-        return built tree
-        :return:
+        Builds tree using monte carlo method, simulations run until any of the
+        given limits is reached. The best move found so far can be taken at
+        any moment with get_monte_carlo_best_move. Subtree of the actual
+        position is kept from the previous search
+        :param num_of_sim: Number of simulations
+        :param time_limit_ms: Time limit of the simulations in milliseconds
+        :param stop_event: threading.Event, simulations stop when it gets set
+        :return: Best move in UCI format
         """
+        simulation_limits = SimulationLimits(num_of_sim, time_limit_ms, stop_event)
         self.max_depth = 0
+        self.mt_games = 0
         # raise NotImplementedError("Monte Carlo tree search to do")
-        actual_board = self.game.game_board.get_board_copy(copy_format='tuple')
+        actual_board = self._get_board_copy()
         player = self.game.current_players_turn
         possible_moves = self.game.game_board.get_possible_moves(actual_board)
+        self.mt_root = self._get_monte_carlo_root(player)
 
         # Return if there is no choice to be made
         if not possible_moves:
@@ -80,103 +143,130 @@ class TicTacToeTreeBuilder(TreeBuilderABC):
         if len(possible_moves) == 1:
             return possible_moves[0]
 
-        games = 0
-
-        time_for_move = datetime.timedelta(seconds=time_limit)
-        start_time = datetime.datetime.utcnow()
-        # while datetime.datetime.utcnow() - start_time < time_for_move:
-        while games <= 100:
-            self._run_monte_carlo_simulation(actual_board, player, player)
-            games += 1
+        while not simulation_limits.is_reached(self.mt_games):
+            self._run_monte_carlo_simulation(self.mt_root, actual_board)
+            self.mt_games += 1
 
         if self.print_info:
-            print("Number of games: {}".format(games))
-
-        moves_tuples = [(move_cords, self.game.game_board.make_move(
-            player_id=player,
-            move_coords=move_cords,
-            board=actual_board,
-        )) for move_cords in possible_moves]
-
-        percent_wins, move = max(
-            (self.mt_wins.get((player, act_board), 0) /
-             self.mt_plays.get((player, act_board), 1),
-             move) for move, act_board in moves_tuples
-        )
+            print("Number of games: {}".format(self.mt_games))
+
+        best_move_stats = self.get_monte_carlo_best_move()
 
         if self.print_info:
             for x in sorted(
-                    ((100 * self.mt_wins.get((player, S), 0) /
-                      self.mt_plays.get((player, S), 1),
-                      self.mt_wins.get((player, S), 0),
-                      self.mt_plays.get((player, S), 0), p)
-                     for p, S in moves_tuples),
+                    ((100 * stats.wins / (stats.plays or 1), stats.wins, stats.plays,
+                      stats.move) for stats in self.get_monte_carlo_statistics()),
                     reverse=True
             ):
                 print("{3}: {0:.2f}% ({1} /{2})".format(*x))
             print("Maximum depth searched:", self.max_depth)
-        return move
-
-    def _run_monte_carlo_simulation(self, actual_board, actual_player, player):
-        """
-        Runs one simulation of game till the terminal condition
-        :param actual_board: Actual board of the game
-        :param actual_player: Actual player that is going to make move
-        :param player: Player that wants to have the best score
-        :return:
-        """
-        visited_states = set()
-        board_copy = self.game.game_board.get_board_copy(actual_board, copy_format='tuple')
-
-        expand = True
-        for i in range(self.max_moves_mt):
-            possible_moves = self.game.game_board.get_possible_moves(board_copy)
-
-            moves_boards = [(p, self.game.game_board.get_board_copy(
-                self.game.game_board.make_move(
-                    actual_player, p, self.game.game_board.get_board_copy(board_copy)),
-                copy_format='tuple'
-            )) for p in possible_moves]
-
-            if all(self.mt_plays.get((actual_player, S)) for p, S in moves_boards):
-                log_total = log(
-                    sum(self.mt_plays[(actual_player, S)] for p, S in moves_boards))
-                value, play, brd = max(
-                    ((self.mt_wins[(actual_player, S)] / self.mt_plays[(actual_player, S)]) +
-                     self.mt_C * sqrt(log_total / self.mt_plays[(actual_player, S)]), p, S)
-                    for p, S in moves_boards
-                )
-            else:
-                play, brd = choice(moves_boards)
+        return best_move_stats.move
 
-            board_copy = brd
-            #     self.game.game_board.make_move(
-            #     player_id=actual_player,
-            #     move_coords=play,
-            #     board=board_copy
-            # )
+    def _get_monte_carlo_root(self, player):
+        """
+        Finds node of the actual position in the tree of the previous search,
+        following the moves made in the game since then, so the statistics
+        gathered for the position are reused
+        :param player: Player to move in the actual position
+        :return: Root node for the search
+        """
+        moves_history = tuple(self.game.moves_list)
+        root_node = None
+        root_history_len = len(self.mt_root_history)
+        if self.mt_root is not None and \
+                moves_history[:root_history_len] == self.mt_root_history:
+            root_node = self.mt_root.find_descendant(moves_history[root_history_len:],
+                                                     str)
+        if root_node is None or self.next_player_dict[root_node.player] != player:
+            root_node = MonteCarloNode(None, self.next_player_dict[player])
+        root_node.parent = None
+        self.mt_root_history = moves_history
+        self.mt_nodes_limit.set_root(root_node)
+        return root_node
 
-            if expand and (actual_player, board_copy) not in self.mt_plays:
-                expand = False
-                self.mt_plays[(actual_player, board_copy)] = 0
-                self.mt_wins[(actual_player, board_copy)] = 0
-                if i > self.max_depth:
-                    self.max_depth = i
+    def get_monte_carlo_statistics(self):
+        """
+        Gives statistics of the root moves of the last, or actually running
+        monte carlo search, can be called from the other thread
+        :return: List of MonteCarloMoveStats
+        """
+        root_node = self.mt_root
+        if root_node is None:
+            return []
+        moves_stats = [MonteCarloMoveStats(child_node.move, child_node.wins, child_node.plays)
+                       for child_node in list(root_node.children)]
+        moves_stats += [MonteCarloMoveStats(move, 0, 0)
+                        for move in list(root_node.untried_moves or ())]
+        return moves_stats
 
-            visited_states.add((actual_player, board_copy))
+    def get_monte_carlo_tree_stats(self):
+        """
+        :return: MonteCarloTreeStats with the size of the monte carlo tree and
+        the eviction counters
+        """
+        return self.mt_nodes_limit.get_stats()
 
-            actual_player = self.next_player_dict[actual_player]
-            game_state = self.game.game_board.check_game_state(board_copy)
-            if game_state in (GameStates.PLAYER1WIN, GameStates.PLAYER2WIN, GameStates.DRAW):
+    def get_monte_carlo_best_move(self):
+        """
+        Gives the best root move found so far by the monte carlo search, can
+        be called at any moment, also from the other thread
+        :return: MonteCarloMoveStats of the move with the best wins ratio,
+        None if the search has not started
+        """
+        moves_stats = self.get_monte_carlo_statistics()
+        if not moves_stats:
+            return None
+        return max(moves_stats, key=lambda stats: (
+            stats.wins / stats.plays if stats.plays else 0, stats.move))
+
+    def _run_monte_carlo_simulation(self, root_node, actual_board):
+        """
+        Runs one simulation of game from the root node till the terminal
+        condition, adds one node to the tree
+        :param root_node: Root node of the search tree
+        :param actual_board: Board of the root position, it is not modified
+        """
+        self.mt_nodes_limit.make_room(root_node)
+        board_copy = self._get_board_copy(actual_board)
+        node = root_node
+        depth = 0
+
+        # Selection of the already expanded nodes
+        while node.is_fully_expanded() and node.children:
+            node = node.select_child(self.mt_C)
+            self.game.game_board.make_move(node.player, node.move, board_copy)
+            depth += 1
+
+        # Expansion of the node with one of its untried moves
+        game_state = self.game.game_board.check_game_state(board_copy, node.move)
+        if node.untried_moves is None:
+            node.untried_moves = []
+            if game_state == GameStates.ONGOING:
+                node.untried_moves = self._get_unique_moves(
+                    board_copy, self.game.game_board.get_possible_moves(board_copy))
+        if node.untried_moves and self.mt_nodes_limit.has_room():
+            move = node.untried_moves.pop(randrange(len(node.untried_moves)))
+            actual_player = self.next_player_dict[node.player]
+            self.game.game_board.make_move(actual_player, move, board_copy)
+            node = node.add_child(move, actual_player)
+            self.mt_nodes_limit.node_added()
+            depth += 1
+            game_state = self.game.game_board.check_game_state(board_copy, move)
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+        # Random play out
+        actual_player = self.next_player_dict[node.player]
+        for i in range(depth, self.max_moves_mt):
+            if game_state != GameStates.ONGOING:
                 break
+            move = choice(self.game.game_board.get_possible_moves(board_copy))
+            self.game.game_board.make_move(actual_player, move, board_copy)
+            actual_player = self.next_player_dict[actual_player]
+            game_state = self.game.game_board.check_game_state(board_copy, move)
 
-        for act_player, act_board in visited_states:
-            if (act_player, act_board) not in self.mt_plays:
-                continue
-            self.mt_plays[(act_player, act_board)] += 1
-            # game_state = self.game.game_board.check_game_state(act_board)
-            if game_state == self.player_desired_game_state[player]:
-                self.mt_wins[(act_player, act_board)] += 1
+        node.backpropagate(self.game_state_winner.get(game_state),
+                           self.mt_nodes_limit.next_visit())
 
     def build_minimax_tree(self, depth):
         """
@@ -192,12 +282,81 @@ class TicTacToeTreeBuilder(TreeBuilderABC):
             player=self.game.current_players_turn,
             actual_player=self.game.current_players_turn,
             parent_node=main_root,
-            actual_board=self.game.game_board.get_board_copy(),
+            actual_board=self._get_board_copy(),
             move=None
         )
 
         return main_root.children[0]
 
+    def find_minimax_move(self, depth):
+        """
+        Searches for the best move with minimax algorithm without building
+        the tree
+        :param depth: Depth at which the algorithm will stop searching
+        :return: Tuple of the best move in UCI format and its score
+        """
+        score, move = self._search_minimax(
+            depth=depth,
+            actual_player=self.game.current_players_turn,
+            player=self.game.current_players_turn,
+            actual_board=self._get_board_copy(),
+            is_root=True
+        )
+        return move, score
+
+    def _search_minimax(self, depth, actual_player, player, actual_board, last_move=None,
+                        is_root=False):
+        """
+        Finds minimax value of the position, gives the same values and moves
+        as the tree built by build_minimax_tree
+        :param depth: Depth at which this particular branch can search further
+        :param actual_player: Player to move
+        :param player: The player for which the move is discovered
+        :param actual_board: Board arrays with actually estimated board
+        simulation
+        :param last_move: Move that led to the position, only its lines are
+        checked for the win
+        :param is_root: Tells if the position is the root of the search
+        :return: Tuple of the position value and the best move, move is None
+        for the leaves
+        """
+        if depth == 0:
+            return self._static_evaluation_value(actual_board=actual_board,
+                                                 player=player), None
+
+        game_state = self.game.game_board.check_game_state(actual_board, last_move)
+        if game_state == GameStates.DRAW:
+            return 0, None
+        elif game_state == self.player_desired_game_state[player]:
+            return MAX_VAL - depth, None
+        elif game_state == self.player_desired_game_state[self.next_player_dict[player]]:
+            return MIN_VAL, None
+
+        maximize = actual_player == player
+        possible_moves = self.game.game_board.get_possible_moves(actual_board)
+        if is_root:
+            possible_moves = self._get_unique_moves(actual_board, possible_moves)
+        best_move = None
+        best = None
+        for pos_move in possible_moves:
+            board_copy = self._get_board_copy(actual_board)
+            board_copy = self.game.game_board.make_move(
+                player_id=actual_player,
+                move_coords=pos_move,
+                board=board_copy
+            )
+            value, _ = self._search_minimax(
+                depth=depth - 1,
+                actual_player=self.next_player_dict[actual_player],
+                player=player,
+                actual_board=board_copy,
+                last_move=pos_move
+            )
+            if best_move is None or (value > best if maximize else value < best):
+                best, best_move = value, pos_move
+
+        return best, best_move
+
     def _create_one_tree_layer_minimax(self, depth, actual_player, player, parent_node,
                                        actual_board, move):
         """
@@ -218,7 +377,7 @@ class TicTacToeTreeBuilder(TreeBuilderABC):
                                                       player=player),
                         parent=parent_node, move=move)
 
-        game_state = self.game.game_board.check_game_state(actual_board)
+        game_state = self.game.game_board.check_game_state(actual_board, move)
 
         if player == GameBoard.BoardSigns.PLAYER1:
             desired_game_state = GameStates.PLAYER1WIN
@@ -241,7 +400,7 @@ class TicTacToeTreeBuilder(TreeBuilderABC):
         actual_node = Node(None, parent=parent_node, move=move)
 
         for pos_move in possible_moves:
-            board_copy = self.game.game_board.get_board_copy(actual_board)
+            board_copy = self._get_board_copy(actual_board)
             board_copy = self.game.game_board.make_move(
                 player_id=actual_player,
                 move_coords=pos_move,
@@ -270,7 +429,7 @@ class TicTacToeTreeBuilder(TreeBuilderABC):
             player=self.game.current_players_turn,
             actual_player=self.game.current_players_turn,
             parent_node=main_root,
-            actual_board=self.game.game_board.get_board_copy(),
+            actual_board=self._get_board_copy(),
             move=None,
             alpha=Node(MIN_VAL),
             beta=Node(MAX_VAL)
@@ -301,7 +460,7 @@ class TicTacToeTreeBuilder(TreeBuilderABC):
                                                       player=player),
                         parent=parent_node, move=move)
 
-        game_state = self.game.game_board.check_game_state(actual_board)
+        game_state = self.game.game_board.check_game_state(actual_board, move)
 
         if player == GameBoard.BoardSigns.PLAYER1:
             desired_game_state = GameStates.PLAYER1WIN
@@ -332,7 +491,7 @@ class TicTacToeTreeBuilder(TreeBuilderABC):
         if layer_factor == self.PlayerFactor.MAX:
             best = Node(MIN_VAL)
             for pos_move in possible_moves:
-                board_copy = self.game.game_board.get_board_copy(actual_board)
+                board_copy = self._get_board_copy(actual_board)
                 board_copy = self.game.game_board.make_move(
                     player_id=actual_player,
                     move_coords=pos_move,
@@ -360,7 +519,7 @@ class TicTacToeTreeBuilder(TreeBuilderABC):
         else:
             best = Node(MAX_VAL)
             for pos_move in possible_moves:
-                board_copy = self.game.game_board.get_board_copy(actual_board)
+                board_copy = self._get_board_copy(actual_board)
                 board_copy = self.game.game_board.make_move(
                     player_id=actual_player,
                     move_coords=pos_move,
@@ -388,6 +547,404 @@ class TicTacToeTreeBuilder(TreeBuilderABC):
 
         return best
 
+    def find_alphabeta_move(self, depth):
+        """
+        Searches for the best move with alpha beta algorithm without building
+        the tree, alpha and beta are kept as plain numbers
+        :param depth: Depth at which the algorithm will stop searching
+        :return: Tuple of the best move in UCI format and its score
+        """
+        score, move = self._search_alphabeta(
+            depth=depth,
+            actual_player=self.game.current_players_turn,
+            player=self.game.current_players_turn,
+            actual_board=self._get_board_copy(),
+            alpha=MIN_VAL,
+            beta=MAX_VAL,
+            is_root=True
+        )
+        return move, score
+
+    def find_iterative_deepening_move(self, time_limit_ms, max_depth=None):
+        """
+        Searches with alpha beta algorithm at depth 1, 2, 3... until the time
+        limit runs out, best move of the previous depth is searched first
+        :param time_limit_ms: Time limit for the move in milliseconds, the
+        first depth is always completed
+        :param max_depth: Depth after which the search stops before the time
+        limit, number of empty fields if not specified
+        :return: Tuple of the best move in UCI format and its score found at
+        the last completed depth
+        """
+        deadline = time.monotonic() + time_limit_ms / 1000
+        actual_board = self._get_board_copy()
+        player = self.game.current_players_turn
+
+        possible_moves = self.game.game_board.get_possible_moves(actual_board)
+        if len(possible_moves) == 1:
+            self.searched_depth = 0
+            return possible_moves[0], None
+        if max_depth is None:
+            max_depth = len(self.game.game_board.get_possible_moves(
+                self.game.game_board.board_arrays))
+
+        move = None
+        score = None
+        try:
+            for depth in range(1, max_depth + 1):
+                depth_score, depth_move = self._search_alphabeta(
+                    depth=depth,
+                    actual_player=player,
+                    player=player,
+                    actual_board=actual_board,
+                    alpha=MIN_VAL,
+                    beta=MAX_VAL,
+                    first_move=move,
+                    is_root=True
+                )
+                score, move = depth_score, depth_move
+                self.searched_depth = depth
+                self.deadline = deadline
+                if score in (MIN_VAL, MAX_VAL) or time.monotonic() >= deadline:
+                    break
+        except SearchTimeout:
+            pass
+        finally:
+            self.deadline = None
+
+        return move, score
+
+    def _search_alphabeta(self, depth, actual_player, player, actual_board, alpha, beta,
+                          first_move=None, last_move=None, is_root=False):
+        """
+        Finds alpha beta value of the position, gives the same values and
+        moves as the tree built by build_alphabeta_tree
+        :param depth: Depth at which this particular branch can search further
+        :param actual_player: Player to move
+        :param player: The player for which the move is discovered
+        :param actual_board: Board arrays with actually estimated board
+        simulation
+        :param alpha: Value that the maximizing player is already assured of
+        :param beta: Value that the minimizing player is already assured of
+        :param first_move: Move that is searched first in the position
+        :param last_move: Move that led to the position, only its lines are
+        checked for the win
+        :param is_root: Tells if the position is the root of the search
+        :return: Tuple of the position value and the best move, move is None
+        for the leaves
+        """
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise SearchTimeout("Time limit of the search exceeded")
+        if depth == 0:
+            return self._static_evaluation_value(actual_board=actual_board,
+                                                 player=player), None
+
+        game_state = self.game.game_board.check_game_state(actual_board, last_move)
+        if game_state == GameStates.DRAW:
+            return 0, None
+        elif game_state == self.player_desired_game_state[player]:
+            return MAX_VAL, None
+        elif game_state == self.player_desired_game_state[self.next_player_dict[player]]:
+            return MIN_VAL, None
+
+        maximize = actual_player == player
+        possible_moves = self.game.game_board.get_possible_moves(actual_board)
+        if is_root:
+            possible_moves = self._get_unique_moves(actual_board, possible_moves)
+        if first_move in possible_moves:
+            possible_moves.remove(first_move)
+            possible_moves.insert(0, first_move)
+
+        children_values = None
+        if depth == 1:
+            children_values = self._evaluate_children(actual_player, player, possible_moves,
+                                                      actual_board)
+
+        best_move = None
+        best = MIN_VAL if maximize else MAX_VAL
+        for move_num, pos_move in enumerate(possible_moves):
+            if children_values is not None:
+                value = children_values[move_num]
+            else:
+                board_copy = self._get_board_copy(actual_board)
+                board_copy = self.game.game_board.make_move(
+                    player_id=actual_player,
+                    move_coords=pos_move,
+                    board=board_copy
+                )
+                value, _ = self._search_alphabeta(
+                    depth=depth - 1,
+                    actual_player=self.next_player_dict[actual_player],
+                    player=player,
+                    actual_board=board_copy,
+                    alpha=alpha,
+                    beta=beta,
+                    last_move=pos_move
+                )
+            if maximize:
+                if best_move is None or value > best:
+                    best, best_move = value, pos_move
+                alpha = max(alpha, value)
+            else:
+                if best_move is None or value < best:
+                    best, best_move = value, pos_move
+                beta = min(beta, value)
+            if beta <= alpha:
+                break
+
+        return best, best_move
+
+    def find_pvs_move(self, depth):
+        """
+        Searches for the best move with negamax principal variation search,
+        gives the same move and score as find_alphabeta_move
+        :param depth: Depth at which the algorithm will stop searching
+        :return: Tuple of the best move in UCI format and its score
+        """
+        score, move = self._search_pvs(
+            depth=depth,
+            actual_player=self.game.current_players_turn,
+            player=self.game.current_players_turn,
+            actual_board=self._get_board_copy(),
+            alpha=MIN_VAL,
+            beta=MAX_VAL,
+            is_root=True
+        )
+        return move, score
+
+    def find_pvs_iterative_deepening_move(self, time_limit_ms, max_depth=None,
+                                          aspiration_delta=5):
+        """
+        Searches with principal variation search at depth 1, 2, 3... until
+        the time limit runs out. Every depth after the first one starts with
+        the aspiration window around the score of the previous depth, the
+        window is widened when the score falls outside of it
+        :param time_limit_ms: Time limit for the move in milliseconds, the
+        first depth is always completed
+        :param max_depth: Depth after which the search stops before the time
+        limit, number of empty fields if not specified
+        :param aspiration_delta: Distance of the aspiration window bounds from
+        the previous score
+        :return: Tuple of the best move in UCI format and its score found at
+        the last completed depth
+        """
+        deadline = time.monotonic() + time_limit_ms / 1000
+        actual_board = self._get_board_copy()
+        player = self.game.current_players_turn
+        self.aspiration_researches = 0
+
+        possible_moves = self.game.game_board.get_possible_moves(actual_board)
+        if len(possible_moves) == 1:
+            self.searched_depth = 0
+            return possible_moves[0], None
+        if max_depth is None:
+            max_depth = len(self.game.game_board.get_possible_moves(
+                self.game.game_board.board_arrays))
+
+        move = None
+        score = None
+        try:
+            for depth in range(1, max_depth + 1):
+                if score is None:
+                    window = (MIN_VAL, MAX_VAL)
+                else:
+                    window = (max(MIN_VAL, score - aspiration_delta),
+                              min(MAX_VAL, score + aspiration_delta))
+                delta = aspiration_delta
+                while True:
+                    depth_score, depth_move = self._search_pvs(
+                        depth=depth,
+                        actual_player=player,
+                        player=player,
+                        actual_board=actual_board,
+                        alpha=window[0],
+                        beta=window[1],
+                        first_move=move,
+                        is_root=True
+                    )
+                    # Score outside of the window is a bound, the window is
+                    # widened beyond it
+                    delta *= 2
+                    if MIN_VAL < window[0] and depth_score <= window[0]:
+                        window = (max(MIN_VAL, min(window[0], depth_score) - delta), window[1])
+                    elif depth_score >= window[1] and window[1] < MAX_VAL:
+                        window = (window[0], min(MAX_VAL, max(window[1], depth_score) + delta))
+                    else:
+                        break
+                    self.aspiration_researches += 1
+                score, move = depth_score, depth_move
+                self.searched_depth = depth
+                self.deadline = deadline
+                if score in (MIN_VAL, MAX_VAL) or time.monotonic() >= deadline:
+                    break
+        except SearchTimeout:
+            pass
+        finally:
+            self.deadline = None
+
+        return move, score
+
+    def _search_pvs(self, depth, actual_player, player, actual_board, alpha, beta,
+                    first_move=None, last_move=None, is_root=False):
+        """
+        Finds negamax value of the position with principal variation search,
+        first move gets the full window, the rest of them is searched with the
+        null window and searched again when it turns out better. Scores,
+        alpha and beta are from the point of view of the player to move
+        :param depth: Depth at which this particular branch can search further
+        :param actual_player: Player to move
+        :param player: The player for which the move is discovered, leaves
+        are evaluated for him
+        :param actual_board: Board arrays with actually estimated board
+        simulation
+        :param alpha: Value that the player to move is already assured of
+        :param beta: Value that the opponent is already assured of
+        :param first_move: Move that is searched first in the position
+        :param last_move: Move that led to the position, only its lines are
+        checked for the win
+        :param is_root: Tells if the position is the root of the search
+        :return: Tuple of the position value and the best move, move is None
+        for the leaves
+        """
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise SearchTimeout("Time limit of the search exceeded")
+        score_factor = 1 if actual_player == player else -1
+        if depth == 0:
+            return score_factor * self._static_evaluation_value(actual_board=actual_board,
+                                                                player=player), None
+
+        game_state = self.game.game_board.check_game_state(actual_board, last_move)
+        if game_state == GameStates.DRAW:
+            return 0, None
+        elif game_state == self.player_desired_game_state[actual_player]:
+            return MAX_VAL, None
+        elif game_state == self.player_desired_game_state[self.next_player_dict[actual_player]]:
+            return MIN_VAL, None
+
+        possible_moves = self.game.game_board.get_possible_moves(actual_board)
+        if is_root:
+            possible_moves = self._get_unique_moves(actual_board, possible_moves)
+        if first_move in possible_moves:
+            possible_moves.remove(first_move)
+            possible_moves.insert(0, first_move)
+
+        children_values = None
+        if depth == 1:
+            children_values = self._evaluate_children(actual_player, player, possible_moves,
+                                                      actual_board)
+            if children_values is not None and actual_player != player:
+                children_values = [-value for value in children_values]
+
+        best_move = None
+        best = MIN_VAL
+        for move_num, pos_move in enumerate(possible_moves):
+            if children_values is not None:
+                value = children_values[move_num]
+            else:
+                board_copy = self._get_board_copy(actual_board)
+                board_copy = self.game.game_board.make_move(
+                    player_id=actual_player,
+                    move_coords=pos_move,
+                    board=board_copy
+                )
+                child_search = dict(
+                    depth=depth - 1,
+                    actual_player=self.next_player_dict[actual_player],
+                    player=player,
+                    actual_board=board_copy,
+                    last_move=pos_move
+                )
+                if move_num == 0:
+                    value = -self._search_pvs(alpha=-beta, beta=-alpha, **child_search)[0]
+                else:
+                    value = -self._search_pvs(alpha=-alpha - 1, beta=-alpha,
+                                              **child_search)[0]
+                    if alpha < value < beta:
+                        value = -self._search_pvs(alpha=-beta, beta=-alpha,
+                                                  **child_search)[0]
+            if best_move is None or value > best:
+                best, best_move = value, pos_move
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        return best, best_move
+
+    def find_perfect_play_move(self):
+        """
+        Finds the move of the perfect player in the precomputed table, works
+        only for 3x3 board with three signs in a row
+        :return: Tuple of the best move in UCI format and its score, one of
+        the equally good moves is chosen randomly
+        """
+        if self.game.game_board.winning_combination != 3:
+            raise ValueError("Perfect play table supports only three signs in a row")
+        if self.perfect_play_table is None:
+            self.perfect_play_table = PerfectPlayTable()
+        actual_board = self.game.game_board.get_board_copy()
+        player = self.game.current_players_turn
+
+        value = self.perfect_play_table.get_value(actual_board, player)
+        best_moves = self.perfect_play_table.get_best_moves(actual_board, player)
+        if value > 0:
+            score = MAX_VAL
+        elif value < 0:
+            score = MIN_VAL
+        else:
+            score = 0
+        return choice(best_moves) if best_moves else None, score
+
+    def _evaluate_children(self, actual_player, player, possible_moves, actual_board):
+        """
+        Evaluates positions after all the moves in one call to the batch
+        evaluator
+        :param actual_player: Player making the moves
+        :param player: The player for which the move is discovered
+        :param possible_moves: Moves of the position
+        :param actual_board: Board of the position, it is not modified
+        :return: List of the values of the positions for the player, None when
+        the batch evaluator is not used
+        """
+        if self.batch_evaluator is None:
+            return None
+        children_boards = []
+        for pos_move in possible_moves:
+            children_boards.append(self.game.game_board.make_move(
+                player_id=actual_player,
+                move_coords=pos_move,
+                board=self._get_board_copy(actual_board)
+            ))
+        return self.batch_evaluator.evaluate(
+            self.batch_evaluator.encode_boards(children_boards), player).tolist()
+
+    def _get_unique_moves(self, actual_board, possible_moves):
+        """
+        Removes moves symmetric to the earlier ones when symmetries are used
+        :param actual_board: Board of the position
+        :param possible_moves: List of moves of the position in UCI format
+        :return: List of the moves that need to be searched
+        """
+        if not self.use_symmetries:
+            return possible_moves
+        board_size = self.game.game_board.board_size
+        if self.board_symmetries is None or self.board_symmetries.board_size != board_size:
+            self.board_symmetries = BoardSymmetries(board_size)
+        if isinstance(actual_board, BitBoard):
+            actual_board = self.game.game_board.get_board_copy(actual_board)
+        return self.board_symmetries.get_unique_moves(actual_board, possible_moves)
+
+    def _get_board_copy(self, board=None):
+        """
+        Creates copy of the given board, keeps it in the BitBoard
+        representation when bitboard backend is used
+        :param board: Board to copy, actual game board if not specified
+        :return: Board copy
+        """
+        if self.use_bitboard or self.candidate_moves_distance is not None:
+            return self.game.game_board.get_board_copy(
+                board, copy_format='bitboard', candidates_distance=self.candidate_moves_distance)
+        return self.game.game_board.get_board_copy(board)
+
     def _static_evaluation_value(self, actual_board, player):
         """
         Function for static evaluation of the board for minimax algorithm
@@ -396,6 +953,12 @@ class TicTacToeTreeBuilder(TreeBuilderABC):
         returned
         :return: Value of evaluated board
         """
+        if isinstance(actual_board, BitBoard):
+            signs_neighbours, empty_neighbours = actual_board.get_neighbours_counts(
+                self.game.game_board.players_indexes[player])
+            return signs_neighbours * self.value_of_neigh_signs + \
+                empty_neighbours * self.value_of_near_empty_field
+
         # Returns always equal board for test purpose
         total_value = 0
 
@@ -15,11 +15,64 @@ class TreeBuilderABC(ABC):
         raise NotImplementedError("To override")
 
     @abstractmethod
-    def build_monte_carlo_tree(self, num_of_sim):
+    def find_minimax_move(self, depth):
+        """
+        Should find the best move with minimax algorithm without building the
+        tree
+        :param depth: Max depth that will be checked
+        :return: Tuple of the best move and its score
+        """
+        raise NotImplementedError("To override")
+
+    @abstractmethod
+    def find_alphabeta_move(self, depth):
+        """
+        Should find the best move with alpha beta algorithm without building
+        the tree
+        :param depth: Max depth that will be checked
+        :return: Tuple of the best move and its score
+        """
+        raise NotImplementedError("To override")
+
+    @abstractmethod
+    def find_iterative_deepening_move(self, time_limit_ms):
+        """
+        Should find the best move with alpha beta algorithm searching deeper
+        until the time limit runs out
+        :param time_limit_ms: Time limit for the move in milliseconds
+        :return: Tuple of the best move and its score
+        """
+        raise NotImplementedError("To override")
+
+    @abstractmethod
+    def find_pvs_move(self, depth):
+        """
+        Should find the best move with negamax principal variation search
+        :param depth: Max depth that will be checked
+        :return: Tuple of the best move and its score
+        """
+        raise NotImplementedError("To override")
+
+    @abstractmethod
+    def find_pvs_iterative_deepening_move(self, time_limit_ms):
+        """
+        Should find the best move with principal variation search searching
+        deeper with aspiration windows until the time limit runs out
+        :param time_limit_ms: Time limit for the move in milliseconds
+        :return: Tuple of the best move and its score
+        """
+        raise NotImplementedError("To override")
+
+    @abstractmethod
+    def build_monte_carlo_tree(self, num_of_sim=None, time_limit_ms=None, stop_event=None):
         """
         Should build tree that will be searched through using the Monte Carlo
         tree search method
-        :param num_of_sim: Time limit after witch the tree will be returned
-        :return: Tree structure ready to be searched through
+        :param num_of_sim: Number of simulations after which the move will be
+        returned
+        :param time_limit_ms: Time limit in milliseconds after which the move
+        will be returned
+        :param stop_event: threading.Event which stops the search when set
+        :return: Best move found
         """
         raise NotImplementedError("To override")
\ No newline at end of file
@@ -11,3 +11,8 @@ class MoveCheckOutsideOfArray(IndexError):
     """Exception thrown when one of move checking function has moved outside of
     array"""
     pass
+
+
+class SearchTimeout(TimeoutError):
+    """Exception thrown inside the search when its time limit has run out"""
+    pass
@@ -16,3 +16,11 @@ class SearchMethods(Enum):
     MINIMAX = 1
     MONTECARLO = 2
     ALPHABETA = 3
+    PVS = 4
+    PERFECT_PLAY = 5
+
+
+class MonteCarloParallelization(Enum):
+    """Class defining ways of running monte carlo tree search in parallel"""
+    ROOT = 0
+    LEAF = 1
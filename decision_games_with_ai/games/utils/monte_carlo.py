@@ -0,0 +1,244 @@
+"""Module providing helpers shared by the monte carlo tree search of the games"""
+import time
+from collections import namedtuple
+from enum import Enum
+from math import log, sqrt
+
+MonteCarloMoveStats = namedtuple('MonteCarloMoveStats', ['move', 'wins', 'plays'])
+MonteCarloMoveStats.__doc__ = """Statistics of the root move gathered by the
+monte carlo simulations, move is in UCI format"""
+
+MonteCarloTreeStats = namedtuple('MonteCarloTreeStats', ['nodes', 'max_nodes', 'evicted_nodes',
+                                                         'evictions'])
+MonteCarloTreeStats.__doc__ = """Size of the monte carlo tree, number of nodes
+removed from it and number of times the removal was run"""
+
+
+class SimulationLimits:
+    """Class deciding when the monte carlo simulations should stop, the
+    simulations stop when any of the given limits is reached"""
+
+    def __init__(self, num_of_sim=None, time_limit_ms=None, stop_event=None):
+        """
+        :param num_of_sim: Number of simulations to run
+        :param time_limit_ms: Time limit of the simulations in milliseconds
+        :param stop_event: threading.Event like object, simulations stop when
+        it gets set
+        """
+        if num_of_sim is None and time_limit_ms is None and stop_event is None:
+            raise ValueError("At least one limit of the simulations has to be given")
+        self.num_of_sim = num_of_sim
+        self.deadline = None
+        if time_limit_ms is not None:
+            self.deadline = time.monotonic() + time_limit_ms / 1000
+        self.stop_event = stop_event
+
+    def is_reached(self, simulations_num):
+        """
+        Checks if the simulations should stop
+        :param simulations_num: Number of already run simulations
+        :return: True if any of the limits is reached
+        """
+        if self.num_of_sim is not None and simulations_num >= self.num_of_sim:
+            return True
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return True
+        return self.stop_event is not None and self.stop_event.is_set()
+
+
+class MonteCarloNode:
+    """Node of the monte carlo search tree. Node represents position after
+    the move made by the player, wins are counted for that player"""
+
+    __slots__ = ('move', 'player', 'parent', 'children', 'untried_moves', 'plays', 'wins',
+                 'last_visit')
+
+    def __init__(self, move, player, parent=None):
+        """
+        :param move: Move leading to the node position, None for the root
+        :param player: Player that made the move
+        :param parent: Parent node
+        """
+        self.move = move
+        self.player = player
+        self.parent = parent
+        self.children = []
+        # Moves without the child node yet, None until the moves of the
+        # position are generated
+        self.untried_moves = None
+        self.plays = 0
+        self.wins = 0
+        # Number of the visit, given by MonteCarloNodesLimit.next_visit, of
+        # the simulation that has visited the node most recently
+        self.last_visit = 0
+
+    def add_child(self, move, player):
+        """
+        Creates child node of the move
+        :param move: Move leading to the child node position
+        :param player: Player making the move
+        :return: Created node
+        """
+        child_node = MonteCarloNode(move, player, self)
+        self.children.append(child_node)
+        return child_node
+
+    def is_fully_expanded(self):
+        """
+        :return: True if all moves of the position have their child nodes
+        """
+        return self.untried_moves is not None and not self.untried_moves
+
+    def select_child(self, exploration_constant):
+        """
+        Selects child with the highest UCB1 value
+        :param exploration_constant: Constant weighting exploration of the
+        rarely visited children
+        :return: Selected child node
+        """
+        log_total = log(self.plays)
+        return max(self.children, key=lambda node: node.wins / node.plays +
+                   exploration_constant * sqrt(log_total / node.plays))
+
+    def backpropagate(self, winner, simulation_num=0):
+        """
+        Updates statistics of the node and its ancestors with the result of
+        the simulation
+        :param winner: Player that won the simulation, None for the draw
+        :param simulation_num: Number of the visit, stored as the last visit
+        of the nodes, it has to grow through all the searches using the tree
+        """
+        node = self
+        while node is not None:
+            node.plays += 1
+            if node.player == winner:
+                node.wins += 1
+            node.last_visit = simulation_num
+            node = node.parent
+
+    def get_subtree_nodes(self):
+        """
+        :return: List of the node and all its descendants
+        """
+        nodes = [self]
+        for node in nodes:
+            nodes.extend(node.children)
+        return nodes
+
+    def remove_child(self, child_node):
+        """
+        Removes child from the tree, its move becomes untried again
+        :param child_node: Child node that gets removed
+        """
+        self.children.remove(child_node)
+        self.untried_moves.append(child_node.move)
+        child_node.parent = None
+
+    def find_descendant(self, moves, get_move_name):
+        """
+        Follows the moves down the tree
+        :param moves: Sequence of move names leading from this node
+        :param get_move_name: Function translating move kept in the node to
+        the move name
+        :return: Reached node or None when some of the moves was not expanded
+        """
+        node = self
+        for move in moves:
+            for child_node in node.children:
+                if get_move_name(child_node.move) == move:
+                    node = child_node
+                    break
+            else:
+                return None
+        return node
+
+
+class MonteCarloNodesLimit:
+    """Class counting nodes of the monte carlo tree and keeping their number
+    under the limit by removing leaves of the tree"""
+
+    class EvictionPolicy(Enum):
+        """Enum with ways of making room for the new nodes. Children of the
+        root are never removed, so the root moves keep their statistics"""
+        LEAST_VISITED = 0
+        LEAST_RECENTLY_USED = 1
+        STOP_EXPANSION = 2
+
+    def __init__(self, max_nodes=None, eviction_policy=EvictionPolicy.LEAST_VISITED,
+                 eviction_fraction=0.1):
+        """
+        :param max_nodes: Maximal number of nodes in the tree, None for no limit
+        :param eviction_policy: EvictionPolicy enum value, STOP_EXPANSION
+        keeps the tree as it is and only runs the simulations
+        :param eviction_fraction: Part of max_nodes removed at once
+        """
+        self.max_nodes = max_nodes
+        self.eviction_policy = eviction_policy
+        self.eviction_fraction = eviction_fraction
+        self.nodes_count = 0
+        self.evicted_nodes = 0
+        self.evictions = 0
+        # Counter of the simulations of all the searches, it is not reset
+        # with the search, so nodes of the reused tree visited in the earlier
+        # searches stay older than the nodes visited in the actual one
+        self.visits_count = 0
+
+    def set_root(self, root_node):
+        """
+        Counts the nodes of the new tree, nodes outside of it are no longer
+        reachable and get freed
+        :param root_node: Root node of the tree
+        """
+        self.nodes_count = len(root_node.get_subtree_nodes())
+
+    def make_room(self, root_node):
+        """
+        Removes leaves of the tree according to the eviction policy when the
+        tree has reached the limit
+        :param root_node: Root node of the tree
+        """
+        if self.has_room() or \
+                self.eviction_policy == self.EvictionPolicy.STOP_EXPANSION:
+            return
+
+        if self.eviction_policy == self.EvictionPolicy.LEAST_VISITED:
+            eviction_key = lambda node: node.plays
+        else:
+            eviction_key = lambda node: node.last_visit
+        leaves = [node for node in root_node.get_subtree_nodes()
+                  if not node.children and node.parent is not None and
+                  node.parent is not root_node]
+        leaves.sort(key=eviction_key)
+
+        self.evictions += 1
+        for node in leaves[:max(1, int(self.max_nodes * self.eviction_fraction))]:
+            node.parent.remove_child(node)
+            self.nodes_count -= 1
+            self.evicted_nodes += 1
+
+    def has_room(self):
+        """
+        :return: True if the new node can be added to the tree
+        """
+        return self.max_nodes is None or self.nodes_count < self.max_nodes
+
+    def next_visit(self):
+        """
+        :return: Number of the next visit, bigger than all numbers given
+        before
+        """
+        self.visits_count += 1
+        return self.visits_count
+
+    def node_added(self):
+        """
+        Counts the node added to the tree
+        """
+        self.nodes_count += 1
+
+    def get_stats(self):
+        """
+        :return: MonteCarloTreeStats with the actual counters
+        """
+        return MonteCarloTreeStats(self.nodes_count, self.max_nodes, self.evicted_nodes,
+                                   self.evictions)
@@ -0,0 +1,92 @@
+"""Module providing ordering of the moves searched by alpha beta algorithm.
+The earlier the move causing the cutoff is searched, the fewer of its
+siblings have to be searched at all"""
+from collections import namedtuple
+
+MoveOrderingStats = namedtuple('MoveOrderingStats', ['cutoffs', 'first_move_cutoffs',
+                                                     'first_move_cutoff_rate'])
+MoveOrderingStats.__doc__ = """Number of cutoffs of the search and part of them
+caused by the first searched move"""
+
+
+class MoveOrderer:
+    """Class ordering moves with the captures first, ordered by the number of
+    taken pawns, then killer moves of the ply and then moves with the highest
+    history score. Best move of the transposition table or of the previous
+    iteration is put in front of them by the tree builder"""
+
+    def __init__(self, get_captures_num=None, use_killers=True, use_history=True,
+                 killers_num=2):
+        """
+        :param get_captures_num: Function giving the number of pawns taken by
+        the move, None when the game has no captures
+        :param use_killers: Tells if the killer moves are searched early
+        :param use_history: Tells if the moves are ordered by the history
+        score
+        :param killers_num: Number of killer moves remembered for every ply
+        """
+        self.get_captures_num = get_captures_num
+        self.use_killers = use_killers
+        self.use_history = use_history
+        self.killers_num = killers_num
+        self.killers = {}
+        self.history = {}
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+
+    def new_search(self):
+        """
+        Forgets the killer moves and the statistics of the previous search,
+        the history scores are halved, so the old ones fade out
+        """
+        self.killers = {}
+        self.history = {move: score // 2 for move, score in self.history.items() if score > 1}
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+
+    def order_moves(self, moves, ply):
+        """
+        Orders the moves in place
+        :param moves: List of moves of the position
+        :param ply: Distance of the position from the root of the search
+        """
+        killers = self.killers.get(ply, ()) if self.use_killers else ()
+        history = self.history if self.use_history else {}
+        get_captures_num = self.get_captures_num
+        moves.sort(key=lambda move: (
+            get_captures_num(move) if get_captures_num is not None else 0,
+            move in killers,
+            history.get(move, 0)
+        ), reverse=True)
+
+    def record_cutoff(self, move, ply, depth, move_num):
+        """
+        Remembers the move that caused the cutoff, captures are searched
+        early anyway, so only the quiet moves become killers and get the
+        history score
+        :param move: Move that caused the cutoff
+        :param ply: Distance of the position from the root of the search
+        :param depth: Depth left for the search of the position
+        :param move_num: Index of the move in the searched order
+        """
+        self.cutoffs += 1
+        if move_num == 0:
+            self.first_move_cutoffs += 1
+        if self.get_captures_num is not None and self.get_captures_num(move):
+            return
+
+        if self.use_killers:
+            killers = self.killers.setdefault(ply, [])
+            if move in killers:
+                killers.remove(move)
+            killers.insert(0, move)
+            del killers[self.killers_num:]
+        if self.use_history:
+            self.history[move] = self.history.get(move, 0) + depth * depth
+
+    def get_stats(self):
+        """
+        :return: MoveOrderingStats of the actual search
+        """
+        first_move_cutoff_rate = self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0
+        return MoveOrderingStats(self.cutoffs, self.first_move_cutoffs, first_move_cutoff_rate)
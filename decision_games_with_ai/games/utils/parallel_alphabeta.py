@@ -0,0 +1,79 @@
+"""Module providing functions run in the worker processes by the parallel
+alpha beta search. Moves of the root are split between the workers, which
+share the best score of the root found so far, so every move is searched with
+the best alpha bound known when its search starts
+"""
+import pickle
+
+# Tree builder and the shared alpha bound of the worker process, set when the
+# worker process starts
+_worker_tree_builder = None
+_shared_alpha = None
+
+
+def init_worker(tree_builder_bytes, shared_alpha):
+    """
+    Initializes worker process with its copy of the tree builder
+    :param tree_builder_bytes: Pickled tree builder
+    :param shared_alpha: multiprocessing.Value with the best score of the root
+    found so far by any process
+    """
+    global _worker_tree_builder, _shared_alpha
+    _worker_tree_builder = pickle.loads(tree_builder_bytes)
+    _shared_alpha = shared_alpha
+
+
+def search_root_move(depth, actual_player, player, actual_board, min_score, beta, key,
+                     moves_without_capture):
+    """
+    Searches position after one of the root moves. The window starts at the
+    shared alpha, score equal to it is only the upper bound, so the position
+    is searched again with the full window to get its exact score, then ties
+    are resolved as in the sequential search. Scores do not have to be
+    integers
+    :param depth: Depth left for the search of the position
+    :param actual_player: Player to move in the position
+    :param player: Player for which the root move is discovered
+    :param actual_board: Board of the position, it gets modified
+    :param min_score: Lowest score of the search, alpha bound of the full
+    window
+    :param beta: Beta bound of the root
+    :param key: Zobrist key of the position, None when transposition table is
+    not used
+    :param moves_without_capture: Number of moves made since the last capture
+    before the position, the game of the worker does not know it
+    :return: Tuple of the score, exact when it is not lower than the shared
+    alpha read at the start of the search, the number of searched nodes and
+    QuiescenceStats of the search
+    """
+    with _shared_alpha.get_lock():
+        alpha = _shared_alpha.value
+    _worker_tree_builder._reset_search_stats()
+    score, _ = _worker_tree_builder._search_alphabeta(
+        depth=depth,
+        actual_player=actual_player,
+        player=player,
+        actual_board=actual_board,
+        alpha=alpha,
+        beta=beta,
+        key=key,
+        ply=1,
+        moves_without_capture=moves_without_capture
+    )
+    if score == alpha:
+        score, _ = _worker_tree_builder._search_alphabeta(
+            depth=depth,
+            actual_player=actual_player,
+            player=player,
+            actual_board=actual_board,
+            alpha=min_score,
+            beta=beta,
+            key=key,
+            ply=1,
+            moves_without_capture=moves_without_capture
+        )
+    with _shared_alpha.get_lock():
+        if score > _shared_alpha.value:
+            _shared_alpha.value = score
+    return score, _worker_tree_builder.searched_nodes, \
+        _worker_tree_builder.get_quiescence_stats()
@@ -0,0 +1,49 @@
+"""Module providing functions run in the worker processes by the parallel
+monte carlo tree search. Tree builder is sent to the workers pickled, the
+monte carlo tree and the pool of processes are not part of the pickled state
+"""
+import pickle
+import random
+
+# Tree builder unpickled by the worker for the leaf parallel search, kept
+# between the play outs of the same search
+_cached_tree_builder = (None, None)
+
+
+def run_independent_search(tree_builder_bytes, num_of_sim, time_limit_ms, seed):
+    """
+    Builds independent monte carlo tree from the actual position of the game
+    :param tree_builder_bytes: Pickled tree builder
+    :param num_of_sim: Number of simulations, None for no limit
+    :param time_limit_ms: Time limit of the simulations in milliseconds
+    :param seed: Seed of the random numbers used in the simulations
+    :return: List of MonteCarloMoveStats of the root moves
+    """
+    tree_builder = pickle.loads(tree_builder_bytes)
+    random.seed(seed)
+    tree_builder.build_monte_carlo_tree(num_of_sim=num_of_sim, time_limit_ms=time_limit_ms)
+    return tree_builder.get_monte_carlo_statistics()
+
+
+def run_play_outs(search_id, tree_builder_bytes, actual_player, board, depth, play_outs_num,
+                  seed):
+    """
+    Plays random games from the given position
+    :param search_id: Identifier of the search, the builder is unpickled once
+    for every search
+    :param tree_builder_bytes: Pickled tree builder
+    :param actual_player: Player to move in the position
+    :param board: Board of the position
+    :param depth: Depth of the position in the monte carlo tree
+    :param play_outs_num: Number of games to play
+    :param seed: Seed of the random numbers used in the games
+    :return: List of the winners of the games, None for the draws
+    """
+    global _cached_tree_builder
+    cached_search_id, tree_builder = _cached_tree_builder
+    if cached_search_id != search_id:
+        tree_builder = pickle.loads(tree_builder_bytes)
+        _cached_tree_builder = (search_id, tree_builder)
+    random.seed(seed)
+    return [tree_builder.play_out(actual_player, tree_builder._get_board_copy(board), depth)
+            for _ in range(play_outs_num)]
@@ -0,0 +1,91 @@
+"""Module providing transposition table used by the tree builders to cache
+results of already searched positions"""
+from collections import namedtuple
+from enum import Enum
+
+TableEntry = namedtuple('TableEntry', ['key', 'depth', 'bound', 'score', 'best_move',
+                                       'generation'])
+
+# Approximate memory used by one entry of the table in bytes, used for
+# translating the table size given in megabytes to the number of entries
+ENTRY_SIZE = 128
+
+
+class TranspositionTable:
+    """Fixed size hash table indexed with position keys (e.g. Zobrist keys).
+    Scores are stored from the point of view of the player to move in the
+    stored position"""
+
+    class Bound(Enum):
+        """Enum with types of the stored score"""
+        EXACT = 0
+        LOWER = 1
+        UPPER = 2
+
+    class ReplacementPolicy(Enum):
+        """Enum with policies deciding if the new entry overwrites the one
+        already stored in the slot"""
+        ALWAYS = 0
+        DEPTH_PREFERRED = 1
+
+    def __init__(self, size_mb=16, replacement_policy=ReplacementPolicy.DEPTH_PREFERRED):
+        """
+        :param size_mb: Size of the table in megabytes
+        :param replacement_policy: ReplacementPolicy enum value, ALWAYS
+        overwrites the slot, DEPTH_PREFERRED keeps the entry searched deeper
+        unless it comes from the previous search
+        """
+        self.entries_num = max(1, int(size_mb * 1024 * 1024) // ENTRY_SIZE)
+        self.replacement_policy = replacement_policy
+        self.entries = [None] * self.entries_num
+        self.generation = 0
+        self.hits = 0
+        self.stores = 0
+
+    def clear(self):
+        """
+        Removes all entries from the table
+        """
+        self.entries = [None] * self.entries_num
+        self.generation = 0
+
+    def new_search(self):
+        """
+        Marks beginning of the new search, entries from the previous searches
+        are replaced first by DEPTH_PREFERRED policy
+        """
+        self.generation += 1
+
+    def probe(self, key):
+        """
+        Looks for the entry of the position
+        :param key: Key of the position
+        :return: TableEntry of the position or None if it is not stored
+        """
+        entry = self.entries[key % self.entries_num]
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+        return None
+
+    def store(self, key, depth, bound, score, best_move):
+        """
+        Stores result of the position search according to the replacement
+        policy
+        :param key: Key of the position
+        :param depth: Depth at which the position was searched
+        :param bound: Bound enum value of the score
+        :param score: Score from the point of view of the player to move
+        :param best_move: Best move found in the position, None if unknown
+        """
+        index = key % self.entries_num
+        entry = self.entries[index]
+        if entry is not None and \
+                self.replacement_policy == self.ReplacementPolicy.DEPTH_PREFERRED and \
+                entry.key != key and entry.generation == self.generation and \
+                entry.depth > depth:
+            return
+        if best_move is None and entry is not None and entry.key == key:
+            best_move = entry.best_move
+        self.entries[index] = TableEntry(key, depth, bound, score, best_move, self.generation)
+        self.stores += 1
@@ -9,7 +9,9 @@ class VirtualEnemy(PlayerABC):
     """Class providing methods for behaviour of virtual enemy"""
 
     def __init__(self, name, tree_builder, search_algorithm, search_method_enum,
-                 search_depth=5, num_of_sim=100):
+                 search_depth=5, num_of_sim=100, build_tree=False,
+                 time_limit_ms=None, monte_carlo_parallelization=None, monte_carlo_workers=2,
+                 alpha_beta_workers=None):
         """
         Initializes virtual enemy class with necessary parameters
         :param name: Name of the virtual enemy
@@ -17,20 +19,46 @@ class VirtualEnemy(PlayerABC):
         building the game tree
         :param search_algorithm: Algorithm object instance responsible for
         searching through the decision tree and choosing the next move
+        :param search_method_enum: SearchMethods enum value, PERFECT_PLAY
+        takes the move from the precomputed table, supported by the tic tac
+        toe tree builder for 3x3 board
         :param search_depth: Depth of the tree that is going to get build for
         minimax method
         :param time_limit: Time limit for the search of the tree for monte carlo
         tree search method
+        :param build_tree: When set, minimax and alpha beta methods build the
+        whole anytree tree and search it with search_algorithm, which is
+        useful for debugging and exporting the tree, otherwise the move is
+        found directly by the tree builder
+        :param time_limit_ms: Time limit for the move in milliseconds, when
+        set alpha beta and pvs methods search with iterative deepening until
+        the limit runs out instead of searching at search_depth and monte carlo
+        method runs simulations until the limit instead of num_of_sim
+        :param monte_carlo_parallelization: MonteCarloParallelization enum
+        value, when set monte carlo method runs the simulations in the worker
+        processes, supported by the checkers tree builder
+        :param monte_carlo_workers: Number of the worker processes for the
+        parallel monte carlo method
+        :param alpha_beta_workers: Number of the worker processes searching
+        the root moves of alpha beta method at search_depth, None searches in
+        this process, supported by the checkers tree builder
         """
         self.name = name
         self.tree_builder = tree_builder
         self.search_algorithm = search_algorithm
         self.search_depth = search_depth
         self.num_of_sim = num_of_sim
+        self.build_tree = build_tree
+        self.time_limit_ms = time_limit_ms
+        self.monte_carlo_parallelization = monte_carlo_parallelization
+        self.monte_carlo_workers = monte_carlo_workers
+        self.alpha_beta_workers = alpha_beta_workers
         self.get_builder_output = {
             SearchMethods.MINIMAX: self._get_minimax_move,
             SearchMethods.MONTECARLO: self._get_monte_carlo_move,
-            SearchMethods.ALPHABETA: self._get_alpha_beta_move
+            SearchMethods.ALPHABETA: self._get_alpha_beta_move,
+            SearchMethods.PVS: self._get_pvs_move,
+            SearchMethods.PERFECT_PLAY: self._get_perfect_play_move
         }[search_method_enum]
 
     def get_player_move(self):
@@ -46,6 +74,9 @@ class VirtualEnemy(PlayerABC):
         Gets minimax enemy move
         :return: Move in uct format
         """
+        if not self.build_tree:
+            move, score = self.tree_builder.find_minimax_move(self.search_depth)
+            return move
         root_node = self._get_tree()
         return self.search_algorithm.search_tree(root_node)
 
@@ -61,13 +92,48 @@ class VirtualEnemy(PlayerABC):
         Direct getting of the move for montecarlo
         :return: Move in uct format
         """
-        return self.tree_builder.build_monte_carlo_tree(self.num_of_sim)
+        num_of_sim = self.num_of_sim if self.time_limit_ms is None else None
+        if self.monte_carlo_parallelization is not None:
+            return self.tree_builder.build_monte_carlo_tree(
+                num_of_sim, self.time_limit_ms, parallelization=self.monte_carlo_parallelization,
+                workers=self.monte_carlo_workers)
+        return self.tree_builder.build_monte_carlo_tree(num_of_sim, self.time_limit_ms)
 
     def _get_alpha_beta_move(self):
         """
         Direct getting of the move for alpha beta algorithm
         :return: Move in uct format
         """
+        if self.time_limit_ms is not None:
+            move, score = self.tree_builder.find_iterative_deepening_move(self.time_limit_ms)
+            return move
+        if not self.build_tree and self.alpha_beta_workers is not None:
+            move, score = self.tree_builder.find_parallel_alphabeta_move(
+                self.search_depth, self.alpha_beta_workers)
+            return move
+        if not self.build_tree:
+            move, score = self.tree_builder.find_alphabeta_move(self.search_depth)
+            return move
         root_node = self.tree_builder.build_alphabeta_tree(self.search_depth)
         # return self.tree_builder.build_alphabeta_tree(self.search_depth)
         return self.search_algorithm.search_tree(root_node)
+
+    def _get_pvs_move(self):
+        """
+        Direct getting of the move for principal variation search, with
+        aspiration windows when the time limit is set
+        :return: Move in uct format
+        """
+        if self.time_limit_ms is not None:
+            move, score = self.tree_builder.find_pvs_iterative_deepening_move(self.time_limit_ms)
+            return move
+        move, score = self.tree_builder.find_pvs_move(self.search_depth)
+        return move
+
+    def _get_perfect_play_move(self):
+        """
+        Getting of the move from the perfect play table
+        :return: Move in uct format
+        """
+        move, score = self.tree_builder.find_perfect_play_move()
+        return move
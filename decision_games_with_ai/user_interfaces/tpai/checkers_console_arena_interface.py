@@ -8,11 +8,23 @@ from decision_games_with_ai.games.checkers.game_implementation.game_board import
 from decision_games_with_ai.games.utils.events_exceptions import InvalidMoveException
 from decision_games_with_ai.games.utils.global_enums import GameStates
 from decision_games_with_ai.user_interfaces.control_interface_abc import ControlInterfaceABC
+from decision_games_with_ai.user_interfaces.tpai.parallel_arena import play_games_in_parallel
 
 
 class CheckersConsoleArenaInterface(ControlInterfaceABC):
 
-    def __init__(self, game, number_of_games, print_val_interval=100):
+    def __init__(self, game, number_of_games, print_val_interval=100, workers=0, seed=0):
+        """
+        :param game: Game object on which the games are played
+        :param number_of_games: Number of games to play
+        :param print_val_interval: Number of games after which the results
+        are printed
+        :param workers: Number of processes playing the games in parallel,
+        None for the number of cpus, 0 plays the games one after another on
+        the given game object
+        :param seed: Seed of the first game played in parallel, next games
+        get the following ones
+        """
         self.player1 = None
         self.player2 = None
         self.game = game
@@ -21,6 +33,8 @@ class CheckersConsoleArenaInterface(ControlInterfaceABC):
         self.player1_wins = 0
         self.player2_wins = 0
         self.games_played = 0
+        self.workers = workers
+        self.seed = seed
 
     def play(self, player1, player2):
         """
@@ -31,10 +45,17 @@ class CheckersConsoleArenaInterface(ControlInterfaceABC):
         """
         self.player1 = player1
         self.player2 = player2
-        for i in range(self.number_of_games):
-            self._play_one_game()
-            if i % self.print_val_interval == self.print_val_interval -1:
-                self.print_results_so_far()
+        if self.workers == 0:
+            for i in range(self.number_of_games):
+                self._play_one_game()
+                if i % self.print_val_interval == self.print_val_interval -1:
+                    self.print_results_so_far()
+        else:
+            for i, game_result in enumerate(play_games_in_parallel(
+                    self, self.number_of_games, self.workers, self.seed)):
+                self._add_end_game_results(game_result)
+                if i % self.print_val_interval == self.print_val_interval -1:
+                    self.print_results_so_far()
 
         separation_line = "".join(['#']*40)
         print(separation_line)
@@ -0,0 +1,52 @@
+"""Module providing playing of the arena games in the pool of processes. Every
+game is played on a fresh copy of the arena, with its own game and players,
+seeded with the number of the game, so the results do not depend on the
+number of processes or the order in which games finish.
+"""
+import pickle
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Pickled arena, unpickled for every game played by the worker process
+_worker_arena_bytes = None
+
+
+def _init_worker(arena_bytes):
+    """
+    Initializes worker process with the pickled arena
+    :param arena_bytes: Pickled arena interface with players set
+    """
+    global _worker_arena_bytes
+    _worker_arena_bytes = arena_bytes
+
+
+def _play_one_game(game_seed):
+    """
+    Plays one game on the fresh copy of the arena
+    :param game_seed: Seed of the random numbers used during the game
+    :return: GameStates enum with the result of the game
+    """
+    arena = pickle.loads(_worker_arena_bytes)
+    random.seed(game_seed)
+    arena._control_flow_of_the_game()
+    return arena.game.get_game_state()
+
+
+def play_games_in_parallel(arena, number_of_games, workers, seed=0):
+    """
+    Plays games of the arena in the pool of processes
+    :param arena: Arena interface with the players set, it gets pickled and
+    sent to the workers
+    :param number_of_games: Number of games to play
+    :param workers: Number of worker processes, None for the number of cpus
+    :param seed: Seed of the first game, next games get the following ones
+    :return: Generator yielding GameStates results of the games in the order
+    they finish
+    """
+    arena_bytes = pickle.dumps(arena)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(arena_bytes,)) as executor:
+        futures = [executor.submit(_play_one_game, seed + game_num)
+                   for game_num in range(number_of_games)]
+        for future in as_completed(futures):
+            yield future.result()
@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from decision_games_with_ai.games.checkers.game_implementation.game_board import GameBoard
+
+
+@pytest.fixture
+def game_board():
+    return GameBoard()
+
+
+@pytest.mark.parametrize('copy_format', ['list', 'bitboard'])
+def test_apply_and_undo_move_restore_board(game_board, copy_format):
+    rng = random.Random(1)
+    for game_num in range(10):
+        board = game_board.get_board_copy(copy_format=copy_format)
+        player = GameBoard.Players.PLAYER1
+        for move_num in range(80):
+            possible_moves = game_board.get_possible_moves(player, board)
+            if not possible_moves:
+                break
+            for move in possible_moves:
+                board_before = game_board.get_board_copy(board, copy_format=copy_format)
+                expected = game_board.make_move(
+                    player, move, game_board.get_board_copy(board, copy_format=copy_format))
+
+                undo_record = game_board.apply_move(player, move, board)
+                assert board == expected
+
+                game_board.undo_move(undo_record, board)
+                assert board == board_before
+
+            game_board.apply_move(player, rng.choice(possible_moves), board)
+            player = GameBoard.opposite_player[player]
+
+
+def test_undo_move_restores_moves_counter(game_board):
+    game_board.move_count = 5
+
+    undo_record = game_board.apply_move(GameBoard.Players.PLAYER1, 'c3d4')
+    assert game_board.move_count == 6
+
+    game_board.undo_move(undo_record)
+    assert game_board.move_count == 5
+    assert game_board.board_arrays == GameBoard().board_arrays
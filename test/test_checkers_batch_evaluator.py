@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from decision_games_with_ai.games.checkers.game import Game
+from decision_games_with_ai.games.checkers.game_implementation.game_board import GameBoard
+from decision_games_with_ai.games.checkers.tree_builder import CheckersTreeBuilder
+
+np = pytest.importorskip('numpy')
+from decision_games_with_ai.games.checkers.game_implementation.batch_evaluator import \
+    BatchEvaluator  # noqa: E402
+
+
+@pytest.fixture
+def boards():
+    rng = random.Random(7)
+    game = Game()
+    game.start_game()
+    boards = []
+    for move_num in range(40):
+        board = game.game_board.get_board_copy()
+        legal_moves = game.game_board.get_legal_moves(game.current_players_turn, board)
+        if not legal_moves:
+            break
+        boards.append(board)
+        game.make_move(rng.choice(legal_moves).to_uci())
+    return boards
+
+
+@pytest.mark.parametrize('player', [GameBoard.Players.PLAYER1, GameBoard.Players.PLAYER2])
+def test_batch_values_are_the_same_as_the_static_evaluation(boards, player):
+    game = Game()
+    game.start_game()
+    tree_builder = CheckersTreeBuilder(game)
+    batch_evaluator = BatchEvaluator()
+    bitboards = [game.game_board.get_board_copy(board, copy_format='bitboard')
+                 for board in boards]
+    expected_values = [tree_builder._static_evaluation_value(board, player)
+                       for board in boards]
+
+    assert batch_evaluator.evaluate(batch_evaluator.encode_boards(boards),
+                                    player).tolist() == expected_values
+    assert batch_evaluator.evaluate(batch_evaluator.encode_boards(bitboards),
+                                    player).tolist() == expected_values
+
+
+def test_fields_array_and_positional_weights():
+    encoded_fields = np.zeros((1, 8, 8), dtype=np.int8)
+    encoded_fields[0, 0, 0] = 1
+    encoded_fields[0, 7, 7] = -2
+    batch_evaluator = BatchEvaluator(positional_weights=range(32))
+
+    # Square 0 of the first player and the king on square 31, rotated to 0
+    assert batch_evaluator.evaluate(encoded_fields, GameBoard.Players.PLAYER1).tolist() == \
+        [1 + 0 - 8 - 0]
+    encoded_fields[0, 0, 0] = 0
+    assert batch_evaluator.evaluate(encoded_fields, GameBoard.Players.PLAYER2).tolist() == [8]
+
+
+@pytest.mark.parametrize('use_bitboard', [False, True])
+def test_batched_leaves_give_the_same_search_results(use_bitboard):
+    rng = random.Random(2)
+    game = Game()
+    game.start_game()
+    tree_builder = CheckersTreeBuilder(game, use_bitboard=use_bitboard)
+    batch_tree_builder = CheckersTreeBuilder(game, use_bitboard=use_bitboard,
+                                             batch_evaluator=BatchEvaluator())
+    for move_num in range(6):
+        assert batch_tree_builder.find_alphabeta_move(3) == tree_builder.find_alphabeta_move(3)
+        assert batch_tree_builder.find_pvs_move(3) == tree_builder.find_pvs_move(3)
+        legal_moves = game.game_board.get_legal_moves(game.current_players_turn,
+                                                      game.game_board.get_board_copy())
+        game.make_move(rng.choice(legal_moves).to_uci())
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from decision_games_with_ai.games.checkers.game_implementation.game_board import GameBoard
+
+
+@pytest.fixture
+def game_board():
+    return GameBoard()
+
+
+def test_conversion_to_bitboard_and_back(game_board):
+    bitboard = game_board.get_board_copy(copy_format='bitboard')
+
+    assert game_board.get_board_copy(bitboard) == game_board.board_arrays
+
+
+def test_starting_position_moves(game_board):
+    bitboard = game_board.get_board_copy(copy_format='bitboard')
+    for player in (GameBoard.Players.PLAYER1, GameBoard.Players.PLAYER2):
+        expected = game_board.get_possible_moves(player, game_board.board_arrays)
+        result = game_board.get_possible_moves(player, bitboard)
+
+        assert expected == result
+
+
+def test_random_games_give_same_moves_and_boards(game_board):
+    rng = random.Random(0)
+    for game_num in range(10):
+        board = game_board.get_board_copy()
+        bitboard = game_board.get_board_copy(copy_format='bitboard')
+        player = GameBoard.Players.PLAYER1
+        for move_num in range(80):
+            expected_moves = game_board.get_possible_moves(player, board)
+
+            assert expected_moves == game_board.get_possible_moves(player, bitboard)
+            assert game_board.check_game_state(player, board) == \
+                game_board.check_game_state(player, bitboard)
+            if not expected_moves:
+                break
+
+            move = rng.choice(expected_moves)
+            board = game_board.make_move(player, move, board)
+            bitboard = game_board.make_move(player, move, bitboard)
+
+            assert game_board.get_board_copy(bitboard) == board
+            player = GameBoard.opposite_player[player]
+
+
+def test_legal_moves_match_possible_moves(game_board):
+    rng = random.Random(2)
+    for game_num in range(5):
+        board = game_board.get_board_copy()
+        bitboard = game_board.get_board_copy(copy_format='bitboard')
+        player = GameBoard.Players.PLAYER1
+        for move_num in range(80):
+            expected_moves = sorted(set(game_board.get_possible_moves(player, board)))
+            legal_moves = game_board.get_legal_moves(player, board)
+
+            assert sorted(move.to_uci() for move in legal_moves) == expected_moves
+            assert sorted(game_board.get_legal_moves(player, bitboard)) == sorted(legal_moves)
+            if not legal_moves:
+                break
+
+            move = rng.choice(legal_moves)
+            board = game_board.make_move(player, move, board)
+            bitboard = game_board.make_move(player, move, bitboard)
+            player = GameBoard.opposite_player[player]
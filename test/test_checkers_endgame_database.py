@@ -0,0 +1,193 @@
+import os
+import pickle
+import random
+
+import pytest
+
+from decision_games_with_ai.games.checkers.game import Game
+from decision_games_with_ai.games.checkers.game_implementation.bitboard import PLAYER1_INDEX
+from decision_games_with_ai.games.checkers.game_implementation.endgame_database import \
+    EndgameDatabase, EndgameDatabaseGenerator, get_groups_masks, get_position_from_rank, \
+    get_position_rank, get_signature, get_signature_size, get_signatures
+from decision_games_with_ai.games.checkers.game_implementation.game_board import GameBoard
+from decision_games_with_ai.games.checkers.tree_builder import CheckersTreeBuilder, MAX_VAL
+
+
+@pytest.fixture(scope='module')
+def database_path(tmp_path_factory):
+    database_path = str(tmp_path_factory.mktemp('endgame') / 'endgame.db')
+    EndgameDatabaseGenerator(max_pieces=2).generate(database_path)
+    return database_path
+
+
+def get_entry_value(entry):
+    return entry.result, entry.distance
+
+
+def find_slow_win(database):
+    signature = (0, 1, 1, 0)
+    for rank in range(get_signature_size(signature)):
+        board = get_position_from_rank(signature, rank)
+        entry = database.probe(board, PLAYER1_INDEX)
+        if entry.result == 1 and entry.distance >= 5:
+            return board, entry
+
+
+def test_positions_agree_with_their_moves(database_path):
+    database = EndgameDatabase(database_path)
+    rng = random.Random(3)
+    for signature in get_signatures(2):
+        size = get_signature_size(signature)
+        for index in rng.sample(range(2 * size), 100):
+            player_index, rank = divmod(index, size)
+            board = get_position_from_rank(signature, rank)
+            assert get_signature(board) == signature
+            assert get_position_rank(get_groups_masks(board)) == rank
+
+            best_value = (-1, 0)
+            for move in board.get_legal_moves(player_index):
+                child_board = board.make_move(player_index, move)
+                child_entry = database.probe(child_board, 1 - player_index)
+                if child_entry is None or child_entry.result == -1:
+                    distance = child_entry.distance + 1 if child_entry is not None else 1
+                    value = (1, distance)
+                elif child_entry.result == 1:
+                    value = (-1, child_entry.distance + 1)
+                else:
+                    value = (0, None)
+                # Faster wins and slower losses are better
+                if (value[0], -value[0] * (value[1] or 0)) > \
+                        (best_value[0], -best_value[0] * (best_value[1] or 0)):
+                    best_value = value
+
+            assert get_entry_value(database.probe(board, player_index)) == best_value
+
+
+def test_database_copies_map_the_same_file(database_path):
+    database = EndgameDatabase(database_path)
+    database_copy = pickle.loads(pickle.dumps(database))
+    signature = (0, 1, 1, 0)
+    for rank in range(0, get_signature_size(signature), 7):
+        board = get_position_from_rank(signature, rank)
+
+        assert database_copy.probe(board, PLAYER1_INDEX) == \
+            database.probe(board, PLAYER1_INDEX)
+    database_copy.close()
+    database.close()
+
+
+def test_database_without_distances(database_path, tmp_path):
+    results_path = str(tmp_path / 'endgame_results.db')
+    EndgameDatabaseGenerator(max_pieces=2, store_distance=False).generate(results_path)
+    database = EndgameDatabase(database_path)
+    results_database = EndgameDatabase(results_path)
+    signature = (1, 0, 0, 1)
+    for rank in range(0, get_signature_size(signature), 5):
+        board = get_position_from_rank(signature, rank)
+
+        assert results_database.probe(board, PLAYER1_INDEX).result == \
+            database.probe(board, PLAYER1_INDEX).result
+    assert os.path.getsize(results_path) < os.path.getsize(database_path)
+
+    # Wins without the distances can be drawn by the moves without capture
+    # limit, so the search does not take them
+    board, _ = find_slow_win(database)
+    game = Game(GameBoard.Players.PLAYER1)
+    game.start_game()
+    game.game_board.board_arrays = game.game_board.get_board_copy(board)
+    assert CheckersTreeBuilder(game, endgame_database=results_database).find_alphabeta_move(2) \
+        == CheckersTreeBuilder(game).find_alphabeta_move(2)
+
+
+@pytest.mark.parametrize('use_bitboard', [False, True])
+def test_search_takes_exact_scores_from_the_database(database_path, use_bitboard):
+    database = EndgameDatabase(database_path)
+    board, entry = find_slow_win(database)
+
+    game = Game(GameBoard.Players.PLAYER1)
+    game.start_game()
+    game.game_board.board_arrays = game.game_board.get_board_copy(board)
+    tree_builder = CheckersTreeBuilder(game, use_bitboard=use_bitboard,
+                                       endgame_database=database)
+    move, score = tree_builder.find_alphabeta_move(2)
+
+    assert score == MAX_VAL - entry.distance
+    assert tree_builder.find_pvs_move(2)[1] == score
+    child_entry = database.probe(board.make_move(PLAYER1_INDEX, move), 1 - PLAYER1_INDEX)
+    assert get_entry_value(child_entry) == (-1, entry.distance - 1)
+
+
+@pytest.mark.parametrize('use_bitboard', [False, True])
+def test_database_wins_have_to_fit_in_the_moves_without_capture_limit(database_path,
+                                                                      use_bitboard):
+    database = EndgameDatabase(database_path)
+    board, entry = find_slow_win(database)
+    game = Game(GameBoard.Players.PLAYER1)
+    game.start_game()
+    game.game_board.board_arrays = game.game_board.get_board_copy(board)
+    tree_builder = CheckersTreeBuilder(game, use_bitboard=use_bitboard,
+                                       endgame_database=database)
+    plain_tree_builder = CheckersTreeBuilder(game, use_bitboard=use_bitboard)
+
+    for move_count in range(GameBoard.max_moves_without_capture):
+        game.game_board.move_count = move_count
+        if entry.distance <= GameBoard.max_moves_without_capture - move_count:
+            expected_score = MAX_VAL - entry.distance
+        else:
+            expected_score = plain_tree_builder.find_alphabeta_move(2)[1]
+            assert expected_score != MAX_VAL - entry.distance
+
+        assert tree_builder.find_alphabeta_move(2)[1] == expected_score
+        assert tree_builder.find_pvs_move(2)[1] == expected_score
+
+    # Win does not fit in the moves left after the root moves
+    game.game_board.move_count = GameBoard.max_moves_without_capture - entry.distance + 1
+    try:
+        assert tree_builder.find_parallel_alphabeta_move(2, workers=2) == \
+            plain_tree_builder.find_alphabeta_move(2)
+    finally:
+        tree_builder.shutdown_workers()
+
+
+def test_iterative_deepening_stops_at_the_database_win(database_path):
+    database = EndgameDatabase(database_path)
+    board, entry = find_slow_win(database)
+    game = Game(GameBoard.Players.PLAYER1)
+    game.start_game()
+    game.game_board.board_arrays = game.game_board.get_board_copy(board)
+    tree_builder = CheckersTreeBuilder(game, endgame_database=database)
+
+    assert tree_builder.find_iterative_deepening_move(60000, max_depth=8)[1] == \
+        MAX_VAL - entry.distance
+    assert tree_builder.searched_depth == 1
+    assert tree_builder.find_pvs_iterative_deepening_move(60000, max_depth=8)[1] == \
+        MAX_VAL - entry.distance
+    assert tree_builder.searched_depth == 1
+
+
+@pytest.mark.parametrize('use_bitboard', [False, True])
+def test_batched_leaves_take_scores_from_the_database(database_path, use_bitboard):
+    batch_evaluator_module = pytest.importorskip(
+        'decision_games_with_ai.games.checkers.game_implementation.batch_evaluator')
+    database = EndgameDatabase(database_path)
+    game = Game(GameBoard.Players.PLAYER1)
+    game.start_game()
+    tree_builder = CheckersTreeBuilder(game, use_bitboard=use_bitboard,
+                                       endgame_database=database)
+    batch_tree_builder = CheckersTreeBuilder(
+        game, use_bitboard=use_bitboard, endgame_database=database,
+        batch_evaluator=batch_evaluator_module.BatchEvaluator())
+    # Positions with three pieces are not in the database, positions after
+    # the captures are
+    signature = (0, 1, 0, 2)
+    searched_positions = 0
+    for rank in range(0, get_signature_size(signature), 31):
+        board = get_position_from_rank(signature, rank)
+        if not board.has_captures(PLAYER1_INDEX):
+            continue
+        game.game_board.board_arrays = game.game_board.get_board_copy(board)
+        searched_positions += 1
+
+        assert batch_tree_builder.find_alphabeta_move(1) == tree_builder.find_alphabeta_move(1)
+        assert batch_tree_builder.find_pvs_move(1) == tree_builder.find_pvs_move(1)
+    assert searched_positions
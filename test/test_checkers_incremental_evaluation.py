@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from decision_games_with_ai.games.checkers.game import Game
+from decision_games_with_ai.games.checkers.game_implementation.game_board import GameBoard
+from decision_games_with_ai.games.checkers.game_implementation.incremental_evaluation import \
+    IncrementalEvaluation
+from decision_games_with_ai.games.checkers.tree_builder import CheckersTreeBuilder
+
+
+@pytest.fixture
+def game():
+    game = Game()
+    game.start_game()
+    return game
+
+
+@pytest.mark.parametrize('use_bitboard', [False, True])
+@pytest.mark.parametrize('seed', range(5))
+def test_incremental_values_follow_random_moves_and_undos(game, use_bitboard, seed):
+    rng = random.Random(seed)
+    incremental_evaluation = IncrementalEvaluation()
+    weighted_evaluation = IncrementalEvaluation(
+        positional_weights=[rng.randrange(-3, 4) for square in range(32)])
+    tree_builder = CheckersTreeBuilder(game, use_bitboard=use_bitboard,
+                                       incremental_evaluation=incremental_evaluation)
+    static_tree_builder = CheckersTreeBuilder(game, use_bitboard=use_bitboard)
+    board = tree_builder._get_board_copy()
+    incremental_evaluation.reset(board)
+    weighted_evaluation.reset(board)
+    player = GameBoard.Players.PLAYER1
+    undo_records = []
+
+    for step in range(300):
+        legal_moves = game.game_board.get_legal_moves(player, board)
+        if undo_records and (not legal_moves or rng.random() < 0.4):
+            tree_builder._undo_move(undo_records.pop(), board)
+            weighted_evaluation.undo()
+            player = tree_builder.next_player_dict[player]
+        elif legal_moves:
+            move = rng.choice(legal_moves)
+            weighted_evaluation.before_move(move)
+            undo_records.append(tree_builder._apply_move_with_key(player, move, board, None)[0])
+            weighted_evaluation.after_move()
+            player = tree_builder.next_player_dict[player]
+
+        for evaluated_player in (GameBoard.Players.PLAYER1, GameBoard.Players.PLAYER2):
+            assert incremental_evaluation.get_value(evaluated_player) == \
+                static_tree_builder._static_evaluation_value(board, evaluated_player)
+            assert weighted_evaluation.get_value(evaluated_player) == \
+                weighted_evaluation.evaluate_board(board, evaluated_player)
+
+
+def test_search_with_incremental_evaluation_gives_the_same_moves(game):
+    rng = random.Random(3)
+    tree_builder = CheckersTreeBuilder(game, use_bitboard=True, use_quiescence=True,
+                                       incremental_evaluation=IncrementalEvaluation())
+    static_tree_builder = CheckersTreeBuilder(game, use_bitboard=True, use_quiescence=True)
+    for move_num in range(8):
+        assert tree_builder.find_alphabeta_move(4) == static_tree_builder.find_alphabeta_move(4)
+        assert tree_builder.find_pvs_move(4) == static_tree_builder.find_pvs_move(4)
+        legal_moves = game.game_board.get_legal_moves(game.current_players_turn,
+                                                      game.game_board.get_board_copy())
+        game.make_move(rng.choice(legal_moves).to_uci())
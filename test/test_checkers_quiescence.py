@@ -0,0 +1,98 @@
+import random
+
+import pytest
+
+from decision_games_with_ai.games.checkers.game import Game
+from decision_games_with_ai.games.checkers.game_implementation.bitboard import BitBoard
+from decision_games_with_ai.games.checkers.game_implementation.checkers_move import \
+    xy_to_square
+from decision_games_with_ai.games.checkers.game_implementation.game_board import GameBoard
+from decision_games_with_ai.games.checkers.tree_builder import CheckersTreeBuilder, MAX_VAL
+from decision_games_with_ai.players.virtual_player.search_algorithms.minimax_search import \
+    MinimaxSearchAlgorithms
+
+
+@pytest.fixture
+def game():
+    game = Game()
+    game.start_game()
+    return game
+
+
+def make_random_moves(game, moves_num, rng):
+    for move_num in range(moves_num):
+        legal_moves = game.game_board.get_legal_moves(game.current_players_turn,
+                                                      game.game_board.get_board_copy())
+        game.make_move(rng.choice(legal_moves).to_uci())
+
+
+@pytest.mark.parametrize('use_bitboard', [False, True])
+def test_searches_agree_with_quiescence(game, use_bitboard):
+    rng = random.Random(1)
+    tree_builder = CheckersTreeBuilder(game, use_bitboard=use_bitboard, use_quiescence=True)
+    search_algorithm = MinimaxSearchAlgorithms()
+    for move_num in range(6):
+        alphabeta_move = tree_builder.find_alphabeta_move(3)
+
+        assert tree_builder.find_pvs_move(3) == alphabeta_move
+        assert search_algorithm.search_tree(tree_builder.build_alphabeta_tree(3)) == \
+            alphabeta_move[0]
+        make_random_moves(game, 3, rng)
+
+
+def test_captures_are_searched_beyond_the_depth(game):
+    make_random_moves(game, 6, random.Random(1))
+    tree_builder = CheckersTreeBuilder(game, use_bitboard=True, use_quiescence=True)
+
+    tree_builder.find_alphabeta_move(4)
+
+    assert tree_builder.get_quiescence_stats().max_depth > 0
+    assert tree_builder.get_quiescence_stats().limit_hits == 0
+
+
+def test_node_limit_stops_the_quiescence_search(game):
+    make_random_moves(game, 6, random.Random(1))
+    tree_builder = CheckersTreeBuilder(game, use_bitboard=True, use_quiescence=True,
+                                       quiescence_nodes_limit=0)
+
+    tree_builder.find_alphabeta_move(4)
+
+    assert tree_builder.get_quiescence_stats().max_depth == 0
+    assert tree_builder.get_quiescence_stats().limit_hits > 0
+
+
+def test_parallel_search_agrees_with_quiescence_node_limit():
+    rng = random.Random(7)
+    game = Game(GameBoard.Players.PLAYER1)
+    game.start_game()
+    tree_builder = CheckersTreeBuilder(game, use_bitboard=True, use_quiescence=True,
+                                       quiescence_nodes_limit=400)
+    quiescence_nodes = 0
+    try:
+        for move_num in range(20):
+            parallel_move = tree_builder.find_parallel_alphabeta_move(4, workers=2)
+            parallel_stats = tree_builder.get_quiescence_stats()
+
+            # Workers start counting the quiescence nodes with every search
+            assert parallel_stats.limit_hits == 0
+            assert parallel_move == tree_builder.find_alphabeta_move(4)
+            quiescence_nodes += parallel_stats.nodes
+            make_random_moves(game, 1, rng)
+    finally:
+        tree_builder.shutdown_workers()
+    assert quiescence_nodes > 0
+
+
+@pytest.mark.parametrize('use_bitboard', [False, True])
+def test_capture_ending_the_game_gets_the_win_score(use_bitboard):
+    game = Game(GameBoard.Players.PLAYER1)
+    game.start_game()
+    # Checker of the first player on c3 captures the last pawn of the second
+    # player on d4, the search ends there and the leaf is searched further
+    board = BitBoard(player1_pawns=1 << xy_to_square(2, 2) | 1 << xy_to_square(6, 0),
+                     player2_pawns=1 << xy_to_square(3, 3))
+    game.game_board.board_arrays = game.game_board.get_board_copy(board)
+    tree_builder = CheckersTreeBuilder(game, use_bitboard=use_bitboard, use_quiescence=True)
+
+    assert tree_builder.find_alphabeta_move(1) == ('c3e5', MAX_VAL)
+    assert tree_builder.find_pvs_move(1) == ('c3e5', MAX_VAL)
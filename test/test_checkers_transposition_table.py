@@ -0,0 +1,110 @@
+import random
+
+import pytest
+
+from decision_games_with_ai.games.checkers.game import Game
+from decision_games_with_ai.games.checkers.game_implementation.game_board import GameBoard
+from decision_games_with_ai.games.checkers.game_implementation.zobrist_hashing import \
+    ZobristHashing
+from decision_games_with_ai.games.checkers.tree_builder import CheckersTreeBuilder
+from decision_games_with_ai.games.utils.transposition_table import TranspositionTable
+from decision_games_with_ai.players.virtual_player.search_algorithms.minimax_search import \
+    MinimaxSearchAlgorithms
+
+
+def get_root_value(root_node):
+    search_algorithm = MinimaxSearchAlgorithms()
+    return max(search_algorithm._minimax_recursive_call(node, MinimaxSearchAlgorithms.Operator.MIN)
+               for node in root_node.children)
+
+
+@pytest.fixture
+def game():
+    game = Game(GameBoard.Players.PLAYER1)
+    game.start_game()
+    return game
+
+
+@pytest.mark.parametrize('use_symmetry', [False, True])
+@pytest.mark.parametrize('copy_format', ['list', 'bitboard'])
+def test_incremental_key_matches_computed_key(game, copy_format, use_symmetry):
+    rng = random.Random(4)
+    zobrist_hashing = ZobristHashing(use_symmetry=use_symmetry)
+    game_board = game.game_board
+    board = game_board.get_board_copy(copy_format=copy_format)
+    player = GameBoard.Players.PLAYER1
+    key = zobrist_hashing.get_board_key(board, player)
+    for move_num in range(80):
+        possible_moves = game_board.get_legal_moves(player, board)
+        if not possible_moves:
+            break
+        move = rng.choice(possible_moves)
+        move_squares = zobrist_hashing.get_move_squares(move)
+        squares_key = zobrist_hashing.get_squares_key(board, move_squares)
+        game_board.apply_move(player, move, board)
+        player = GameBoard.opposite_player[player]
+
+        key = zobrist_hashing.get_key_after_move(key, move_squares, squares_key, board)
+        assert key == zobrist_hashing.get_board_key(board, player)
+
+
+def test_depth_preferred_policy_keeps_deeper_entry():
+    table = TranspositionTable(size_mb=0)
+    table.store(1, 5, TranspositionTable.Bound.EXACT, 3, None)
+    table.store(2, 2, TranspositionTable.Bound.EXACT, 4, None)
+    assert table.probe(1).score == 3
+    assert table.probe(2) is None
+
+    table.new_search()
+    table.store(2, 2, TranspositionTable.Bound.EXACT, 4, None)
+    assert table.probe(2).score == 4
+
+
+def test_alphabeta_with_table_gives_the_same_values(game):
+    plain_builder = CheckersTreeBuilder(game, use_bitboard=True)
+    table_builder = CheckersTreeBuilder(game, use_bitboard=True, transposition_table_size_mb=1)
+    for builder_move in range(2):
+        plain_root = plain_builder.build_alphabeta_tree(5)
+        table_root = table_builder.build_alphabeta_tree(5)
+
+        assert get_root_value(plain_root) == get_root_value(table_root)
+        assert table_builder.searched_nodes < plain_builder.searched_nodes
+        game.make_move(plain_root.children[0].move)
+
+
+def test_mirrored_position_has_the_same_table_key(game):
+    rng = random.Random(8)
+    zobrist_hashing = ZobristHashing(use_symmetry=True)
+    for move_num in range(12):
+        game.make_move(rng.choice(game.game_board.get_legal_moves(
+            game.current_players_turn, game.game_board.board_arrays)).to_uci())
+    board = game.game_board.board_arrays
+    mirrored_signs = dict(zobrist_hashing.mirrored_signs)
+    mirrored_board = [[mirrored_signs.get(board[7 - y_ind][7 - x_ind], board[7 - y_ind][7 - x_ind])
+                       for x_ind in range(8)] for y_ind in range(8)]
+    mirrored_player = GameBoard.opposite_player[game.current_players_turn]
+
+    table_key, mirrored = zobrist_hashing.get_table_key(
+        zobrist_hashing.get_board_key(board, game.current_players_turn))
+    mirrored_table_key, mirrored_mirrored = zobrist_hashing.get_table_key(
+        zobrist_hashing.get_board_key(mirrored_board, mirrored_player))
+
+    assert table_key == mirrored_table_key
+    assert mirrored != mirrored_mirrored
+    assert sorted(move.get_mirrored() for move in game.game_board.get_legal_moves(
+        game.current_players_turn, board)) == sorted(game.game_board.get_legal_moves(
+            mirrored_player, mirrored_board))
+
+
+def test_alphabeta_with_symmetric_table_gives_the_same_scores(game):
+    rng = random.Random(2)
+    plain_builder = CheckersTreeBuilder(game, use_bitboard=True)
+    table_builder = CheckersTreeBuilder(game, use_bitboard=True, transposition_table_size_mb=1,
+                                        use_symmetries=True)
+    for move_num in range(10):
+        plain_move, plain_score = plain_builder.find_alphabeta_move(5)
+        table_move, table_score = table_builder.find_alphabeta_move(5)
+
+        assert plain_score == table_score
+        game.make_move(rng.choice(game.game_board.get_legal_moves(
+            game.current_players_turn, game.game_board.board_arrays)).to_uci())
@@ -0,0 +1,57 @@
+import threading
+import time
+
+import pytest
+
+from decision_games_with_ai.games.checkers.game import Game as CheckersGame
+from decision_games_with_ai.games.checkers.tree_builder import CheckersTreeBuilder
+from decision_games_with_ai.games.tic_tac_toe.game import Game as TicTacToeGame
+from decision_games_with_ai.games.tic_tac_toe.tree_builder import TicTacToeTreeBuilder
+from decision_games_with_ai.games.utils.monte_carlo import SimulationLimits
+
+
+@pytest.fixture(params=[(CheckersGame, CheckersTreeBuilder),
+                        (TicTacToeGame, TicTacToeTreeBuilder)])
+def tree_builder(request):
+    game_class, tree_builder_class = request.param
+    game = game_class()
+    game.start_game()
+    return tree_builder_class(game)
+
+
+def test_simulations_stop_at_the_time_limit(tree_builder):
+    start_time = time.monotonic()
+    move = tree_builder.build_monte_carlo_tree(time_limit_ms=100)
+
+    assert time.monotonic() - start_time < 1
+    assert tree_builder.mt_games > 0
+    assert move == tree_builder.get_monte_carlo_best_move().move
+
+
+def test_simulations_stop_at_the_number_of_simulations(tree_builder):
+    tree_builder.build_monte_carlo_tree(25)
+
+    assert tree_builder.mt_games == 25
+    assert sum(stats.plays for stats in tree_builder.get_monte_carlo_statistics()) == 25
+
+
+def test_best_move_can_be_taken_while_the_search_runs(tree_builder):
+    stop_event = threading.Event()
+    search_thread = threading.Thread(target=tree_builder.build_monte_carlo_tree,
+                                     kwargs={'stop_event': stop_event})
+    search_thread.start()
+    while tree_builder.mt_games < 10:
+        time.sleep(0.01)
+
+    best_move_stats = tree_builder.get_monte_carlo_best_move()
+    stop_event.set()
+    search_thread.join(timeout=5)
+
+    assert not search_thread.is_alive()
+    assert best_move_stats.move in [stats.move for stats in
+                                    tree_builder.get_monte_carlo_statistics()]
+
+
+def test_limits_are_required():
+    with pytest.raises(ValueError):
+        SimulationLimits()
@@ -0,0 +1,101 @@
+import random
+
+import pytest
+
+from decision_games_with_ai.games.checkers.game import Game
+from decision_games_with_ai.games.checkers.game_implementation.game_board import GameBoard
+from decision_games_with_ai.games.checkers.tree_builder import CheckersTreeBuilder
+from decision_games_with_ai.games.utils.monte_carlo import MonteCarloNode, \
+    MonteCarloNodesLimit
+
+
+def test_wins_are_counted_for_the_player_that_moved():
+    root_node = MonteCarloNode(None, GameBoard.Players.PLAYER2)
+    player1_node = root_node.add_child('c3d4', GameBoard.Players.PLAYER1)
+    player2_node = player1_node.add_child('f6e5', GameBoard.Players.PLAYER2)
+
+    player2_node.backpropagate(GameBoard.Players.PLAYER1)
+    player2_node.backpropagate(None)
+
+    assert [root_node.plays, player1_node.plays, player2_node.plays] == [2, 2, 2]
+    assert [root_node.wins, player1_node.wins, player2_node.wins] == [0, 1, 0]
+
+
+def test_subtree_of_the_played_moves_is_reused():
+    random.seed(0)
+    game = Game(GameBoard.Players.PLAYER1)
+    game.start_game()
+    tree_builder = CheckersTreeBuilder(game, use_bitboard=True)
+
+    move = tree_builder.build_monte_carlo_tree(200)
+    move_node = tree_builder.mt_root.find_descendant([move], lambda node_move: node_move.to_uci())
+    reply_node = max(move_node.children, key=lambda node: node.plays)
+    game.make_move(move)
+    game.make_move(reply_node.move.to_uci())
+    reply_plays = reply_node.plays
+
+    tree_builder.build_monte_carlo_tree(10)
+
+    assert tree_builder.mt_root is reply_node
+    assert reply_node.parent is None
+    # Simulations are skipped when the position has only one move
+    assert reply_node.plays == reply_plays + tree_builder.mt_games
+
+
+def test_new_game_starts_new_tree():
+    game = Game(GameBoard.Players.PLAYER1)
+    game.start_game()
+    tree_builder = CheckersTreeBuilder(game, use_bitboard=True)
+    game.make_move(tree_builder.build_monte_carlo_tree(20))
+    old_root = tree_builder.mt_root
+
+    game.start_game()
+    game.current_players_turn = GameBoard.Players.PLAYER2
+    tree_builder.build_monte_carlo_tree(20)
+
+    assert tree_builder.mt_root is not old_root
+    assert tree_builder.mt_root.plays == 20
+
+
+@pytest.mark.parametrize('eviction_policy', list(MonteCarloNodesLimit.EvictionPolicy))
+def test_tree_size_stays_under_the_limit(eviction_policy):
+    game = Game(GameBoard.Players.PLAYER1)
+    game.start_game()
+    tree_builder = CheckersTreeBuilder(game, use_bitboard=True, max_tree_nodes=60,
+                                       eviction_policy=eviction_policy)
+
+    tree_builder.build_monte_carlo_tree(300)
+    tree_stats = tree_builder.get_monte_carlo_tree_stats()
+
+    assert tree_stats.nodes == len(tree_builder.mt_root.get_subtree_nodes())
+    assert tree_stats.nodes <= 60
+    assert tree_builder.mt_root.plays == 300
+    if eviction_policy == MonteCarloNodesLimit.EvictionPolicy.STOP_EXPANSION:
+        assert tree_stats.evicted_nodes == 0
+    else:
+        assert tree_stats.evicted_nodes > 0
+        assert tree_stats.evictions > 0
+
+
+def test_least_recently_used_nodes_are_evicted_from_the_reused_tree():
+    random.seed(1)
+    game = Game(GameBoard.Players.PLAYER1)
+    game.start_game()
+    tree_builder = CheckersTreeBuilder(
+        game, use_bitboard=True, max_tree_nodes=100000,
+        eviction_policy=MonteCarloNodesLimit.EvictionPolicy.LEAST_RECENTLY_USED)
+    game.make_move(tree_builder.build_monte_carlo_tree(200))
+    game.make_move(tree_builder.build_monte_carlo_tree(200))
+    tree_builder.build_monte_carlo_tree(200)
+    root_node = tree_builder.mt_root
+    old_nodes = root_node.get_subtree_nodes()
+    last_old_visit = max(node.last_visit for node in old_nodes)
+    tree_builder.mt_nodes_limit.max_nodes = len(old_nodes) + 5
+
+    tree_builder.build_monte_carlo_tree(30)
+    evicted_nodes = [node for node in old_nodes if node.parent is None and node is not root_node]
+
+    assert tree_builder.mt_root is root_node
+    assert evicted_nodes
+    assert all(node.last_visit <= last_old_visit for node in evicted_nodes)
+    assert max(node.last_visit for node in root_node.get_subtree_nodes()) > last_old_visit
@@ -0,0 +1,41 @@
+import random
+
+from decision_games_with_ai.games.checkers.game import Game
+from decision_games_with_ai.games.checkers.game_implementation.checkers_move import \
+    CheckersMove
+from decision_games_with_ai.games.checkers.tree_builder import CheckersTreeBuilder
+from decision_games_with_ai.games.utils.move_ordering import MoveOrderer
+
+
+def test_captures_go_first_then_killers_then_history():
+    quiet_move = CheckersMove(8, 12, 0)
+    killer_move = CheckersMove(9, 13, 0)
+    history_move = CheckersMove(10, 14, 0)
+    single_capture = CheckersMove(11, 18, 1 << 15)
+    double_capture = CheckersMove(11, 25, 1 << 15 | 1 << 22)
+    move_orderer = MoveOrderer(CheckersMove.get_captures_num)
+    move_orderer.record_cutoff(history_move, ply=5, depth=3, move_num=1)
+    move_orderer.record_cutoff(killer_move, ply=2, depth=1, move_num=0)
+    move_orderer.record_cutoff(single_capture, ply=2, depth=1, move_num=0)
+
+    moves = [quiet_move, history_move, single_capture, killer_move, double_capture]
+    move_orderer.order_moves(moves, ply=2)
+
+    assert moves == [double_capture, single_capture, killer_move, history_move, quiet_move]
+    assert move_orderer.get_stats() == (3, 2, 2 / 3)
+
+
+def test_ordering_keeps_the_search_scores():
+    rng = random.Random(5)
+    game = Game()
+    game.start_game()
+    tree_builder = CheckersTreeBuilder(game, use_bitboard=True)
+    ordering_tree_builder = CheckersTreeBuilder(
+        game, use_bitboard=True, move_orderer=MoveOrderer(CheckersMove.get_captures_num))
+    for move_num in range(10):
+        assert ordering_tree_builder.find_alphabeta_move(5)[1] == \
+            tree_builder.find_alphabeta_move(5)[1]
+        assert ordering_tree_builder.get_move_ordering_stats().cutoffs > 0
+        legal_moves = game.game_board.get_legal_moves(game.current_players_turn,
+                                                      tree_builder._get_board_copy())
+        game.make_move(rng.choice(legal_moves).to_uci())
@@ -0,0 +1,33 @@
+import pytest
+
+from decision_games_with_ai.games.tic_tac_toe.game import Game
+from decision_games_with_ai.games.tic_tac_toe.tree_builder import TicTacToeTreeBuilder
+from decision_games_with_ai.games.utils.global_enums import SearchMethods
+from decision_games_with_ai.players.virtual_player.search_algorithms.montecarlo_search import \
+    MonteCarloSearchAlghoritm
+from decision_games_with_ai.players.virtual_player.virtual_enemy import VirtualEnemy
+from decision_games_with_ai.user_interfaces.tpai.tic_tac_toe_console_arena_interface import \
+    TicTacToeConsoleArenaInterface
+
+
+def play_arena(workers):
+    game = Game()
+    players = [VirtualEnemy(name="Virtual player {}".format(player_num),
+                            tree_builder=TicTacToeTreeBuilder(game),
+                            search_algorithm=MonteCarloSearchAlghoritm(),
+                            search_method_enum=SearchMethods.MONTECARLO,
+                            num_of_sim=20)
+               for player_num in (1, 2)]
+    arena = TicTacToeConsoleArenaInterface(game, 8, print_val_interval=100, workers=workers,
+                                           seed=3)
+    arena.play(*players)
+    return arena.games_played, arena.player1_wins, arena.player2_wins
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_parallel_results_do_not_depend_on_workers_number(workers):
+    games_played, player1_wins, player2_wins = play_arena(workers)
+
+    assert games_played == 8
+    assert player1_wins + player2_wins <= 8
+    assert (games_played, player1_wins, player2_wins) == play_arena(3)
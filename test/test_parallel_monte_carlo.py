@@ -0,0 +1,40 @@
+import pickle
+
+import pytest
+
+from decision_games_with_ai.games.checkers.game import Game
+from decision_games_with_ai.games.checkers.game_implementation.game_board import GameBoard
+from decision_games_with_ai.games.checkers.tree_builder import CheckersTreeBuilder
+from decision_games_with_ai.games.utils.global_enums import MonteCarloParallelization
+
+
+@pytest.fixture
+def tree_builder():
+    game = Game(GameBoard.Players.PLAYER1)
+    game.start_game()
+    tree_builder = CheckersTreeBuilder(game, use_bitboard=True)
+    yield tree_builder
+    tree_builder.shutdown_workers()
+
+
+@pytest.mark.parametrize('parallelization', list(MonteCarloParallelization))
+def test_parallel_search_runs_all_simulations(tree_builder, parallelization):
+    move = tree_builder.build_monte_carlo_tree(40, parallelization=parallelization, workers=2)
+
+    game = tree_builder.game
+    legal_moves = game.game_board.get_legal_moves(game.current_players_turn,
+                                                  tree_builder._get_board_copy())
+    assert move in [legal_move.to_uci() for legal_move in legal_moves]
+    assert tree_builder.mt_games == 40
+    assert sum(stats.plays for stats in tree_builder.get_monte_carlo_statistics()) == 40
+
+
+def test_pickled_builder_leaves_workers_and_tree_behind(tree_builder):
+    tree_builder.build_monte_carlo_tree(4, parallelization=MonteCarloParallelization.LEAF,
+                                        workers=2)
+
+    builder_copy = pickle.loads(pickle.dumps(tree_builder))
+
+    assert tree_builder.mt_executor is not None
+    assert builder_copy.mt_executor is None
+    assert builder_copy.mt_root is None
@@ -0,0 +1,140 @@
+import random
+import time
+
+import pytest
+
+from decision_games_with_ai.games.checkers.game import Game as CheckersGame
+from decision_games_with_ai.games.checkers.game_implementation.incremental_evaluation import \
+    IncrementalEvaluation
+from decision_games_with_ai.games.checkers.tree_builder import CheckersTreeBuilder
+from decision_games_with_ai.games.tic_tac_toe.game import Game as TicTacToeGame
+from decision_games_with_ai.games.tic_tac_toe.tree_builder import TicTacToeTreeBuilder
+from decision_games_with_ai.games.utils.global_enums import GameStates
+from decision_games_with_ai.players.virtual_player.search_algorithms.minimax_search import \
+    MinimaxSearchAlgorithms
+
+
+def get_checkers_moves(game):
+    return game.game_board.get_possible_moves(game.current_players_turn,
+                                              game.game_board.board_arrays)
+
+
+def get_tic_tac_toe_moves(game):
+    return game.game_board.get_possible_moves(game.game_board.get_board_copy())
+
+
+@pytest.mark.parametrize('game_class, tree_builder_class, get_moves', [
+    (CheckersGame, CheckersTreeBuilder, get_checkers_moves),
+    (TicTacToeGame, TicTacToeTreeBuilder, get_tic_tac_toe_moves)
+])
+def test_search_gives_the_same_moves_as_the_tree(game_class, tree_builder_class, get_moves):
+    rng = random.Random(6)
+    search_algorithm = MinimaxSearchAlgorithms()
+    game = game_class()
+    game.start_game()
+    tree_builder = tree_builder_class(game)
+    for move_num in range(8):
+        if game.get_game_state() != GameStates.ONGOING:
+            break
+        alphabeta_move, alphabeta_score = tree_builder.find_alphabeta_move(4)
+        minimax_move, minimax_score = tree_builder.find_minimax_move(3)
+
+        assert alphabeta_move == search_algorithm.search_tree(
+            tree_builder.build_alphabeta_tree(4))
+        assert minimax_move == search_algorithm.search_tree(
+            tree_builder.build_minimax_tree(3))
+        game.make_move(rng.choice(get_moves(game)))
+
+
+@pytest.mark.parametrize('game_class, tree_builder_class', [
+    (CheckersGame, CheckersTreeBuilder),
+    (TicTacToeGame, TicTacToeTreeBuilder)
+])
+def test_iterative_deepening_gives_the_score_of_the_last_depth(game_class,
+                                                                tree_builder_class):
+    game = game_class()
+    game.start_game()
+    tree_builder = tree_builder_class(game)
+
+    move, score = tree_builder.find_iterative_deepening_move(60000, max_depth=4)
+
+    assert tree_builder.searched_depth == 4
+    assert score == tree_builder.find_alphabeta_move(4)[1]
+
+
+def test_iterative_deepening_stops_at_the_time_limit():
+    game = CheckersGame()
+    game.start_game()
+    tree_builder = CheckersTreeBuilder(game, use_bitboard=True)
+
+    start_time = time.monotonic()
+    move, score = tree_builder.find_iterative_deepening_move(50)
+
+    assert time.monotonic() - start_time < 0.5
+    assert move in get_checkers_moves(game)
+    assert tree_builder.searched_depth >= 1
+
+
+def test_parallel_alphabeta_gives_the_same_moves_as_the_sequential_one():
+    rng = random.Random(3)
+    game = CheckersGame()
+    game.start_game()
+    tree_builder = CheckersTreeBuilder(game, use_bitboard=True)
+    try:
+        for move_num in range(10):
+            assert tree_builder.find_parallel_alphabeta_move(5, workers=2) == \
+                tree_builder.find_alphabeta_move(5)
+            game.make_move(rng.choice(get_checkers_moves(game)))
+    finally:
+        tree_builder.shutdown_workers()
+
+
+def test_parallel_alphabeta_works_with_fractional_scores():
+    rng = random.Random(4)
+    game = CheckersGame()
+    game.start_game()
+    # Quarters are added without rounding, so the evaluation of the board
+    # does not depend on the order of the updates
+    tree_builder = CheckersTreeBuilder(game, use_bitboard=True, incremental_evaluation=(
+        IncrementalEvaluation(positional_weights=[square * 0.25 for square in range(32)])))
+    try:
+        for move_num in range(6):
+            move, score = tree_builder.find_parallel_alphabeta_move(4, workers=2)
+
+            assert (move, score) == tree_builder.find_alphabeta_move(4)
+            assert isinstance(score, float)
+            game.make_move(rng.choice(get_checkers_moves(game)))
+    finally:
+        tree_builder.shutdown_workers()
+
+
+@pytest.mark.parametrize('game_class, tree_builder_class, get_moves', [
+    (CheckersGame, CheckersTreeBuilder, get_checkers_moves),
+    (TicTacToeGame, TicTacToeTreeBuilder, get_tic_tac_toe_moves)
+])
+def test_pvs_gives_the_same_moves_as_alphabeta(game_class, tree_builder_class, get_moves):
+    rng = random.Random(4)
+    game = game_class()
+    game.start_game()
+    tree_builder = tree_builder_class(game)
+    for move_num in range(8):
+        if game.get_game_state() != GameStates.ONGOING:
+            break
+        assert tree_builder.find_pvs_move(4) == tree_builder.find_alphabeta_move(4)
+        game.make_move(rng.choice(get_moves(game)))
+
+
+@pytest.mark.parametrize('game_class, tree_builder_class', [
+    (CheckersGame, CheckersTreeBuilder),
+    (TicTacToeGame, TicTacToeTreeBuilder)
+])
+def test_aspiration_windows_give_the_score_of_the_last_depth(game_class, tree_builder_class):
+    game = game_class()
+    game.start_game()
+    tree_builder = tree_builder_class(game)
+
+    move, score = tree_builder.find_pvs_iterative_deepening_move(60000, max_depth=4,
+                                                                 aspiration_delta=1)
+
+    assert tree_builder.searched_depth == 4
+    assert (move, score) == tree_builder.find_pvs_move(4)
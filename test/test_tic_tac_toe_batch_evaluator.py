@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from decision_games_with_ai.games.tic_tac_toe.game import Game
+from decision_games_with_ai.games.tic_tac_toe.game_implementation.game_board import GameBoard
+from decision_games_with_ai.games.tic_tac_toe.tree_builder import TicTacToeTreeBuilder
+
+np = pytest.importorskip('numpy')
+from decision_games_with_ai.games.tic_tac_toe.game_implementation.batch_evaluator import \
+    BatchEvaluator  # noqa: E402
+
+
+@pytest.mark.parametrize('board_size', [3, 9])
+@pytest.mark.parametrize('player', [GameBoard.BoardSigns.PLAYER1, GameBoard.BoardSigns.PLAYER2])
+def test_batch_values_are_the_same_as_the_static_evaluation(board_size, player):
+    rng = random.Random(board_size)
+    game = Game(GameBoard.BoardSigns.PLAYER1, board_size=board_size, winning_combination=3)
+    game.start_game()
+    tree_builder = TicTacToeTreeBuilder(game)
+    boards = []
+    for move_num in range(board_size * 2):
+        game.game_board.make_move(
+            rng.choice(list(GameBoard.BoardSigns)[:2]),
+            rng.choice(game.game_board.get_possible_moves(game.game_board.board_arrays)))
+        boards.append(game.game_board.get_board_copy())
+    bitboards = [game.game_board.get_board_copy(board, copy_format='bitboard')
+                 for board in boards]
+    batch_evaluator = BatchEvaluator()
+    expected_values = [tree_builder._static_evaluation_value(board, player) for board in boards]
+
+    assert batch_evaluator.evaluate(batch_evaluator.encode_boards(boards),
+                                    player).tolist() == expected_values
+    assert batch_evaluator.evaluate(batch_evaluator.encode_boards(bitboards),
+                                    player).tolist() == expected_values
+
+
+@pytest.mark.parametrize('use_bitboard', [False, True])
+def test_batched_leaves_give_the_same_search_results(use_bitboard):
+    rng = random.Random(4)
+    game = Game(board_size=5, winning_combination=4)
+    game.start_game()
+    tree_builder = TicTacToeTreeBuilder(game, use_bitboard=use_bitboard)
+    batch_tree_builder = TicTacToeTreeBuilder(game, use_bitboard=use_bitboard,
+                                              batch_evaluator=BatchEvaluator())
+    for move_num in range(6):
+        assert batch_tree_builder.find_alphabeta_move(2) == tree_builder.find_alphabeta_move(2)
+        assert batch_tree_builder.find_pvs_move(3) == tree_builder.find_pvs_move(3)
+        game.make_move(rng.choice(game.game_board.get_possible_moves(
+            game.game_board.board_arrays)))
@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from decision_games_with_ai.games.tic_tac_toe.game import Game
+from decision_games_with_ai.games.tic_tac_toe.game_implementation.game_board import GameBoard
+from decision_games_with_ai.games.tic_tac_toe.tree_builder import TicTacToeTreeBuilder
+from decision_games_with_ai.games.utils.events_exceptions import InvalidMoveException
+from decision_games_with_ai.games.utils.global_enums import GameStates
+
+
+@pytest.mark.parametrize('board_size, winning_combination', [(3, 3), (6, 4)])
+def test_bitboard_gives_the_same_results_as_the_lists(board_size, winning_combination):
+    rng = random.Random(board_size)
+    for game_num in range(10):
+        game = Game(board_size=board_size, winning_combination=winning_combination)
+        game.start_game()
+        game_board = game.game_board
+        list_builder = TicTacToeTreeBuilder(game)
+        bitboard_builder = TicTacToeTreeBuilder(game, use_bitboard=True)
+        while game.get_game_state() == GameStates.ONGOING:
+            bitboard = game_board.get_board_copy(copy_format='bitboard')
+
+            assert game_board.get_board_copy(bitboard) == game_board.board_arrays
+            assert game_board.get_possible_moves(bitboard) == \
+                game_board.get_possible_moves(game_board.board_arrays)
+            assert game_board.check_game_state(bitboard) == game_board.check_game_state()
+            for player in (GameBoard.BoardSigns.PLAYER1, GameBoard.BoardSigns.PLAYER2):
+                assert bitboard_builder._static_evaluation_value(bitboard, player) == \
+                    list_builder._static_evaluation_value(game_board.board_arrays, player)
+
+            game.make_move(rng.choice(game_board.get_possible_moves(game_board.board_arrays)))
+
+
+def test_bitboard_win_is_found_with_the_last_move():
+    game_board = GameBoard(board_size=15, winning_combination=5)
+    bitboard = game_board.get_board_copy(copy_format='bitboard')
+    for move in ('c3', 'd4', 'e5', 'f6'):
+        game_board.make_move(GameBoard.BoardSigns.PLAYER2, move, bitboard)
+        assert game_board.check_game_state(bitboard, move) == GameStates.ONGOING
+
+    game_board.make_move(GameBoard.BoardSigns.PLAYER2, 'g7', bitboard)
+
+    assert game_board.check_game_state(bitboard, 'g7') == GameStates.PLAYER2WIN
+    assert game_board.check_game_state(bitboard) == GameStates.PLAYER2WIN
+    with pytest.raises(InvalidMoveException):
+        game_board.make_move(GameBoard.BoardSigns.PLAYER1, 'g7', bitboard)
+
+
+def test_bitboard_make_move_returns_new_board_and_apply_move_changes_it():
+    game_board = GameBoard(board_size=5, winning_combination=4)
+    bitboard = game_board.get_board_copy(copy_format='bitboard')
+    player_index = game_board.players_indexes[GameBoard.BoardSigns.PLAYER1]
+
+    new_bitboard = bitboard.make_move(player_index, 'c3')
+
+    assert new_bitboard is not bitboard
+    assert game_board.get_board_copy(bitboard) == game_board.board_arrays
+    assert bitboard.apply_move(player_index, 'c3') is None
+    assert bitboard == new_bitboard
+    assert bitboard.candidates == new_bitboard.candidates
+
+
+def test_searches_give_the_same_moves_with_bitboard():
+    rng = random.Random(1)
+    game = Game()
+    game.start_game()
+    list_builder = TicTacToeTreeBuilder(game)
+    bitboard_builder = TicTacToeTreeBuilder(game, use_bitboard=True)
+    while game.get_game_state() == GameStates.ONGOING:
+        assert bitboard_builder.find_alphabeta_move(4) == list_builder.find_alphabeta_move(4)
+        assert bitboard_builder.find_pvs_move(4) == list_builder.find_pvs_move(4)
+        assert bitboard_builder.find_minimax_move(3) == list_builder.find_minimax_move(3)
+        game.make_move(rng.choice(game.game_board.get_possible_moves(
+            game.game_board.board_arrays)))
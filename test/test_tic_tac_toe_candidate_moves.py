@@ -0,0 +1,55 @@
+import random
+
+from decision_games_with_ai.games.tic_tac_toe.game import Game
+from decision_games_with_ai.games.tic_tac_toe.game_implementation.game_board import GameBoard
+from decision_games_with_ai.games.tic_tac_toe.tree_builder import TicTacToeTreeBuilder
+from decision_games_with_ai.games.utils.coords_formatters import CoordsFormatter
+from decision_games_with_ai.games.utils.global_enums import GameStates
+
+
+def get_distance_to_signs(board, move):
+    x_ind, y_ind = CoordsFormatter.translate_from_uci_to_xy(move)
+    return min(max(abs(x_ind - sign_x), abs(y_ind - sign_y))
+               for sign_y, row in enumerate(board) for sign_x, sign in enumerate(row)
+               if sign != GameBoard.BoardSigns.EMPTY.value)
+
+
+def test_candidates_are_updated_with_the_moves():
+    rng = random.Random(6)
+    game_board = GameBoard(board_size=9, winning_combination=5)
+    bitboard = game_board.get_board_copy(copy_format='bitboard', candidates_distance=2)
+
+    assert game_board.get_possible_moves(bitboard) == ['e5']
+    for move_num in range(40):
+        move = rng.choice(game_board.get_possible_moves(bitboard))
+        player = (GameBoard.BoardSigns.PLAYER1, GameBoard.BoardSigns.PLAYER2)[move_num % 2]
+        game_board.make_move(player, move, bitboard)
+        game_board.make_move(player, move)
+
+        candidates = game_board.get_possible_moves(bitboard)
+        assert candidates == game_board.get_possible_moves(game_board.get_board_copy(
+            copy_format='bitboard', candidates_distance=2))
+        assert all(get_distance_to_signs(game_board.board_arrays, move) <= 2
+                   for move in candidates)
+        assert set(candidates) == {
+            move for move in game_board.get_possible_moves(game_board.board_arrays)
+            if get_distance_to_signs(game_board.board_arrays, move) <= 2}
+
+
+def test_search_and_simulations_use_only_candidates():
+    game = Game(GameBoard.BoardSigns.PLAYER1, board_size=15, winning_combination=5)
+    game.start_game()
+    for move in ('h8', 'h9', 'i9'):
+        game.make_move(move)
+    full_builder = TicTacToeTreeBuilder(game, use_bitboard=True)
+    candidates_builder = TicTacToeTreeBuilder(game, candidate_moves_distance=2)
+
+    move, score = candidates_builder.find_alphabeta_move(2)
+    candidates_builder.build_monte_carlo_tree(num_of_sim=100)
+
+    assert get_distance_to_signs(game.game_board.board_arrays, move) <= 2
+    assert (move, score) == full_builder.find_alphabeta_move(2)
+    assert all(get_distance_to_signs(game.game_board.board_arrays, stats.move) <= 2
+               for stats in candidates_builder.get_monte_carlo_statistics())
+    while game.get_game_state() == GameStates.ONGOING and len(game.moves_list) < 12:
+        game.make_move(candidates_builder.find_pvs_move(2)[0])
@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+from decision_games_with_ai.games.tic_tac_toe.game import Game
+from decision_games_with_ai.games.tic_tac_toe.game_implementation.game_board import GameBoard, \
+    ListBoard
+from decision_games_with_ai.games.tic_tac_toe.tree_builder import TicTacToeTreeBuilder
+from decision_games_with_ai.games.utils.coords_formatters import CoordsFormatter
+from decision_games_with_ai.games.utils.global_enums import GameStates
+
+
+def place_signs(game_board, fields, sign=GameBoard.BoardSigns.PLAYER1):
+    for x_ind, y_ind in fields:
+        game_board.make_move(sign, CoordsFormatter.translate_from_xy_to_uci(x_ind, y_ind))
+
+
+@pytest.mark.parametrize('direction', GameBoard.lines_directions)
+def test_five_in_a_row_wins_on_the_big_board(direction):
+    game_board = GameBoard(board_size=15, winning_combination=5)
+    x_dir, y_dir = direction
+    fields = [(5 + i * x_dir, 7 + i * y_dir) for i in range(5)]
+
+    place_signs(game_board, fields[:4])
+    assert game_board.check_game_state() == GameStates.ONGOING
+
+    place_signs(game_board, fields[4:])
+    assert game_board.check_game_state() == GameStates.PLAYER1WIN
+    for field in fields:
+        last_move = CoordsFormatter.translate_from_xy_to_uci(*field)
+        assert game_board.check_game_state(last_move=last_move) == GameStates.PLAYER1WIN
+
+
+def test_diagonals_shorter_than_the_board_are_found():
+    game_board = GameBoard(board_size=5, winning_combination=3)
+    place_signs(game_board, [(2, 4), (3, 3), (4, 2)], GameBoard.BoardSigns.PLAYER2)
+
+    assert game_board.check_game_state() == GameStates.PLAYER2WIN
+
+
+def test_winning_combination_has_to_fit_on_the_board():
+    with pytest.raises(ValueError):
+        GameBoard(board_size=3, winning_combination=4)
+
+
+def test_last_move_check_agrees_with_the_full_scan():
+    rng = random.Random(3)
+    for _ in range(50):
+        game = Game(GameBoard.BoardSigns.PLAYER1, board_size=7, winning_combination=4)
+        game.start_game()
+        while True:
+            game.make_move(rng.choice(game.game_board.get_possible_moves(
+                game.game_board.board_arrays)))
+            game_state = game.get_game_state()
+            assert game_state == game.game_board.check_game_state()
+            if game_state != GameStates.ONGOING:
+                break
+
+
+def test_board_counts_empty_fields_down_to_the_draw():
+    game_board = GameBoard()
+    board = game_board.get_board_copy()
+    moves = ['a1', 'b1', 'c1', 'b2', 'a2', 'c2', 'b3', 'a3', 'c3']
+    for moves_count, move in enumerate(moves, start=1):
+        sign = GameBoard.BoardSigns.PLAYER1 if moves_count % 2 else GameBoard.BoardSigns.PLAYER2
+        game_board.make_move(sign, move, board)
+        board_copy = game_board.get_board_copy(board)
+        assert isinstance(board_copy, ListBoard)
+        assert board.empty_fields == board_copy.empty_fields == 9 - moves_count
+        if moves_count < len(moves):
+            assert game_board.check_game_state(board, move) == GameStates.ONGOING
+
+    assert game_board.check_game_state(board, moves[-1]) == GameStates.DRAW
+    assert game_board.check_game_state([list(row) for row in board]) == GameStates.DRAW
+    assert game_board.get_board_copy(board, 'tuple') == tuple(tuple(row) for row in board)
+
+
+def test_search_finds_the_win_on_the_big_board():
+    game = Game(GameBoard.BoardSigns.PLAYER1, board_size=9, winning_combination=4)
+    game.start_game()
+    place_signs(game.game_board, [(3, 3), (4, 4), (5, 5)])
+    place_signs(game.game_board, [(0, 0), (0, 8), (8, 0)], GameBoard.BoardSigns.PLAYER2)
+    tree_builder = TicTacToeTreeBuilder(game)
+
+    move, score = tree_builder.find_alphabeta_move(2)
+
+    assert move in ('c3', 'g7')
+    assert score == tree_builder.find_pvs_move(2)[1]
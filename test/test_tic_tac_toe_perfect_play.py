@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from decision_games_with_ai.games.tic_tac_toe.game import Game
+from decision_games_with_ai.games.tic_tac_toe.game_implementation.game_board import GameBoard
+from decision_games_with_ai.games.tic_tac_toe.game_implementation.perfect_play_table import \
+    PerfectPlayTable
+from decision_games_with_ai.games.tic_tac_toe.tree_builder import TicTacToeTreeBuilder
+from decision_games_with_ai.games.utils.global_enums import GameStates, SearchMethods
+from decision_games_with_ai.players.virtual_player.search_algorithms.minimax_search import \
+    MinimaxSearchAlgorithms
+from decision_games_with_ai.players.virtual_player.virtual_enemy import VirtualEnemy
+
+
+@pytest.fixture(scope='module')
+def perfect_play_table():
+    table = PerfectPlayTable()
+    table.build()
+    return table
+
+
+def test_table_agrees_with_the_full_alpha_beta_search(perfect_play_table):
+    rng = random.Random(5)
+    for _ in range(10):
+        game = Game()
+        game.start_game()
+        tree_builder = TicTacToeTreeBuilder(game, perfect_play_table=perfect_play_table)
+        while game.get_game_state() == GameStates.ONGOING:
+            possible_moves = game.game_board.get_possible_moves(game.game_board.board_arrays)
+            move, score = tree_builder.find_perfect_play_move()
+            alphabeta_move, alphabeta_score = tree_builder.find_alphabeta_move(
+                len(possible_moves) + 1)
+
+            assert score == alphabeta_score
+            game.make_move(rng.choice(possible_moves))
+
+
+def test_perfect_players_draw(perfect_play_table):
+    game = Game(GameBoard.BoardSigns.PLAYER1)
+    game.start_game()
+    players = [VirtualEnemy("Perfect player", TicTacToeTreeBuilder(
+        game, perfect_play_table=perfect_play_table), MinimaxSearchAlgorithms(),
+        SearchMethods.PERFECT_PLAY) for _ in range(2)]
+
+    move_num = 0
+    while game.get_game_state() == GameStates.ONGOING:
+        game.make_move(players[move_num % 2].get_player_move())
+        move_num += 1
+
+    assert game.get_game_state() == GameStates.DRAW
+
+
+def test_table_is_saved_and_loaded(perfect_play_table, tmp_path):
+    table_path = str(tmp_path / 'tic_tac_toe_table.pickle')
+    PerfectPlayTable(table_path).get_entries()
+
+    loaded_table = PerfectPlayTable(table_path)
+    board = [['x', '-', '-'], ['-', 'o', '-'], ['-', '-', '-']]
+
+    assert loaded_table.get_entries() == perfect_play_table.get_entries()
+    assert loaded_table.get_best_moves(board, GameBoard.BoardSigns.PLAYER1) == \
+        perfect_play_table.get_best_moves(board, GameBoard.BoardSigns.PLAYER1)
+
+
+def test_best_moves_are_mapped_back_from_the_symmetry(perfect_play_table):
+    # x has two signs in the column, the only good move of o blocks it
+    board = [['-', '-', 'x'], ['o', '-', 'x'], ['-', '-', '-']]
+
+    assert perfect_play_table.get_best_moves(board, GameBoard.BoardSigns.PLAYER2) == ['c3']
+    with pytest.raises(ValueError):
+        perfect_play_table.get_best_moves(board, GameBoard.BoardSigns.PLAYER1)
@@ -0,0 +1,63 @@
+import random
+
+from decision_games_with_ai.games.tic_tac_toe.game import Game
+from decision_games_with_ai.games.tic_tac_toe.game_implementation.board_symmetries import \
+    BoardSymmetries
+from decision_games_with_ai.games.tic_tac_toe.game_implementation.game_board import GameBoard
+from decision_games_with_ai.games.tic_tac_toe.tree_builder import TicTacToeTreeBuilder
+from decision_games_with_ai.games.utils.global_enums import GameStates
+
+
+def test_symmetric_moves_are_removed():
+    board_symmetries = BoardSymmetries(3)
+    game_board = GameBoard()
+    empty_moves = game_board.get_possible_moves(game_board.board_arrays)
+    game_board.make_move(GameBoard.BoardSigns.PLAYER1, 'b2')
+    center_moves = game_board.get_possible_moves(game_board.board_arrays)
+    game_board.make_move(GameBoard.BoardSigns.PLAYER2, 'a2')
+
+    assert board_symmetries.get_unique_moves(GameBoard().board_arrays, empty_moves) == \
+        ['a1', 'b1', 'b2']
+    assert len(board_symmetries.get_unique_moves(
+        [['-', '-', '-'], ['-', 'x', '-'], ['-', '-', '-']], center_moves)) == 2
+    assert len(board_symmetries.get_unique_moves(
+        game_board.board_arrays, game_board.get_possible_moves(game_board.board_arrays))) == 4
+
+
+def test_canonical_key_is_the_same_for_symmetric_positions():
+    board_symmetries = BoardSymmetries(4)
+    board = [['x', '-', '-', '-'], ['-', 'o', '-', '-'],
+             ['-', '-', '-', 'x'], ['-', '-', '-', '-']]
+    rotated_board = [list(row) for row in zip(*reversed(board))]
+    fields = board_symmetries.get_fields(board)
+    rotated_fields = board_symmetries.get_fields(rotated_board)
+    key, symmetry = board_symmetries.get_canonical_key(fields, GameBoard.BoardSigns.PLAYER1)
+
+    assert key == board_symmetries.get_canonical_key(rotated_fields,
+                                                     GameBoard.BoardSigns.PLAYER1)[0]
+    assert key != board_symmetries.get_canonical_key(fields, GameBoard.BoardSigns.PLAYER2)[0]
+
+
+def test_searches_with_symmetries_give_the_same_moves():
+    rng = random.Random(7)
+    game = Game()
+    game.start_game()
+    plain_builder = TicTacToeTreeBuilder(game)
+    symmetric_builder = TicTacToeTreeBuilder(game, use_symmetries=True)
+    while game.get_game_state() == GameStates.ONGOING:
+        assert symmetric_builder.find_alphabeta_move(4) == plain_builder.find_alphabeta_move(4)
+        assert symmetric_builder.find_pvs_move(4) == plain_builder.find_pvs_move(4)
+        assert symmetric_builder.find_minimax_move(3) == plain_builder.find_minimax_move(3)
+        game.make_move(rng.choice(game.game_board.get_possible_moves(
+            game.game_board.board_arrays)))
+
+
+def test_monte_carlo_root_has_only_unique_moves():
+    game = Game(GameBoard.BoardSigns.PLAYER1)
+    game.start_game()
+    tree_builder = TicTacToeTreeBuilder(game, use_symmetries=True)
+
+    tree_builder.build_monte_carlo_tree(num_of_sim=50)
+
+    assert sorted(stats.move for stats in tree_builder.get_monte_carlo_statistics()) == \
+        ['a1', 'b1', 'b2']